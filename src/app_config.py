@@ -6,9 +6,10 @@ import tempfile
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Any
 
+import httpx
 import yaml
 from dotenv import load_dotenv
-from openai import AsyncOpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 
 from src.logging_config import setup_logger
 
@@ -32,6 +33,9 @@ class AppConfig:
     process_all_files: bool
     holistic_review_chunk_size: int
     max_concurrent_api_calls: int
+    translation_batch_size: int
+    use_batch_api: bool
+    batch_api_min_keys: int
 
     # Language configuration
     language_codes: Dict[str, str]
@@ -45,6 +49,7 @@ class AppConfig:
     translation_queue_folder: str
     translated_queue_folder: str
     translation_key_ledger_file_path: str
+    response_cache_file_path: Optional[str]
     preserve_queues_for_debug: bool
 
     # OpenAI client
@@ -58,15 +63,22 @@ def _compute_project_root() -> str:
     return os.path.abspath(os.path.join(script_dir, os.pardir))
 
 
-def _load_dotenv_files(project_root: str) -> None:
-    """Load .env files from project root or docker directory."""
-    dotenv_path_project_root = os.path.join(project_root, '.env')
-    dotenv_path_docker_dir = os.path.join(project_root, 'docker', '.env')
+def _dotenv_candidates(project_root: str) -> tuple[str, str]:
+    """Return the .env locations in the order they are tried."""
+    return os.path.join(project_root, '.env'), os.path.join(project_root, 'docker', '.env')
 
-    if os.path.exists(dotenv_path_project_root):
-        load_dotenv(dotenv_path_project_root)
-    elif os.path.exists(dotenv_path_docker_dir):
-        load_dotenv(dotenv_path_docker_dir)
+
+def _load_dotenv_files(project_root: str) -> Optional[str]:
+    """Load the first .env file found in the project root or docker directory.
+
+    Returns:
+        The path of the loaded file, or None if there was none.
+    """
+    for dotenv_path in _dotenv_candidates(project_root):
+        if os.path.exists(dotenv_path):
+            load_dotenv(dotenv_path)
+            return dotenv_path
+    return None
 
 
 def _load_yaml_config(project_root: str) -> Dict[str, Any]:
@@ -128,16 +140,12 @@ def _setup_logger_from_config(config: Dict[str, Any]) -> logging.Logger:
     return setup_logger(log_level_str, log_file_path, log_to_console)
 
 
-def _log_dotenv_status(logger: logging.Logger, project_root: str) -> None:
-    """Log the status of .env file loading."""
-    dotenv_path_project_root = os.path.join(project_root, '.env')
-    dotenv_path_docker_dir = os.path.join(project_root, 'docker', '.env')
-
-    if os.path.exists(dotenv_path_project_root):
-        logger.info("Loaded environment variables from: %s", dotenv_path_project_root)
-    elif os.path.exists(dotenv_path_docker_dir):
-        logger.info("Loaded environment variables from: %s", dotenv_path_docker_dir)
+def _log_dotenv_status(logger: logging.Logger, project_root: str, dotenv_path: Optional[str]) -> None:
+    """Log the status of .env file loading, as reported by _load_dotenv_files."""
+    if dotenv_path is not None:
+        logger.info("Loaded environment variables from: %s", dotenv_path)
     else:
+        dotenv_path_project_root, dotenv_path_docker_dir = _dotenv_candidates(project_root)
         logger.info(
             "No .env file found in project root ('%s') or in docker/ ('%s'). Relying on system environment variables if any.",
             dotenv_path_project_root,
@@ -167,7 +175,7 @@ def _precompute_style_rules(style_rules: Dict[str, List[str]], language_codes: D
     for code, rules in style_rules.items():
         if rules:
             language_name = language_codes.get(code, code)
-            rules_list = "\n".join([f"- {rule}" for rule in rules])
+            rules_list = "\n".join(f"- {rule}" for rule in rules)
             precomputed_style_rules_text[code] = f"**Language-Specific Quality Checklist ({language_name})**:\n{rules_list}"
         else:
             precomputed_style_rules_text[code] = ""
@@ -175,8 +183,55 @@ def _precompute_style_rules(style_rules: Dict[str, List[str]], language_codes: D
     return precomputed_style_rules_text
 
 
-def _create_openai_client(dry_run: bool, logger: logging.Logger) -> Optional[AsyncOpenAI]:
-    """Create OpenAI client if not in dry run mode with enhanced error handling."""
+def _parse_positive_int(value: Any) -> Optional[int]:
+    """Return ``value`` as a positive integer, or None if it is not one."""
+    try:
+        parsed = int(str(value).strip())
+    except ValueError:
+        return None
+    return parsed if parsed > 0 else None
+
+
+def _resolve_max_concurrent_api_calls(config: Dict[str, Any], logger: logging.Logger) -> int:
+    """
+    Resolve the API concurrency from MAX_CONCURRENT_API_CALLS or the configuration.
+
+    Invalid values are logged and ignored, since zero workers would never finish a run.
+    """
+    default = 16
+    configured = _parse_positive_int(config.get('max_concurrent_api_calls', default))
+    if configured is None:
+        logger.error(
+            "Invalid max_concurrent_api_calls %r in configuration; it must be a positive integer. Using %d.",
+            config.get('max_concurrent_api_calls'),
+            default
+        )
+        configured = default
+
+    env_value = os.environ.get('MAX_CONCURRENT_API_CALLS')
+    if env_value is None:
+        return configured
+    from_env = _parse_positive_int(env_value)
+    if from_env is None:
+        logger.error(
+            "Invalid MAX_CONCURRENT_API_CALLS %r; it must be a positive integer. Using the configured %d.",
+            env_value,
+            configured
+        )
+        return configured
+    return from_env
+
+
+def _create_openai_client(
+        dry_run: bool,
+        logger: logging.Logger,
+        max_concurrent_api_calls: int = 1
+) -> Optional[AsyncOpenAI]:
+    """Create OpenAI client if not in dry run mode with enhanced error handling.
+
+    The HTTP connection pool is sized from ``max_concurrent_api_calls`` so every
+    concurrent request can reuse a kept-alive connection instead of queueing for one.
+    """
     if dry_run:
         logger.info("Running in dry-run mode, OpenAI client will not be initialized")
         return None
@@ -193,7 +248,11 @@ def _create_openai_client(dry_run: bool, logger: logging.Logger) -> Optional[Asy
         logger.warning("Warning: OPENAI_API_KEY does not start with 'sk-'. This may be invalid.")
 
     try:
-        client = AsyncOpenAI(api_key=api_key_from_env)
+        pool_size = max(1, max_concurrent_api_calls)
+        http_client = DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_connections=pool_size * 2, max_keepalive_connections=pool_size)
+        )
+        client = AsyncOpenAI(api_key=api_key_from_env, http_client=http_client)
         logger.info("OpenAI client initialized successfully")
         return client
     except Exception as e:
@@ -213,7 +272,7 @@ def load_app_config() -> AppConfig:
     project_root = _compute_project_root()
 
     # Load .env files
-    _load_dotenv_files(project_root)
+    dotenv_path = _load_dotenv_files(project_root)
 
     # Load YAML configuration
     config = _load_yaml_config(project_root)
@@ -222,7 +281,7 @@ def load_app_config() -> AppConfig:
     logger = _setup_logger_from_config(config)
 
     # Log .env status now that logger is available
-    _log_dotenv_status(logger, project_root)
+    _log_dotenv_status(logger, project_root, dotenv_path)
 
     # Build language mappings
     locales_list = config.get('supported_locales', [])
@@ -257,8 +316,23 @@ def load_app_config() -> AppConfig:
     if not os.path.isabs(translation_key_ledger_file_path):
         translation_key_ledger_file_path = os.path.join(project_root, translation_key_ledger_file_path)
 
+    # Optional persistent cache of model responses; disabled unless a path is configured
+    response_cache_file_path = config.get('response_cache_file_path')
+    if response_cache_file_path and not os.path.isabs(response_cache_file_path):
+        response_cache_file_path = os.path.join(project_root, response_cache_file_path)
+
+    # Maximum number of in-flight API requests, with environment override
+    max_concurrent_api_calls = _resolve_max_concurrent_api_calls(config, logger)
+
+    # Batch API for bulk runs, with environment override so urgent runs can switch it off
+    use_batch_api_env = os.environ.get('USE_BATCH_API')
+    if use_batch_api_env is not None:
+        use_batch_api = use_batch_api_env.strip().lower() in ('1', 'true', 'yes', 'on')
+    else:
+        use_batch_api = bool(config.get('use_batch_api', False))
+
     # Create OpenAI client
-    openai_client = _create_openai_client(dry_run, logger)
+    openai_client = _create_openai_client(dry_run, logger, max_concurrent_api_calls)
 
     return AppConfig(
         project_root=project_root,
@@ -271,7 +345,10 @@ def load_app_config() -> AppConfig:
         dry_run=dry_run,
         process_all_files=process_all_files,
         holistic_review_chunk_size=holistic_review_chunk_size,
-        max_concurrent_api_calls=config.get('max_concurrent_api_calls', 1),
+        max_concurrent_api_calls=max_concurrent_api_calls,
+        translation_batch_size=max(1, int(config.get('translation_batch_size', 1))),
+        use_batch_api=use_batch_api,
+        batch_api_min_keys=int(config.get('batch_api_min_keys', 50)),
         language_codes=language_codes,
         name_to_code=name_to_code,
         retranslate_identical_source_strings=retranslate_identical_source_strings,
@@ -281,6 +358,7 @@ def load_app_config() -> AppConfig:
         translation_queue_folder=translation_queue_folder,
         translated_queue_folder=translated_queue_folder,
         translation_key_ledger_file_path=translation_key_ledger_file_path,
+        response_cache_file_path=response_cache_file_path or None,
         preserve_queues_for_debug=config.get('preserve_queues_for_debug', False),
         openai_client=openai_client
     )
@@ -1,5 +1,7 @@
+import io
 import re
-from typing import Dict, List, Tuple
+import sys
+from typing import Dict, Iterator, List, TextIO, Tuple
 
 
 def _has_unescaped_trailing_backslash(s: str) -> bool:
@@ -29,6 +31,35 @@ def parse_properties_file(file_path: str) -> Tuple[List[Dict], Dict[str, str]]:
     with open(file_path, 'r', encoding='utf-8') as file:
         lines = file.readlines()
 
+    return _parse_lines(lines)
+
+
+def parse_properties_content(content: str) -> Tuple[List[Dict], Dict[str, str]]:
+    """
+    Parse .properties content that is already held in memory.
+
+    Line endings are normalized the same way as when reading a file in text mode,
+    so the result matches parse_properties_file for the same content.
+
+    Args:
+        content (str): The .properties content.
+
+    Returns:
+        Tuple[List[Dict], Dict[str, str]]: A list of parsed lines and a dictionary of translations.
+    """
+    return _parse_lines(io.StringIO(content, newline=None).readlines())
+
+
+def _parse_lines(lines: List[str]) -> Tuple[List[Dict], Dict[str, str]]:
+    """
+    Parse the lines of a .properties file.
+
+    Args:
+        lines (List[str]): The lines including their trailing newlines.
+
+    Returns:
+        Tuple[List[Dict], Dict[str, str]]: A list of parsed lines and a dictionary of translations.
+    """
     parsed_lines = []
     target_translations = {}
     i = 0
@@ -68,7 +99,9 @@ def parse_properties_file(file_path: str) -> Tuple[List[Dict], Dict[str, str]]:
                 value = line[end_sep_group + 1:]
                 
                 # Unescape common escapes used in .properties keys
-                key = re.sub(r'\\([:=\s])', r'\1', key_raw.strip())
+                # Keys are interned: every locale of a file shares them, and they are
+                # looked up in several dicts per file.
+                key = sys.intern(re.sub(r'\\([:=\s])', r'\1', key_raw.strip()))
                 
                 line_number = i
                 original_value_lines = [value]
@@ -120,17 +153,16 @@ def parse_properties_file(file_path: str) -> Tuple[List[Dict], Dict[str, str]]:
     return parsed_lines, target_translations
 
 
-def reassemble_file(parsed_lines: List[Dict]) -> str:
+def _iter_reassembled_lines(parsed_lines: List[Dict]) -> Iterator[str]:
     """
-    Reassemble the file content from parsed lines.
+    Yield the file content line by line from parsed lines.
 
     Args:
         parsed_lines (List[Dict]): The parsed lines.
 
-    Returns:
-        str: The reassembled file content.
+    Yields:
+        str: Each reassembled line, including its trailing newline.
     """
-    lines = []
     for item in parsed_lines:
         if item['type'] == 'entry':
             value = item['value']
@@ -150,7 +182,32 @@ def reassemble_file(parsed_lines: List[Dict]) -> str:
                         f"{formatted_value}\n")
             else:
                 line = f"{key}{separator_group}{value}\n"
-            lines.append(line)
+            yield line
         else:
-            lines.append(item['content'])
-    return ''.join(lines)
+            yield item['content']
+
+
+def reassemble_file(parsed_lines: List[Dict]) -> str:
+    """
+    Reassemble the file content from parsed lines.
+
+    Args:
+        parsed_lines (List[Dict]): The parsed lines.
+
+    Returns:
+        str: The reassembled file content.
+    """
+    return ''.join(_iter_reassembled_lines(parsed_lines))
+
+
+def reassemble_file_to(parsed_lines: List[Dict], fileobj: TextIO) -> None:
+    """
+    Write the reassembled file content directly to an open text file.
+
+    Avoids building the whole file as one string before writing it.
+
+    Args:
+        parsed_lines (List[Dict]): The parsed lines.
+        fileobj (TextIO): The open file to write to.
+    """
+    fileobj.writelines(_iter_reassembled_lines(parsed_lines))
@@ -0,0 +1,112 @@
+"""Persistent cache of model responses, keyed by a hash of the request."""
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from typing import Optional
+
+logger = logging.getLogger("translation_script")
+
+# Cached responses older than this are treated as missing.
+DEFAULT_TTL_SECONDS = 30 * 86400
+
+
+def make_cache_key(*parts: str) -> str:
+    """
+    Build a content-addressed cache key from the parts that determine a response.
+
+    Each part is length-prefixed so different splits of the same text never collide.
+
+    Args:
+        *parts (str): The request parts, e.g. model name and prompt texts.
+
+    Returns:
+        str: The hex BLAKE2b digest of the parts.
+    """
+    digest = hashlib.blake2b(digest_size=32)
+    for part in parts:
+        encoded = part.encode('utf-8')
+        digest.update(len(encoded).to_bytes(8, 'big'))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """
+    A small SQLite-backed key/value store for model responses.
+
+    The cache fails open: if the database cannot be opened, read or written, the error
+    is logged and the caller behaves as if the entry was missing.
+    """
+
+    def __init__(self, file_path: str, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.file_path = file_path
+        self.ttl_seconds = ttl_seconds
+        # Lookup counters, reported at the end of a run.
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            directory = os.path.dirname(file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(file_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Response cache '{file_path}' is unavailable, continuing without it: {e}")
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Return the cached response for a key, or None if it is missing or expired.
+
+        Args:
+            key (str): The cache key from make_cache_key.
+
+        Returns:
+            Optional[str]: The cached response text.
+        """
+        if self._conn is None:
+            return None
+        try:
+            row = self._conn.execute("SELECT value, created FROM responses WHERE key = ?", (key,)).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read from response cache '{self.file_path}': {e}")
+            return None
+        if row is None or time.time() - row[1] > self.ttl_seconds:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Store a response for a key, replacing any previous entry.
+
+        Args:
+            key (str): The cache key from make_cache_key.
+            value (str): The response text to cache.
+        """
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created) VALUES (?, ?, ?)",
+                (key, value, time.time())
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not write to response cache '{self.file_path}': {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
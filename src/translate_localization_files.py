@@ -1,5 +1,8 @@
 import asyncio
 import datetime as _dt
+import errno
+import fnmatch
+import functools
 import hashlib
 import json
 import logging
@@ -7,12 +10,15 @@ import os
 import random
 import re
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
-import uuid
+from dataclasses import dataclass
 from email.utils import parsedate_to_datetime
-from typing import Dict, List, Tuple, Optional, Set
+from itertools import count, islice
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Set, Tuple
 
 # --- Python Version Check ---
 # This script requires Python 3.11 or newer for features like modern asyncio.
@@ -22,28 +28,38 @@ if sys.version_info < (3, 11):
     sys.exit(1)
 # --- End Version Check ---
 
-import jsonschema
-import tiktoken
+import orjson
+
+try:
+    import fastjsonschema
+except ImportError:  # Optional: falls back to jsonschema's validator.
+    fastjsonschema = None
 from aiolimiter import AsyncLimiter
 from openai import (
     APIConnectionError,
     APIStatusError,
-    RateLimitError,
     APITimeoutError,
-    OpenAIError
+    OpenAIError,
+    RateLimitError,
 )
 from openai.types.chat import (
     ChatCompletionSystemMessageParam,
-    ChatCompletionUserMessageParam
+    ChatCompletionUserMessageParam,
 )
 from tqdm.asyncio import tqdm
 
 from src.app_config import load_app_config
-from src.properties_parser import parse_properties_file, reassemble_file
+from src.properties_parser import (
+    parse_properties_content,
+    parse_properties_file,
+    reassemble_file_to,
+)
+from src.response_cache import ResponseCache, make_cache_key
 from src.translation_validator import (
-    check_placeholder_parity,
     check_encoding_and_mojibake,
-    synchronize_keys
+    check_encoding_and_mojibake_content,
+    check_placeholder_parity,
+    synchronize_keys_and_load,
 )
 
 # --- Constants and Globals ---
@@ -55,16 +71,26 @@ logger = logging.getLogger("translation_script")
 
 # Define the expected JSON schema for the AI's response in the holistic review.
 # This ensures that the AI returns a dictionary where every value is a string.
+# Every key is allowed, so additionalProperties expresses this without a per-key regex.
 LOCALIZATION_SCHEMA = {
     "type": "object",
-    "patternProperties": {
-        "^.*$": {"type": "string"}
-    },
-    "additionalProperties": False
+    "additionalProperties": {"type": "string"}
 }
 
+# Compile the schema once instead of re-interpreting it for every review response.
+if fastjsonschema is not None:
+    _validate_localization = fastjsonschema.compile(LOCALIZATION_SCHEMA)
+    _SCHEMA_VALIDATION_ERRORS: Tuple[type, ...] = (fastjsonschema.JsonSchemaException,)
+else:
+    import jsonschema  # Imported only when needed; it is slow to import.
+    _validate_localization = jsonschema.validators.validator_for(LOCALIZATION_SCHEMA)(LOCALIZATION_SCHEMA).validate
+    _SCHEMA_VALIDATION_ERRORS = (jsonschema.ValidationError,)
+
 # Extract configuration values for convenience
 PROJECT_ROOT_DIR = config.project_root
+LOGS_DIR = os.path.join(PROJECT_ROOT_DIR, 'logs')
+SKIPPED_FILES_REPORT_PATH = os.path.join(LOGS_DIR, 'skipped_files_report.log')
+TRANSLATION_SUMMARY_PATH = os.path.join(LOGS_DIR, 'translation_summary.json')
 REPO_ROOT = config.target_project_root
 INPUT_FOLDER = config.input_folder
 GLOSSARY_FILE_PATH = config.glossary_file_path
@@ -75,24 +101,71 @@ DRY_RUN = config.dry_run
 PROCESS_ALL_FILES = config.process_all_files
 HOLISTIC_REVIEW_CHUNK_SIZE = config.holistic_review_chunk_size
 MAX_CONCURRENT_API_CALLS = config.max_concurrent_api_calls
+TRANSLATION_BATCH_SIZE = config.translation_batch_size
+USE_BATCH_API = config.use_batch_api
+BATCH_API_MIN_KEYS = config.batch_api_min_keys
 LANGUAGE_CODES = config.language_codes
 NAME_TO_CODE = config.name_to_code
 RETRANSLATE_IDENTICAL_SOURCE_STRINGS = config.retranslate_identical_source_strings
 STYLE_RULES = config.style_rules
 PRECOMPUTED_STYLE_RULES_TEXT = config.precomputed_style_rules_text
 BRAND_GLOSSARY = config.brand_glossary
+# The brand glossary is fixed for the run, so it is deduplicated and rendered once.
+_UNIQUE_BRAND_GLOSSARY = tuple(dict.fromkeys(BRAND_GLOSSARY))
+_BRAND_GLOSSARY_TEXT = '\n'.join(f"- {term}" for term in _UNIQUE_BRAND_GLOSSARY)
+# Static start of every translation user prompt, up to the per-language glossary.
+_TRANSLATION_PROMPT_PREFIX = (
+    "\n"
+    "**Brand/Technical Glossary (Do NOT translate these terms):**\n"
+    f"{_BRAND_GLOSSARY_TEXT}\n"
+    "\n"
+    "**Translation Glossary:**\n"
+)
 TRANSLATION_QUEUE_FOLDER = config.translation_queue_folder
 TRANSLATED_QUEUE_FOLDER = config.translated_queue_folder
 TRANSLATION_KEY_LEDGER_FILE_PATH = config.translation_key_ledger_file_path
+RESPONSE_CACHE_FILE_PATH = config.response_cache_file_path
 PRESERVE_QUEUES_FOR_DEBUG = config.preserve_queues_for_debug
 client = config.openai_client
 
 # --- End Config and Globals ---
 
+_response_cache: Optional[ResponseCache] = None
+
+def _get_response_cache() -> Optional[ResponseCache]:
+    """Return the persistent response cache, opening it on first use, or None if it is disabled."""
+    global _response_cache
+    if _response_cache is None and RESPONSE_CACHE_FILE_PATH:
+        _response_cache = ResponseCache(RESPONSE_CACHE_FILE_PATH)
+    return _response_cache
+
 _SUPPRESS_PATTERN = re.compile(
     r'#\s*suppress\s+inspection\s+"[^"]*$'
 )
 
+# Run of trailing backslashes on a value; an odd count marks a line continuation.
+_TRAILING_BSLASH_RE = re.compile(r'(\\+)$')
+
+# Allow: \t \n \f \r \\ \= \: \# \! space, \", and \uXXXX (4 hex digits).
+# Loosened to ignore \n and \" which appear in some source files.
+_INVALID_ESCAPE_RE = re.compile(r'\\(?!u[0-9a-fA-F]{4}|[tnfr\\=:#\s!"])')
+
+_WS_RE = re.compile(r'\s+')
+_NEWLINE_RE = re.compile(r'\\n|\n')
+
+# Placeholders like `{0}` or `{name}` and HTML-like tags
+_PLACEHOLDER_RE = re.compile(r'(<[^<>]+>)|({[^{}]+})')
+
+# Counter-based tokens produced by extract_placeholders, with an optional letter prefix
+_PH_TOKEN_RE = re.compile(r'__PH_[A-Z]?\d+__')
+
+# MessageFormat placeholders; the capturing variant is used to report mismatches
+_MSGFMT_PLACEHOLDER_RE = re.compile(r'\{[^{}]+\}')
+_MSGFMT_PLACEHOLDER_NAME_RE = re.compile(r'\{([^{}]+)\}')
+
+# Locale suffix of translation files, e.g. '_de.properties' or '_pt_BR.properties'
+_LANG_SUFFIX_RE = re.compile(r'_[a-z]{2,3}(?:[-_][A-Za-z]{2,4})?\.properties$')
+
 
 def _lint_comment_syntax(line: str, line_number: int) -> Optional[str]:
     """Return an error string if ``line`` has a known malformed comment pattern.
@@ -107,6 +180,30 @@ def _lint_comment_syntax(line: str, line_number: int) -> Optional[str]:
     return None
 
 
+def _find_separator(line: str) -> int:
+    """
+    Find the index of the first unescaped '=' or ':' in a properties line.
+
+    Args:
+        line (str): The stripped properties line.
+
+    Returns:
+        int: The separator index, or -1 if the line has no unescaped separator.
+    """
+    eq_idx = line.find('=')
+    colon_idx = line.find(':')
+    while eq_idx != -1 or colon_idx != -1:
+        # Take the earlier separator and advance only that search past it.
+        if colon_idx == -1 or (eq_idx != -1 and eq_idx < colon_idx):
+            sep_idx = eq_idx
+            eq_idx = line.find('=', sep_idx + 1)
+        else:
+            sep_idx = colon_idx
+            colon_idx = line.find(':', sep_idx + 1)
+        if sep_idx == 0 or line[sep_idx - 1] != '\\':
+            return sep_idx
+    return -1
+
 def lint_properties_file(file_path: str) -> List[str]:
     """
     Lints a .properties file to check for common issues.
@@ -119,47 +216,48 @@ def lint_properties_file(file_path: str) -> List[str]:
     """
     errors = []
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            for i, line in enumerate(f, 1):
-                line = line.strip()
-                if not line:
-                    continue
+        with open(file_path, 'rb') as f:
+            content = f.read().decode('utf-8')
+        # Decode once and split like text-mode iteration would (universal newlines only);
+        # str.splitlines() would also break on form feeds and Unicode separators.
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+        for i, line in enumerate(content.split('\n'), 1):
+            line = line.strip()
+            if not line:
+                continue
 
-                if line.startswith('#') or line.startswith('!'):
-                    err = _lint_comment_syntax(line, i)
-                    if err:
-                        errors.append(err)
-                    continue
+            if line.startswith('#') or line.startswith('!'):
+                err = _lint_comment_syntax(line, i)
+                if err:
+                    errors.append(err)
+                continue
 
-                if '=' in line or ':' in line:
-                    sep_idx = -1
-                    for j, ch in enumerate(line):
-                        if ch in ('=', ':') and (j == 0 or line[j - 1] != '\\'):
-                            sep_idx = j
-                            break
-                    if sep_idx == -1:
-                        continue
-                    key, value = line[:sep_idx], line[sep_idx + 1:]
-                    key = key.strip()
-
-                    # Check for malformed keys (e.g., double dots)
-                    if '..' in key:
-                        errors.append(f"Linter Error: Malformed key '{key}' with double dots found on line {i}.")
-
-                    # Temporarily remove a trailing backslash if it's for line continuation,
-                    # so it's not incorrectly flagged as an invalid escape sequence.
-                    value_to_check = value.rstrip('\r\n')
-                    # Treat as continuation only if an odd number of trailing backslashes
-                    m = re.search(r'(\\+)$', value_to_check)
-                    if m and (len(m.group(1)) % 2 == 1):
-                        value_to_check = value_to_check[:-1]
-
-                    # Allow: \t \n \f \r \\ \= \: \# \! space, \", and \uXXXX (4 hex digits)
-                    # This regex is loosened to ignore \n and \" which appear in some source files.
-                    if re.search(r'\\(?!u[0-9a-fA-F]{4}|[tnfr\\=:#\s!"])', value_to_check):
-                        errors.append(
-                            f"Linter Error: Invalid escape sequence in value for key '{key}' on line {i}."
-                        )
+            if '=' in line or ':' in line:
+                sep_idx = _find_separator(line)
+                if sep_idx == -1:
+                    continue
+                key, value = line[:sep_idx], line[sep_idx + 1:]
+                key = key.strip()
+
+                # Check for malformed keys (e.g., double dots)
+                if '..' in key:
+                    errors.append(f"Linter Error: Malformed key '{key}' with double dots found on line {i}.")
+
+                # Temporarily remove a trailing backslash if it's for line continuation,
+                # so it's not incorrectly flagged as an invalid escape sequence.
+                # Lines are already split on newlines and stripped, so the value can be
+                # checked in place. Treat as continuation only if an odd number of
+                # trailing backslashes.
+                value_to_check = value
+                if value.endswith('\\'):
+                    m = _TRAILING_BSLASH_RE.search(value)
+                    if len(m.group(1)) % 2 == 1:
+                        value_to_check = value[:-1]
+
+                if _INVALID_ESCAPE_RE.search(value_to_check):
+                    errors.append(
+                        f"Linter Error: Invalid escape sequence in value for key '{key}' on line {i}."
+                    )
 
     except (IOError, OSError, UnicodeDecodeError) as e:
         errors.append(f"Linter Error: Could not read or process file {file_path}. Reason: {e}")
@@ -204,20 +302,24 @@ def load_glossary(glossary_file_path: str) -> Dict[str, Dict[str, str]]:
         logger.error(f"Glossary file '{glossary_file_path}' not found.")
         return {}
     try:
-        with open(glossary_file_path, 'r', encoding='utf-8') as f:
-            glossary = json.load(f)
+        with open(glossary_file_path, 'rb') as f:
+            glossary = orjson.loads(f.read())
         return glossary
-    except json.JSONDecodeError as json_exc:
+    except orjson.JSONDecodeError as json_exc:
         logger.error(f"Error decoding JSON glossary file: {json_exc}")
         return {}
     except Exception as general_exc:
         logger.error(f"An unexpected error occurred while loading the glossary: {general_exc}")
         return {}
 
+@functools.lru_cache(maxsize=8192)
 def normalize_value(value: Optional[str]) -> str:
     """
     Normalize a value by replacing special characters and normalizing whitespace.
 
+    The result only depends on the input, so it is memoized: build_context normalizes
+    the same existing translations for every key it builds a prompt for.
+
     Args:
         value (Optional[str]): The value to normalize.
 
@@ -226,12 +328,10 @@ def normalize_value(value: Optional[str]) -> str:
     """
     if value is None:
         return ''
-    # Replace escaped newline characters (\n) with a placeholder
-    value = value.replace('\\n', '<newline>')
-    # Replace actual newline characters with the same placeholder
-    value = value.replace('\n', '<newline>')
+    # Replace escaped (\n) and actual newline characters with a placeholder in one pass
+    value = _NEWLINE_RE.sub('<newline>', value)
     # Remove leading/trailing whitespace and normalize inner whitespace
-    value = re.sub(r'\s+', ' ', value.strip())
+    value = _WS_RE.sub(' ', value.strip())
     return value
 
 
@@ -245,9 +345,18 @@ def load_translation_key_ledger(ledger_file_path: str) -> Dict[str, Dict[str, Di
     """
     Load the persistent translation key ledger from disk.
 
+    Entries from a journal left behind by an interrupted run are replayed on top.
+
     Returns:
         Mapping of translation_file -> key -> {source_hash, target_hash}
     """
+    files_obj = _load_translation_key_ledger_file(ledger_file_path)
+    _replay_translation_key_ledger_journal(_ledger_journal_path(ledger_file_path), files_obj)
+    return files_obj
+
+
+def _load_translation_key_ledger_file(ledger_file_path: str) -> Dict[str, Dict[str, Dict[str, str]]]:
+    """Read the main ledger file, returning an empty ledger if it is missing or invalid."""
     if not os.path.exists(ledger_file_path):
         return {}
     try:
@@ -266,11 +375,66 @@ def load_translation_key_ledger(ledger_file_path: str) -> Dict[str, Dict[str, Di
         return {}
 
 
+def _ledger_journal_path(ledger_file_path: str) -> str:
+    """Return the path of the append-only journal that accompanies a ledger file."""
+    return f"{ledger_file_path}.journal"
+
+
+def _replay_translation_key_ledger_journal(
+        journal_path: str,
+        key_ledger: Dict[str, Dict[str, Dict[str, str]]]
+) -> None:
+    """Apply per-file entries from a ledger journal to key_ledger in write order."""
+    try:
+        with open(journal_path, 'r', encoding='utf-8') as f:
+            journal_lines = f.readlines()
+    except FileNotFoundError:
+        return
+    except Exception as exc:
+        logger.warning("Failed to read translation key ledger journal '%s': %s", journal_path, exc)
+        return
+
+    replayed = 0
+    for line in journal_lines:
+        try:
+            record = json.loads(line)
+            translation_file = record["file"]
+            entries = record["entries"]
+        except (ValueError, KeyError, TypeError):
+            # A crash mid-write can leave a truncated last line; skip anything unreadable.
+            continue
+        if isinstance(translation_file, str) and isinstance(entries, dict):
+            key_ledger[translation_file] = entries
+            replayed += 1
+    if replayed:
+        logger.info("Replayed %d file entries from translation key ledger journal '%s'.", replayed, journal_path)
+
+
+def append_translation_key_ledger_journal(
+        ledger_file_path: str,
+        translation_file: str,
+        file_ledger: Dict[str, Dict[str, str]]
+) -> None:
+    """Append one file's ledger entries to the journal so progress survives a crash before the final save."""
+    if DRY_RUN:
+        return
+    journal_path = _ledger_journal_path(ledger_file_path)
+    try:
+        parent_dir = os.path.dirname(journal_path)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+        record = json.dumps({"file": translation_file, "entries": file_ledger}, ensure_ascii=False, sort_keys=True)
+        with open(journal_path, 'a', encoding='utf-8') as f:
+            f.write(record + "\n")
+    except Exception:
+        logger.exception("Failed to append to translation key ledger journal '%s'.", journal_path)
+
+
 def save_translation_key_ledger(
         ledger_file_path: str,
         key_ledger: Dict[str, Dict[str, Dict[str, str]]]
 ) -> None:
-    """Persist translation key ledger to disk."""
+    """Persist translation key ledger to disk and drop the journal it supersedes."""
     if DRY_RUN:
         logger.info("[Dry Run] Skipping write of translation key ledger.")
         return
@@ -287,6 +451,11 @@ def save_translation_key_ledger(
         with open(temp_path, 'w', encoding='utf-8') as f:
             json.dump(payload, f, ensure_ascii=False, indent=2, sort_keys=True)
         os.replace(temp_path, ledger_file_path)
+        # The saved ledger now contains everything the journal recorded.
+        try:
+            os.remove(_ledger_journal_path(ledger_file_path))
+        except FileNotFoundError:
+            pass
     except Exception:
         logger.exception("Failed to save translation key ledger to '%s'.", ledger_file_path)
 
@@ -344,69 +513,75 @@ def extract_texts_to_translate(
     newly_added_keys = newly_added_keys or set()
     file_ledger_entries = file_ledger_entries or {}
 
-    existing_keys_in_target = {line['key'] for line in parsed_lines if line['type'] == 'entry'}
+    # Extract the entry rows once; both passes below only need entries.
+    entry_rows = [
+        (i, line['key'], line.get('value', ''))
+        for i, line in enumerate(parsed_lines)
+        if line['type'] == 'entry'
+    ]
+    existing_keys_in_target = {key for _, key, _ in entry_rows}
 
     # 1. Check existing keys for required updates.
-    for i, line in enumerate(parsed_lines):
-        if line['type'] == 'entry':
-            key = line['key']
-            target_value = line.get('value', '')
-            source_value = source_translations.get(key)
+    for i, key, target_value in entry_rows:
+        source_value = source_translations.get(key)
 
-            if source_value is None:
-                continue
+        if source_value is None:
+            continue
 
-            is_source_identical = source_value.strip() == target_value.strip()
-            ledger_entry = file_ledger_entries.get(key, {})
-            previous_status = ledger_entry.get("status")
-            previous_source_hash = ledger_entry.get("source_hash")
-            previous_target_hash = ledger_entry.get("target_hash")
+        is_source_identical = source_value.strip() == target_value.strip()
+        ledger_entry = file_ledger_entries.get(key, {})
+        previous_status = ledger_entry.get("status")
+        previous_source_hash = ledger_entry.get("source_hash")
+        previous_target_hash = ledger_entry.get("target_hash")
+        should_translate_newly_added = key in newly_added_keys
+        should_translate_legacy_mode = is_source_identical and retranslate_identical_existing
+        should_translate_changed_source = False
+        should_translate_regressed_to_source = False
+        # Hashing is only needed to compare against a ledger baseline, which most keys lack on a first run.
+        if previous_source_hash is not None or previous_target_hash is not None:
             current_source_hash = compute_ledger_hash(source_value)
-            current_target_hash = compute_ledger_hash(target_value)
-            should_translate_newly_added = key in newly_added_keys
-            should_translate_legacy_mode = is_source_identical and retranslate_identical_existing
             should_translate_changed_source = (
                 previous_source_hash is not None and previous_source_hash != current_source_hash
             )
             should_translate_regressed_to_source = (
                 previous_target_hash is not None
-                and current_target_hash == current_source_hash
                 and previous_target_hash != current_source_hash
+                and compute_ledger_hash(target_value) == current_source_hash
             )
-            should_translate_failed_status = previous_status == "failed"
-            should_translate_existing = (
-                # New keys synchronized in this run should always be translated.
-                should_translate_newly_added
-                # Legacy behavior: also retranslate any source-identical existing key.
-                or should_translate_legacy_mode
-                # Source text changed since the last run for this key.
-                or should_translate_changed_source
-                # Previously translated key fell back to source-identical content.
-                or should_translate_regressed_to_source
-                # Keys previously reverted by validation should be retried.
-                or should_translate_failed_status
-            )
+        should_translate_failed_status = previous_status == "failed"
+        should_translate_existing = (
+            # New keys synchronized in this run should always be translated.
+            should_translate_newly_added
+            # Legacy behavior: also retranslate any source-identical existing key.
+            or should_translate_legacy_mode
+            # Source text changed since the last run for this key.
+            or should_translate_changed_source
+            # Previously translated key fell back to source-identical content.
+            or should_translate_regressed_to_source
+            # Keys previously reverted by validation should be retried.
+            or should_translate_failed_status
+        )
 
-            # Only newly synchronized source-identical keys are translated by default.
-            if should_translate_existing:
-                # The value to translate is the source value.
-                texts_to_translate.append(source_value)
-                indices.append(i)  # Use the line's actual index
-                keys_to_translate.append(key)
-                continue
+        # Only newly synchronized source-identical keys are translated by default.
+        if should_translate_existing:
+            # The value to translate is the source value.
+            texts_to_translate.append(source_value)
+            indices.append(i)  # Use the line's actual index
+            keys_to_translate.append(key)
+            continue
 
-            # Migration visibility: without a baseline, existing source-identical keys are skipped by default.
-            if (
-                    is_source_identical
-                    and previous_source_hash is None
-                    and not retranslate_identical_existing
-                    and not should_translate_newly_added
-            ):
-                logger.info(
-                    "Skipping key '%s' (source==target) because no ledger baseline exists yet. "
-                    "Enable 'retranslate_identical_source_strings' or seed the translation key ledger.",
-                    key
-                )
+        # Migration visibility: without a baseline, existing source-identical keys are skipped by default.
+        if (
+                is_source_identical
+                and previous_source_hash is None
+                and not retranslate_identical_existing
+                and not should_translate_newly_added
+        ):
+            logger.info(
+                "Skipping key '%s' (source==target) because no ledger baseline exists yet. "
+                "Enable 'retranslate_identical_source_strings' or seed the translation key ledger.",
+                key
+            )
 
     # 2. Find new keys that are in the source but not in the target file.
     new_keys = source_translations.keys() - existing_keys_in_target
@@ -414,7 +589,7 @@ def extract_texts_to_translate(
     # Start indexing for new keys from after the last line of the parsed file
     next_new_key_index = len(parsed_lines)
 
-    for key in sorted(list(new_keys)):  # Sort for deterministic order
+    for key in sorted(new_keys):  # Sort for deterministic order
         source_value = source_translations[key]
         texts_to_translate.append(source_value)
         indices.append(next_new_key_index)
@@ -489,10 +664,30 @@ def get_working_tree_changed_keys(target_file_path: str, repo_root: str) -> Set[
     This is used to capture keys that appear in locale files through ``tx pull``
     before AI translation runs, so they can be treated as newly synchronized.
     """
+    return get_working_tree_changed_keys_for_files([target_file_path], repo_root)[target_file_path]
+
+def get_working_tree_changed_keys_for_files(target_file_paths: List[str], repo_root: str) -> Dict[str, Set[str]]:
+    """
+    Return the added/updated keys of several files from a single ``git diff`` call.
+
+    Args:
+        target_file_paths (List[str]): Paths of the locale files to inspect.
+        repo_root (str): The git working tree to run ``git diff`` in.
+
+    Returns:
+        Dict[str, Set[str]]: Changed keys per given path. Files without changes, or all
+        files if git cannot be inspected, map to an empty set.
+    """
+    changed_keys_by_path: Dict[str, Set[str]] = {path: set() for path in target_file_paths}
+    if not target_file_paths:
+        return changed_keys_by_path
     try:
-        relative_target_path = os.path.relpath(target_file_path, repo_root)
+        relative_paths = {
+            os.path.normpath(os.path.relpath(path, repo_root)).replace(os.sep, '/'): path
+            for path in target_file_paths
+        }
         result = subprocess.run(
-            ['git', 'diff', '--unified=0', '--', relative_target_path],
+            ['git', '-c', 'core.quotepath=off', 'diff', '--relative', '--unified=0', '--', *relative_paths],
             cwd=repo_root,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
@@ -501,81 +696,112 @@ def get_working_tree_changed_keys(target_file_path: str, repo_root: str) -> Set[
         )
         if result.returncode != 0:
             logger.debug(
-                "Unable to inspect git diff for '%s' (exit=%s): %s",
-                relative_target_path,
+                "Unable to inspect git diff for %d file(s) (exit=%s): %s",
+                len(relative_paths),
                 result.returncode,
                 result.stderr.strip()
             )
-            return set()
+            return changed_keys_by_path
 
-        changed_keys: Set[str] = set()
+        # With a single file every hunk belongs to it; otherwise follow the '+++ b/<path>' headers.
+        current_keys: Optional[Set[str]] = (
+            changed_keys_by_path[target_file_paths[0]] if len(relative_paths) == 1 else None
+        )
         for line in result.stdout.splitlines():
-            if not line.startswith('+') or line.startswith('+++'):
+            if line.startswith('+++'):
+                if len(relative_paths) > 1:
+                    header_path = line[4:].strip()
+                    header_path = header_path.removeprefix('b/')
+                    original_path = relative_paths.get(header_path)
+                    current_keys = changed_keys_by_path[original_path] if original_path else None
+                continue
+            if not line.startswith('+') or current_keys is None:
                 continue
             key = _extract_properties_key_from_diff_line(line[1:])
             if key:
-                changed_keys.add(key)
-        return changed_keys
+                current_keys.add(key)
+        return changed_keys_by_path
     except Exception:
-        logger.debug("Failed to compute git-diff changed keys for '%s'.", target_file_path, exc_info=True)
-        return set()
+        logger.debug("Failed to compute git-diff changed keys for %d file(s).", len(target_file_paths), exc_info=True)
+        return {path: set() for path in target_file_paths}
 
-def count_tokens(text: str, model_name: str = 'gpt-3.5-turbo') -> int:
-    """Count the number of tokens in ``text`` for ``model_name``.
+@functools.lru_cache(maxsize=8)
+def _get_encoding(model_name: str):
+    """Return the tiktoken encoding for ``model_name``, resolved once per model.
 
     ``tiktoken.encoding_for_model`` occasionally attempts a network request to
     download model data if it is not already cached. Network access is not
     guaranteed in all environments (e.g., in CI). If obtaining the encoding for
     the requested model fails, the function falls back to ``gpt2`` which ships
-    with ``tiktoken``. As a last resort, a simple whitespace split is used.
+    with ``tiktoken``. Returns None if no encoding is available.
     """
+    # Deferred so that runs which never count tokens do not pay tiktoken's import cost.
+    import tiktoken
 
     try:
-        encoding = tiktoken.encoding_for_model(model_name)
+        return tiktoken.encoding_for_model(model_name)
     except Exception:
         try:
-            encoding = tiktoken.get_encoding("gpt2")
+            return tiktoken.get_encoding("gpt2")
         except Exception:
-            return len(text.split())
+            return None
+
+def count_tokens(text: str, model_name: str = 'gpt-3.5-turbo') -> int:
+    """Count the number of tokens in ``text`` for ``model_name``.
+
+    Uses the cached encoding from ``_get_encoding``. As a last resort, a simple
+    whitespace split is used.
+    """
+    encoding = _get_encoding(model_name)
+    if encoding is None:
+        return len(text.split())
 
     try:
-        return len(encoding.encode(text))
+        # Prompt text is never meant to contain special tokens, so skip that scan.
+        return len(encoding.encode_ordinary(text))
     except Exception:
         return len(text.split())
 
-def build_context(
+@functools.lru_cache(maxsize=64)
+def _render_glossary(glossary_items: Tuple[Tuple[str, str], ...], model_name: str) -> Tuple[str, int]:
+    """
+    Render a language glossary as prompt text and count its tokens.
+
+    The glossary does not change during a run, so the result is cached and shared
+    by every translation request of the same language.
+
+    Args:
+        glossary_items (Tuple[Tuple[str, str], ...]): The glossary entries as (term, translation) pairs.
+        model_name (str): The model name.
+
+    Returns:
+        Tuple[str, int]: The glossary text and its token count.
+    """
+    glossary_text = '\n'.join(f'"{k}" should be translated as "{v}"' for k, v in glossary_items)
+    return glossary_text, count_tokens(glossary_text, model_name)
+
+def _build_context_examples(
         existing_translations: Dict[str, str],
         source_translations: Dict[str, str],
-        language_glossary: Dict[str, str],
-        max_tokens: int,
+        available_tokens: int,
         model_name: str
-) -> Tuple[str, str]:
+) -> str:
     """
-    Build the context and glossary text for the translation prompt.
+    Build the context examples text from existing translations within a token budget.
 
     Args:
         existing_translations (Dict[str, str]): Existing translations in the target language.
         source_translations (Dict[str, str]): Source translations (in English).
-        language_glossary (Dict[str, str]): The glossary for the language.
-        max_tokens (int): Maximum allowed tokens.
+        available_tokens (int): Maximum number of tokens the examples may use.
         model_name (str): The model name.
 
     Returns:
-        Tuple[str, str]: The context examples text and glossary text.
+        str: The context examples text.
     """
     context_examples = []
     total_tokens = 0
 
-    # Build glossary entries
-    glossary_entries = [f'"{k}" should be translated as "{v}"' for k, v in language_glossary.items()]
-    glossary_text = '\n'.join(glossary_entries)
-    glossary_tokens = count_tokens(glossary_text, model_name)
-
-    # Reserve tokens for the rest of the prompt and response
-    reserved_tokens = 1000  # Adjust based on your needs
-    available_tokens = max_tokens - glossary_tokens - reserved_tokens
-
-    # Iterate over existing translations
+    # Examples are counted one at a time so tokenizing stops as soon as the budget is used up.
     for key, translated_value in existing_translations.items():
         source_value = source_translations.get(key)
         if not source_value:
@@ -597,15 +823,45 @@ def build_context(
         context_examples.append(example)
         total_tokens += example_tokens
 
-    context_text = '\n'.join(context_examples)
+    return '\n'.join(context_examples)
+
+def build_context(
+        existing_translations: Dict[str, str],
+        source_translations: Dict[str, str],
+        language_glossary: Dict[str, str],
+        max_tokens: int,
+        model_name: str
+) -> Tuple[str, str]:
+    """
+    Build the context and glossary text for the translation prompt.
+
+    Args:
+        existing_translations (Dict[str, str]): Existing translations in the target language.
+        source_translations (Dict[str, str]): Source translations (in English).
+        language_glossary (Dict[str, str]): The glossary for the language.
+        max_tokens (int): Maximum allowed tokens.
+        model_name (str): The model name.
+
+    Returns:
+        Tuple[str, str]: The context examples text and glossary text.
+    """
+    glossary_text, glossary_tokens = _render_glossary(tuple(language_glossary.items()), model_name)
+
+    # Reserve tokens for the rest of the prompt and response
+    reserved_tokens = 1000  # Adjust based on your needs
+    available_tokens = max_tokens - glossary_tokens - reserved_tokens
+
+    context_text = _build_context_examples(existing_translations, source_translations, available_tokens, model_name)
     return context_text, glossary_text
 
-def extract_placeholders(text: str) -> Tuple[str, Dict[str, str]]:
+def extract_placeholders(text: str, token_prefix: str = "") -> Tuple[str, Dict[str, str]]:
     """
     Extract and replace placeholders in the text with unique tokens.
 
     Args:
         text (str): The text to process.
+        token_prefix (str): An optional capital letter put before the token number, so
+            mappings of different texts that are restored together do not collide.
 
     Returns:
         Tuple[str, Dict[str, str]]: The processed text and placeholder mapping.
@@ -613,17 +869,17 @@ def extract_placeholders(text: str) -> Tuple[str, Dict[str, str]]:
     if not isinstance(text, str):
         raise ValueError("Input text must be a string.")
 
-    # Pattern to match placeholders like `{0}` or `{name}` and HTML-like tags
-    pattern = re.compile(r'(<[^<>]+>)|({[^{}]+})')
     placeholder_mapping = {}
+    # Tokens only need to be unique within this text, so a counter is enough.
+    token_ids = count()
 
     def replace_placeholder(match):
         full_match = match.group(0)
-        placeholder_token = f"__PH_{uuid.uuid4().hex}__"
+        placeholder_token = f"__PH_{token_prefix}{next(token_ids)}__"
         placeholder_mapping[placeholder_token] = full_match
         return placeholder_token
 
-    processed_text = pattern.sub(replace_placeholder, text)
+    processed_text = _PLACEHOLDER_RE.sub(replace_placeholder, text)
     return processed_text, placeholder_mapping
 
 def restore_placeholders(text: str, placeholder_mapping: Dict[str, str]) -> str:
@@ -637,11 +893,12 @@ def restore_placeholders(text: str, placeholder_mapping: Dict[str, str]) -> str:
     Returns:
         str: The text with placeholders restored.
     """
-    for token, placeholder in placeholder_mapping.items():
-        text = text.replace(token, placeholder)
-    return text
+    if not placeholder_mapping:
+        return text
+    # One pass over the text; tokens not in the mapping are left untouched.
+    return _PH_TOKEN_RE.sub(lambda match: placeholder_mapping.get(match.group(0), match.group(0)), text)
 
-def protect_placeholders_in_properties(content: str) -> Tuple[str, Dict[str, str]]:
+def protect_placeholders_in_properties(content: str, token_prefix: str = "") -> Tuple[str, Dict[str, str]]:
     """
     Protect all placeholders in properties file content by replacing them with unique tokens.
 
@@ -651,49 +908,40 @@ def protect_placeholders_in_properties(content: str) -> Tuple[str, Dict[str, str
 
     Args:
         content: Full properties file content with multiple key=value pairs
+        token_prefix: Optional letter that keeps these tokens apart from another mapping's
 
     Returns:
         Tuple containing:
-        - protected_content: Content with placeholders replaced by __PH_xxx__ tokens
+        - protected_content: Content with placeholders replaced by __PH_0__, __PH_1__, ... tokens
+          (__PH_S0__, ... with token_prefix "S")
         - placeholder_mapping: Dict mapping tokens back to original placeholders
     """
     if not content:
         return "", {}
 
-    # Pattern to match placeholders like {0}, {1}, {name} and HTML-like tags
-    pattern = re.compile(r'(<[^<>]+>)|({[^{}]+})')
-    placeholder_mapping = {}
-
-    def replace_placeholder(match):
-        full_match = match.group(0)
-        placeholder_token = f"__PH_{uuid.uuid4().hex}__"
-        placeholder_mapping[placeholder_token] = full_match
-        return placeholder_token
-
-    protected_content = pattern.sub(replace_placeholder, content)
-    return protected_content, placeholder_mapping
+    return extract_placeholders(content, token_prefix)
 
 def restore_placeholders_in_properties(content: str, placeholder_mapping: Dict[str, str]) -> str:
     """
     Restore all placeholders in properties file content from protection tokens.
 
     This is the reverse operation of protect_placeholders_in_properties().
-    It replaces all __PH_xxx__ tokens back with their original placeholder values.
+    It replaces all __PH_N__ tokens back with their original placeholder values.
 
     Args:
-        content: Properties file content with __PH_xxx__ protection tokens
+        content: Properties file content with __PH_N__ protection tokens
         placeholder_mapping: Dict mapping tokens to original placeholders
 
     Returns:
         Content with all placeholders restored to original {0}, {1}, etc.
     """
-    if not content or not placeholder_mapping:
+    if not content:
         return content
 
-    for token, placeholder in placeholder_mapping.items():
-        content = content.replace(token, placeholder)
+    return restore_placeholders(content, placeholder_mapping)
 
-    return content
+# Wrappers the model sometimes adds around a translation, stripped in this order.
+_WRAPPING_PAIRS = (('"', '"'), ('[', ']'))
 
 def clean_translated_text(translated_text: str, original_text: str) -> str:
     """
@@ -707,20 +955,29 @@ def clean_translated_text(translated_text: str, original_text: str) -> str:
     Returns:
         str: The cleaned translated text.
     """
-    # Remove leading/trailing quotes if they are not in the original text
-    if translated_text.startswith('"') and translated_text.endswith('"') and not (
-            original_text.startswith('"') and original_text.endswith('"')):
-        translated_text = translated_text[1:-1]
-    # Remove square brackets if they are not in the original text
-    if translated_text.startswith('[') and translated_text.endswith(']') and not (
-            original_text.startswith('[') and original_text.endswith(']')):
-        translated_text = translated_text[1:-1]
+    # Remove surrounding quotes, then square brackets, if they are not in the original text
+    for opening, closing in _WRAPPING_PAIRS:
+        if translated_text.startswith(opening) and translated_text.endswith(closing) and not (
+                original_text.startswith(opening) and original_text.endswith(closing)):
+            translated_text = translated_text[1:-1]
     return translated_text
 
+# Upper bound for jittered retry delays, in seconds. A server-provided Retry-After is always honored.
+_RETRY_MAX_DELAY = 30.0
+
+@dataclass
+class RetryState:
+    """Backoff state carried across the retries of a single request."""
+    prev_delay: float = 0.0
+
 async def _handle_retry(attempt: int, max_retries: int, base_delay: float, key: str,
-                        api_exc: Optional[Exception] = None) -> bool:
+                        api_exc: Optional[Exception] = None, state: Optional[RetryState] = None) -> bool:
     """
-    Handle the retry mechanism with exponential backoff and jitter.
+    Handle the retry mechanism with decorrelated jitter backoff.
+
+    Each delay is drawn between base_delay and three times the previous delay (capped at
+    _RETRY_MAX_DELAY), so parallel requests that failed together do not retry in lockstep.
+    A Retry-After header on the API error sets a lower bound for the delay.
 
     Args:
         attempt (int): The current attempt number.
@@ -728,33 +985,40 @@ async def _handle_retry(attempt: int, max_retries: int, base_delay: float, key:
         base_delay (float): The base delay in seconds.
         key (str): The key being translated.
         api_exc (Optional[Exception]): The exception object from the API, if available.
+        state (Optional[RetryState]): Backoff state shared by the retries of one request.
 
     Returns:
         bool: True if the operation should retry, False otherwise.
     """
     if attempt < max_retries:
+        retry_after = None
+        retry_after_header = None
         try:
-            retry_after = None
             if api_exc and isinstance(api_exc, OpenAIError):
-                retry_after_header = getattr(api_exc, "headers", {}).get("Retry-After")
+                # APIStatusError exposes the headers on its HTTP response.
+                headers = getattr(api_exc, "headers", None) or getattr(getattr(api_exc, "response", None), "headers", None)
+                retry_after_header = (headers or {}).get("Retry-After")
                 if retry_after_header:
                     if retry_after_header.isdigit():
                         retry_after = float(retry_after_header)  # Handle delay in seconds
                     elif retry_after_header.endswith("ms"):
                         retry_after = float(retry_after_header[:-2]) / 1000  # Convert ms to seconds
-            if retry_after is None:
+            if retry_after is None and retry_after_header:
                 # Try HTTP-date (RFC 7231)
                 try:
                     dt = parsedate_to_datetime(retry_after_header)
                     retry_after = max(0.0, (dt - _dt.datetime.now(dt.tzinfo)).total_seconds())
-                except Exception:
+                except (TypeError, ValueError):
                     retry_after = None
-            if retry_after is None:
-                retry_after = base_delay * (2 ** (attempt - 1)) + random.uniform(0, 1)
-            delay = retry_after
         except Exception as exc:
-            logger.warning(f"Failed to parse Retry-After header: {exc}. Falling back to exponential backoff.")
-            delay = base_delay * (2 ** (attempt - 1)) + random.uniform(0, 1)
+            logger.warning(f"Failed to parse Retry-After header: {exc}. Falling back to jittered backoff.")
+            retry_after = None
+        prev_delay = state.prev_delay if state is not None and state.prev_delay > 0 else base_delay
+        delay = min(_RETRY_MAX_DELAY, random.uniform(base_delay, prev_delay * 3))
+        if state is not None:
+            state.prev_delay = delay
+        if retry_after is not None:
+            delay = max(retry_after, delay)
         logger.info(
             f"Retrying request to /chat/completions in {delay:.2f} seconds (Attempt {attempt}/{max_retries})")
         await asyncio.sleep(delay)
@@ -763,6 +1027,28 @@ async def _handle_retry(attempt: int, max_retries: int, base_delay: float, key:
         logger.error(f"Translation failed for key '{key}' after {max_retries} attempts.")
         return False
 
+@functools.lru_cache(maxsize=32)
+def _parse_translations_cached(file_path: str, mtime_ns: int, size: int) -> Mapping[str, str]:
+    """Parse a properties file once per (path, mtime, size) and return a read-only view of its translations."""
+    _, translations = parse_properties_file(file_path)
+    return MappingProxyType(translations)
+
+def load_source_translations(file_path: str) -> Mapping[str, str]:
+    """
+    Return the key/value pairs of a source properties file, parsing it only when it changed.
+
+    Every locale of a project file shares the same source, so the parse is cached keyed
+    by the file's modification time and size. The result is read-only because it is shared.
+
+    Args:
+        file_path (str): The path to the source .properties file.
+
+    Returns:
+        Mapping[str, str]: A read-only mapping of the source translations.
+    """
+    stat_result = os.stat(file_path)
+    return _parse_translations_cached(file_path, stat_result.st_mtime_ns, stat_result.st_size)
+
 def run_pre_translation_validation(target_file_path: str, source_file_path: str) -> Tuple[List[str], Set[str]]:
     """
     Runs a series of validation and preparation checks on a target properties file.
@@ -785,7 +1071,9 @@ def run_pre_translation_validation(target_file_path: str, source_file_path: str)
 
     # 1. Synchronize keys (add missing, remove extra)
     try:
-        missing_keys, _extra_keys = synchronize_keys(target_file_path, source_file_path)
+        missing_keys, _extra_keys, target_translations = synchronize_keys_and_load(
+            target_file_path, source_file_path
+        )
         newly_added_keys = missing_keys
         logger.info(f"Key synchronization complete for '{filename}'.")
     except (IOError, OSError) as e:
@@ -798,21 +1086,28 @@ def run_pre_translation_validation(target_file_path: str, source_file_path: str)
     if encoding_errors:
         errors.extend(encoding_errors)
 
-    # Load file content for placeholder check
+    # Load the source for the placeholder check; the synchronized target was returned above.
     try:
-        # Re-parse the files as they might have been changed by synchronize_keys
-        _, target_translations = parse_properties_file(target_file_path)
-        _, source_translations = parse_properties_file(source_file_path)
+        # The source is never modified, so its cached parse is reused across locales.
+        source_translations = load_source_translations(source_file_path)
     except (IOError, OSError) as e:
         logger.exception("Validation failed for '%s': Could not parse properties file after key sync", filename)
         errors.append(f"Could not parse properties file after key sync: {e}")
         return errors, newly_added_keys
 
     # 3. Check placeholder parity
-    common_keys = set(source_translations.keys()).intersection(set(target_translations.keys()))
-    for key in common_keys:
-        source_value = source_translations.get(key, "")
-        target_value = target_translations.get(key, "")
+    # Walk the smaller mapping and probe the larger one instead of building an intersection set.
+    smaller, larger = (
+        (source_translations, target_translations)
+        if len(source_translations) <= len(target_translations)
+        else (target_translations, source_translations)
+    )
+    for key in smaller:
+        if key not in larger:
+            continue
+        # The key is in both mappings, so index directly.
+        source_value = source_translations[key]
+        target_value = target_translations[key]
         if not check_placeholder_parity(source_value, target_value):
             errors.append(f"Placeholder mismatch for key `{key}`.")
 
@@ -842,55 +1137,38 @@ def run_post_translation_validation(
     is_valid = True
     logger.info(f"Running post-translation validation for '{filename}'...")
 
-    temp_file_path = None
-    try:
-        # Create a temporary file with delete=False to control its lifecycle.
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.properties', encoding='utf-8') as temp_f:
-            temp_file_path = temp_f.name
-            temp_f.write(final_content)
-            temp_f.flush()
-
-        # Now the file is closed, but still exists. We can pass its path to validators.
-
-        # 1. Check encoding and mojibake on the final content
-        encoding_errors = check_encoding_and_mojibake(temp_file_path)
-        if encoding_errors:
-            is_valid = False
-            for error in encoding_errors:
-                logger.error(f"Post-translation validation failed for '{filename}': {error}")
-
-        # 2. Check placeholder parity on the final content
-        try:
-            _, final_translations = parse_properties_file(temp_file_path)
-            common_keys = set(source_translations.keys()).intersection(set(final_translations.keys()))
-            for key in common_keys:
-                source_value = source_translations.get(key, "")
-                target_value = final_translations.get(key, "")
-                if not check_placeholder_parity(source_value, target_value):
-                    is_valid = False
-                    # Extract placeholders for detailed logging
-                    placeholder_regex = re.compile(r'\{([^{}]+)\}')
-                    source_placeholders = placeholder_regex.findall(source_value)
-                    target_placeholders = placeholder_regex.findall(target_value)
-                    logger.error(
-                        f"Post-translation validation failed for '{filename}': Placeholder mismatch for key '{key}'.\n"
-                        f"  Source value: {source_value}\n"
-                        f"  Target value: {target_value}\n"
-                        f"  Source placeholders: {source_placeholders}\n"
-                        f"  Target placeholders: {target_placeholders}"
-                    )
-        except (IOError, OSError):
+    # 1. Check mojibake on the final content (it is already decoded, so UTF-8 validity holds)
+    encoding_errors = check_encoding_and_mojibake_content(final_content, filename)
+    if encoding_errors:
+        is_valid = False
+        for error in encoding_errors:
+            logger.error(f"Post-translation validation failed for '{filename}': {error}")
+
+    # 2. Check placeholder parity on the final content
+    _, final_translations = parse_properties_content(final_content)
+    smaller, larger = (
+        (source_translations, final_translations)
+        if len(source_translations) <= len(final_translations)
+        else (final_translations, source_translations)
+    )
+    for key in smaller:
+        if key not in larger:
+            continue
+        # The key is in both mappings, so index directly.
+        source_value = source_translations[key]
+        target_value = final_translations[key]
+        if not check_placeholder_parity(source_value, target_value):
             is_valid = False
-            logger.exception(
-                "Post-translation validation failed for '%s': Could not parse final properties content", filename)
-
-    finally:
-        # Ensure the temporary file is cleaned up
-        if temp_file_path and os.path.exists(temp_file_path):
-            try:
-                os.remove(temp_file_path)
-            except OSError as _e:
-                logger.warning("Could not delete temporary validation file '%s': %s", temp_file_path, _e)
+            # Extract placeholders for detailed logging
+            source_placeholders = _MSGFMT_PLACEHOLDER_NAME_RE.findall(source_value)
+            target_placeholders = _MSGFMT_PLACEHOLDER_NAME_RE.findall(target_value)
+            logger.error(
+                f"Post-translation validation failed for '{filename}': Placeholder mismatch for key '{key}'.\n"
+                f"  Source value: {source_value}\n"
+                f"  Target value: {target_value}\n"
+                f"  Source placeholders: {source_placeholders}\n"
+                f"  Target placeholders: {target_placeholders}"
+            )
 
     if is_valid:
         logger.info(f"Post-translation validation passed for '{filename}'.")
@@ -938,9 +1216,8 @@ def run_per_key_validation(
             failed_keys.append(key)
 
             # Extract placeholder details for detailed logging
-            placeholder_regex = re.compile(r'\{([^{}]+)\}')
-            source_placeholders = placeholder_regex.findall(source_value)
-            target_placeholders = placeholder_regex.findall(target_value)
+            source_placeholders = _MSGFMT_PLACEHOLDER_NAME_RE.findall(source_value)
+            target_placeholders = _MSGFMT_PLACEHOLDER_NAME_RE.findall(target_value)
 
             logger.warning(
                 f"Key '{key}' failed validation in '{filename}' - reverting to source.\n"
@@ -968,6 +1245,166 @@ def run_per_key_validation(
 
     return valid_translations, failed_keys
 
+# Language-independent part of the translation system prompt. It comes first so that every
+# request shares the same prompt prefix, which provider-side prompt caching can reuse.
+_TRANSLATION_SYSTEM_PROMPT_STATIC = """
+You are an expert translator specializing in software localization. Translate the following text from English to the target language named at the end of these instructions, considering the context and glossary provided.
+
+**Instructions**:
+- **Do not translate or modify placeholder tokens**: Any text enclosed within double underscores `__` (e.g., `__PH_0__`, `__PH_1__`) should remain exactly as is. These represent placeholders like {0}, {1}, or HTML tags.
+- **CRITICAL - Translate ALL other text**: You MUST translate all regular text, even if it appears between, before, or after placeholder tokens. Do not skip text just because it is near placeholders.
+- **Strictly follow all glossaries**:
+  - **Brand/Technical Glossary**: These terms MUST NOT be translated. Preserve their original casing and form.
+  - **Translation Glossary**: These terms are non-negotiable. You MUST use the provided translation, matching the source term case-insensitively.
+- **Preserve formatting**: Keep special characters and formatting such as `\\n` and `\\t`.
+- **Do not add** any additional characters or punctuation (e.g., no square brackets, quotation marks, etc.).
+- **Provide only** the translated text corresponding to the Value.
+- **Do not escape single quotes**: Treat single quotes (') as literal characters. The system will handle necessary escaping.
+
+Use the translations specified in the glossary for the given terms. Ensure the translation reads naturally and is culturally appropriate for the target audience.
+
+**Style and Tone Guidelines**:
+- **Professional and Reassuring**: The tone should be professional, clear, and reassuring. Avoid overly casual or informal language.
+- **No Mixed Languages**: Do not mix English terms with the target language in a single phrase (e.g., "Seed Words Confermati!"). The translation should be fully localized.
+- **Language-Specific Conventions**: Adhere to conventions of the target language.
+
+The translation is for a desktop trading app called Bisq. Keep the translations brief and consistent with typical software terminology. On Bisq, you can buy and sell bitcoin for fiat (or other cryptocurrencies) privately and securely using Bisq's peer-to-peer network and open-source desktop software. "Bisq Easy" is a brand name and should not be translated.
+"""
+
+@functools.cache
+def _translation_system_prompt(target_language: str, style_rules_text: str) -> str:
+    """
+    Build the system prompt for translating into a language.
+
+    The static instructions come first and the language-specific part last, so requests
+    for every language share the same prompt prefix. The prompt only depends on the
+    language, so it is built once per language and reused for every key.
+
+    Args:
+        target_language (str): The target language (e.g., "German").
+        style_rules_text (str): The pre-computed style rules for the language.
+
+    Returns:
+        str: The system prompt.
+    """
+    return f"""{_TRANSLATION_SYSTEM_PROMPT_STATIC}
+**Target Language**: {target_language}
+
+{style_rules_text}
+"""
+
+def _build_translation_prompt_parts(
+        existing_translations: Dict[str, str],
+        source_translations: Dict[str, str],
+        target_language: str,
+        glossary: Dict[str, Dict[str, str]]
+) -> Optional[Tuple[str, str]]:
+    """
+    Build the parts of a translation prompt that do not depend on the texts being translated.
+
+    Args:
+        existing_translations (Dict[str, str]): Existing translations in the target language.
+        source_translations (Dict[str, str]): Source translations (in English).
+        target_language (str): The target language (e.g., "German").
+        glossary (Dict[str, Dict[str, str]]): The glossary.
+
+    Returns:
+        Optional[Tuple[str, str]]: The system prompt and the start of the user prompt (glossaries
+        and context examples), or None if the language is not supported.
+    """
+    # 3) Use language_name_to_code instead of an Enum
+    language_code = language_name_to_code(target_language)
+
+    # If the language isn't recognized, the caller keeps the original text
+    if not language_code:
+        logger.warning(f"Unsupported or unrecognized language: {target_language}")
+        return None
+
+    # Get the glossary for the current language
+    language_glossary = glossary.get(language_code, {})
+
+    # Get pre-computed language-specific style rules
+    style_rules_text = PRECOMPUTED_STYLE_RULES_TEXT.get(language_code, "")
+
+    # Build the context and glossary text
+    context_examples_text, glossary_text = build_context(
+        existing_translations,
+        source_translations,
+        language_glossary,
+        MAX_MODEL_TOKENS,
+        MODEL_NAME
+    )
+
+    system_prompt = _translation_system_prompt(target_language, style_rules_text)
+    user_prompt_prefix = (
+        f"{_TRANSLATION_PROMPT_PREFIX}{glossary_text}\n"
+        "\n"
+        "**Context (Existing Translations):**\n"
+        f"{context_examples_text}\n"
+        "\n"
+    )
+    return system_prompt, user_prompt_prefix
+
+def _build_translation_messages(
+        text: str,
+        key: str,
+        existing_translations: Dict[str, str],
+        source_translations: Dict[str, str],
+        target_language: str,
+        glossary: Dict[str, Dict[str, str]],
+        prompt_parts: Optional[Tuple[str, str]] = None
+) -> Optional[Tuple[List[Dict[str, str]], Dict[str, str]]]:
+    """
+    Build the chat messages used to translate a single text.
+
+    Args:
+        text (str): The text to translate.
+        key (str): The key associated with the text.
+        existing_translations (Dict[str, str]): Existing translations in the target language.
+        source_translations (Dict[str, str]): Source translations (in English).
+        target_language (str): The target language (e.g., "German").
+        glossary (Dict[str, Dict[str, str]]): The glossary.
+        prompt_parts (Optional[Tuple[str, str]]): The system prompt and user prompt prefix from
+            _build_translation_prompt_parts, if the caller already built them for this file.
+
+    Returns:
+        Optional[Tuple[List[Dict[str, str]], Dict[str, str]]]: The messages and the placeholder
+        mapping needed to restore the reply, or None if the language is not supported.
+    """
+    if prompt_parts is None:
+        prompt_parts = _build_translation_prompt_parts(
+            existing_translations, source_translations, target_language, glossary
+        )
+    if prompt_parts is None:
+        return None
+    system_prompt, user_prompt_prefix = prompt_parts
+
+    # Extract and protect placeholders
+    processed_text, placeholder_mapping = extract_placeholders(text)
+
+    messages = [
+        ChatCompletionSystemMessageParam(role="system", content=system_prompt),
+        ChatCompletionUserMessageParam(role="user", content=(
+            f"{user_prompt_prefix}"
+            "**Text to Translate:**\n"
+            f"Key: {key}\n"
+            f"Value: {processed_text}\n"
+            "\n"
+            "Provide the translation **of the Value only**, following the instructions above.\n"
+        ))
+    ]
+    return messages, placeholder_mapping
+
+def _finalize_translation(msg_content: str, original_text: str, placeholder_mapping: Dict[str, str]) -> str:
+    """Restore placeholders in and clean up a model reply for a single text."""
+    translated_text = msg_content.strip()
+
+    # Restore placeholders in the translated text
+    translated_text = restore_placeholders(translated_text, placeholder_mapping)
+
+    # Clean the translated text
+    return clean_translated_text(translated_text, original_text)
+
 async def translate_text_async(
         text: str,
         key: str,
@@ -977,7 +1414,8 @@ async def translate_text_async(
         glossary: Dict[str, Dict[str, str]],
         semaphore: asyncio.Semaphore,
         rate_limiter: AsyncLimiter,
-        index: int
+        index: int,
+        prompt_parts: Optional[Tuple[str, str]] = None
 ) -> Tuple[int, str]:
     """
     Asynchronously translate a single text with context.
@@ -992,6 +1430,8 @@ async def translate_text_async(
         semaphore (asyncio.Semaphore): A semaphore to limit concurrent API calls.
         rate_limiter (AsyncLimiter): A rate limiter to control the rate of API calls.
         index (int): The index of the text in the original list.
+        prompt_parts (Optional[Tuple[str, str]]): The system prompt and user prompt prefix from
+            _build_translation_prompt_parts, if the caller already built them for this file.
 
     Returns:
         Tuple[int, str]: The index and the translated text.
@@ -1004,151 +1444,575 @@ async def translate_text_async(
         logger.error("OpenAI client is None. Cannot proceed with translation.")
         return index, text
 
-    async with semaphore, rate_limiter:
-        # 3) Use language_name_to_code instead of an Enum
-        language_code = language_name_to_code(target_language)
+    built = _build_translation_messages(
+        text,
+        key,
+        existing_translations,
+        source_translations,
+        target_language,
+        glossary,
+        prompt_parts
+    )
+    if built is None:
+        return index, text
+    messages, placeholder_mapping = built
 
-        # If the language isn't recognized, just return original text
-        if not language_code:
-            logger.warning(f"Unsupported or unrecognized language: {target_language}")
-            return index, text
+    cache_parts = _translation_cache_parts(messages[0]["content"], target_language, glossary, text)
+    msg_content = await _request_translation(messages, key, semaphore, rate_limiter, cache_parts)
+    if msg_content is None:
+        return index, text
+    translated_text = _finalize_translation(msg_content, text, placeholder_mapping)
 
-        # Get the glossary for the current language
-        language_glossary = glossary.get(language_code, {})
+    logger.debug(f"Translated key '{key}' successfully.")
+    return index, translated_text
 
-        # Get pre-computed language-specific style rules
-        style_rules_text = PRECOMPUTED_STYLE_RULES_TEXT.get(language_code, "")
+@functools.lru_cache(maxsize=32)
+def _glossary_digest(glossary_items: Tuple[Tuple[str, str], ...]) -> str:
+    """Return a digest of a language glossary's (term, translation) pairs."""
+    return make_cache_key(*(part for item in glossary_items for part in item))
 
-        # Build the context and glossary text
-        context_examples_text, glossary_text = build_context(
-            existing_translations,
-            source_translations,
-            language_glossary,
-            MAX_MODEL_TOKENS,
-            MODEL_NAME
+def _translation_cache_parts(
+        system_prompt: str,
+        target_language: str,
+        glossary: Dict[str, Dict[str, str]],
+        source_text: str
+) -> Optional[Tuple[str, ...]]:
+    """
+    Return what identifies a translation reply in the response cache, or None without a cache.
+
+    The context examples taken from the target file are left out: they change whenever a run
+    writes translations back, which would make cached replies miss on every re-run. The brand
+    glossary is part of the static user prompt prefix, which is included.
+
+    Args:
+        system_prompt (str): The system prompt of the request.
+        target_language (str): The target language (e.g., "German").
+        glossary (Dict[str, Dict[str, str]]): The glossary.
+        source_text (str): The text (or numbered texts) being translated.
+
+    Returns:
+        Optional[Tuple[str, ...]]: The cache key parts.
+    """
+    if _get_response_cache() is None:
+        return None
+    language_glossary = glossary.get(language_name_to_code(target_language) or "", {})
+    return (
+        system_prompt,
+        _TRANSLATION_PROMPT_PREFIX,
+        target_language,
+        _glossary_digest(tuple(language_glossary.items())),
+        source_text
+    )
+
+async def _request_translation(
+        messages: List[Dict[str, str]],
+        key: str,
+        semaphore: asyncio.Semaphore,
+        rate_limiter: AsyncLimiter,
+        cache_parts: Optional[Tuple[str, ...]] = None,
+        is_valid_reply: Optional[Callable[[str], bool]] = None
+) -> Optional[str]:
+    """
+    Send a translation request and return the model's reply, retrying API errors.
+
+    Requests with the same model and cache parts get the same reply, so a cached reply
+    is reused instead of calling the API again. Only replies the caller accepts are cached.
+
+    Args:
+        messages (List[Dict[str, str]]): The chat messages to send.
+        key (str): The key (or keys) being translated, for log messages.
+        semaphore (asyncio.Semaphore): A semaphore to limit concurrent API calls.
+        rate_limiter (AsyncLimiter): A rate limiter to control the rate of API calls.
+        cache_parts (Optional[Tuple[str, ...]]): The response cache key parts from
+            _translation_cache_parts; without them the cache is not used.
+        is_valid_reply (Optional[Callable[[str], bool]]): Checks whether the caller can use a
+            reply. Rejected replies are returned but not cached, and cached ones are not reused.
+
+    Returns:
+        Optional[str]: The reply content, or None if no usable reply was received.
+    """
+    response_cache = _get_response_cache()
+    cache_key = None
+    if response_cache is not None and cache_parts is not None:
+        cache_key = make_cache_key("translate", MODEL_NAME, *cache_parts)
+        cached_content = response_cache.get(cache_key)
+        if cached_content is not None and (is_valid_reply is None or is_valid_reply(cached_content)):
+            logger.debug(f"Using cached translation for key '{key}'.")
+            return cached_content
+
+    max_retries = 5
+    base_delay = 1
+    retry_state = RetryState()
+
+    for attempt in range(1, max_retries + 1):  # type: ignore[arg-type]
+        try:
+            # Use chat completion API
+            async with semaphore, rate_limiter:
+                response = await client.chat.completions.create(
+                    model=MODEL_NAME,
+                    messages=messages,
+                    temperature=0.3,
+                    timeout=60.0,
+                )
+
+            msg_content = response.choices[0].message.content
+            if not msg_content:
+                logger.warning("Empty assistant content for key '%s'; keeping original text.", key)
+                return None
+            if cache_key is not None and (is_valid_reply is None or is_valid_reply(msg_content)):
+                response_cache.set(cache_key, msg_content)
+            return msg_content
+
+        except (RateLimitError, APITimeoutError, APIConnectionError, APIStatusError, OpenAIError) as api_exc:
+            logger.error(f"API error occurred: {api_exc.__class__.__name__} - {api_exc}")
+            should_retry = await _handle_retry(attempt, max_retries, base_delay, key, api_exc, retry_state)
+            if should_retry:
+                continue
+            else:
+                return None
+        except Exception:
+            logger.exception("An unexpected error occurred.")
+            return None
+
+    # Fallback return statement to satisfy linters and ensure explicit return
+    logger.warning(
+        f"Translation loop for key '{key}' completed without an explicit return within the loop. "
+        f"This shouldn't happen with current logic. Returning original text."
+    )
+    return None
+
+# A multi-key request is closed early once its texts reach this many characters.
+_TRANSLATION_BATCH_MAX_CHARS = 4000
+# The numbered texts of a multi-key request, and of its reply, are separated by this line.
+_TRANSLATION_BATCH_SEPARATOR = "%%"
+_TRANSLATION_BATCH_SPLIT_RE = re.compile(r'\n[ \t]*%%[ \t]*\n')
+_TRANSLATION_BATCH_ITEM_RE = re.compile(r'(\d+)[ \t]+(.*)', re.DOTALL)
+
+def _chunk_translation_items(
+        items: List[Tuple[int, str, str]],
+        max_keys: int,
+        max_chars: int
+) -> List[List[Tuple[int, str, str]]]:
+    """
+    Group texts to translate into chunks that are sent in one request each.
+
+    A chunk is closed once it holds max_keys texts or adding the next text would take it
+    past max_chars characters. A text longer than max_chars gets a chunk of its own.
+
+    Args:
+        items (List[Tuple[int, str, str]]): (index, text, key) triples to translate.
+        max_keys (int): The maximum number of texts per chunk.
+        max_chars (int): The maximum combined text length per chunk.
+
+    Returns:
+        List[List[Tuple[int, str, str]]]: The chunks, in the original order.
+    """
+    chunks: List[List[Tuple[int, str, str]]] = []
+    current: List[Tuple[int, str, str]] = []
+    current_chars = 0
+    for item in items:
+        text_chars = len(item[1])
+        if current and (len(current) >= max_keys or current_chars + text_chars > max_chars):
+            chunks.append(current)
+            current = []
+            current_chars = 0
+        current.append(item)
+        current_chars += text_chars
+    if current:
+        chunks.append(current)
+    return chunks
+
+def _parse_multi_translation_reply(reply: str, expected_count: int) -> Optional[List[str]]:
+    """
+    Split a multi-key translation reply into its numbered translations.
+
+    Args:
+        reply (str): The model reply.
+        expected_count (int): The number of texts that were sent.
+
+    Returns:
+        Optional[List[str]]: The translations in order, or None if the reply does not hold
+        exactly one correctly numbered translation per text.
+    """
+    parts = _TRANSLATION_BATCH_SPLIT_RE.split(reply.strip())
+    if len(parts) != expected_count:
+        return None
+    translations = []
+    for number, part in enumerate(parts, 1):
+        match = _TRANSLATION_BATCH_ITEM_RE.fullmatch(part.strip())
+        if match is None or int(match.group(1)) != number:
+            return None
+        translations.append(match.group(2))
+    return translations
+
+async def translate_texts_multi_async(
+        items: List[Tuple[int, str, str]],
+        existing_translations: Dict[str, str],
+        source_translations: Dict[str, str],
+        target_language: str,
+        glossary: Dict[str, Dict[str, str]],
+        semaphore: asyncio.Semaphore,
+        rate_limiter: AsyncLimiter,
+        prompt_parts: Optional[Tuple[str, str]] = None
+) -> Dict[int, str]:
+    """
+    Asynchronously translate several texts with a single chat completion.
+
+    The system prompt, glossaries and context examples are sent once for all texts. The
+    texts are numbered and separated by '%%' lines, and the reply must use the same layout.
+    If it does not hold exactly one translation per text, nothing is returned so the caller
+    can fall back to translate_text_async.
+
+    Args:
+        items (List[Tuple[int, str, str]]): (index, text, key) triples to translate.
+        existing_translations (Dict[str, str]): Existing translations in the target language.
+        source_translations (Dict[str, str]): Source translations (in English).
+        target_language (str): The target language (e.g., "German").
+        glossary (Dict[str, Dict[str, str]]): The glossary.
+        semaphore (asyncio.Semaphore): A semaphore to limit concurrent API calls.
+        rate_limiter (AsyncLimiter): A rate limiter to control the rate of API calls.
+        prompt_parts (Optional[Tuple[str, str]]): The system prompt and user prompt prefix from
+            _build_translation_prompt_parts, if the caller already built them for this file.
+
+    Returns:
+        Dict[int, str]: Translated texts keyed by their index.
+    """
+    if DRY_RUN or client is None or not items:
+        return {}
+
+    if prompt_parts is None:
+        prompt_parts = _build_translation_prompt_parts(
+            existing_translations, source_translations, target_language, glossary
         )
+    if prompt_parts is None:
+        return {}
+    system_prompt, user_prompt_prefix = prompt_parts
 
-        # Extract and protect placeholders
-        processed_text, placeholder_mapping = extract_placeholders(text)
+    # Placeholder tokens only need to be unique per text; each reply part is restored with its own mapping.
+    protected_texts = [extract_placeholders(text) for _, text, _ in items]
+    numbered_texts = f"\n{_TRANSLATION_BATCH_SEPARATOR}\n".join(
+        f"{number}\t(Key: {key}) {processed_text}"
+        for number, ((_, _, key), (processed_text, _)) in enumerate(zip(items, protected_texts), 1)
+    )
+    messages = [
+        ChatCompletionSystemMessageParam(role="system", content=system_prompt),
+        ChatCompletionUserMessageParam(role="user", content=(
+            f"{user_prompt_prefix}"
+            "**Texts to Translate:**\n"
+            "Each entry starts with its number and a tab, followed by its key in parentheses and the Value. "
+            f"Entries are separated by a line containing only `{_TRANSLATION_BATCH_SEPARATOR}`.\n"
+            "\n"
+            f"{numbered_texts}\n"
+            "\n"
+            f"Translate the Value of every entry, following the instructions above. Reply with exactly {len(items)} "
+            "entries in the same order, each as its number, a tab and the translated Value only (without the key), "
+            f"separated by lines containing only `{_TRANSLATION_BATCH_SEPARATOR}`.\n"
+        ))
+    ]
 
-        system_prompt = f"""
-You are an expert translator specializing in software localization. Translate the following text from English to {target_language}, considering the context and glossary provided.
+    keys_label = ", ".join(key for _, _, key in items)
+    cache_parts = _translation_cache_parts(system_prompt, target_language, glossary, numbered_texts)
+    msg_content = await _request_translation(
+        messages,
+        keys_label,
+        semaphore,
+        rate_limiter,
+        cache_parts,
+        lambda reply: _parse_multi_translation_reply(reply, len(items)) is not None
+    )
+    if msg_content is None:
+        return {}
+    translations = _parse_multi_translation_reply(msg_content, len(items))
+    if translations is None:
+        logger.warning(
+            f"Reply for {len(items)} keys did not contain one translation per key; translating them one by one."
+        )
+        return {}
 
-**Instructions**:
-- **Do not translate or modify placeholder tokens**: Any text enclosed within double underscores `__` (e.g., `__PH_abc123__`) should remain exactly as is. These represent placeholders like {{0}}, {{1}}, or HTML tags.
-- **CRITICAL - Translate ALL other text**: You MUST translate all regular text, even if it appears between, before, or after placeholder tokens. Do not skip text just because it is near placeholders.
-- **Strictly follow all glossaries**:
-  - **Brand/Technical Glossary**: These terms MUST NOT be translated. Preserve their original casing and form.
-  - **Translation Glossary**: These terms are non-negotiable. You MUST use the provided translation, matching the source term case-insensitively.
-- **Preserve formatting**: Keep special characters and formatting such as `\\n` and `\\t`.
-- **Do not add** any additional characters or punctuation (e.g., no square brackets, quotation marks, etc.).
-- **Provide only** the translated text corresponding to the Value.
-- **Do not escape single quotes**: Treat single quotes (') as literal characters. The system will handle necessary escaping.
+    logger.debug(f"Translated {len(items)} keys in one request.")
+    return {
+        index: _finalize_translation(translation, text, placeholder_mapping)
+        for (index, text, _), translation, (_, placeholder_mapping) in zip(items, translations, protected_texts)
+    }
 
-Use the translations specified in the glossary for the given terms. Ensure the translation reads naturally and is culturally appropriate for the target audience.
+async def _translation_worker(
+        queue: asyncio.Queue,
+        futures: List[asyncio.Future],
+        existing_translations: Dict[str, str],
+        source_translations: Dict[str, str],
+        target_language: str,
+        glossary: Dict[str, Dict[str, str]],
+        semaphore: asyncio.Semaphore,
+        rate_limiter: AsyncLimiter,
+        prompt_parts: Optional[Tuple[str, str]] = None
+) -> None:
+    """
+    Translate queued chunks of texts until the queue is empty.
+
+    The queue is filled before the workers start, so a worker finishes as soon as it
+    finds the queue empty. A chunk of several texts is sent as one request first; texts
+    that request does not translate are then sent one by one. Each result resolves the
+    future at the text's index.
+
+    Args:
+        queue (asyncio.Queue): Chunks (lists) of (index, text, key) triples waiting for translation.
+        futures (List[asyncio.Future]): Futures resolved with (index, translated_text).
+        existing_translations (Dict[str, str]): Existing translations in the target language.
+        source_translations (Dict[str, str]): Source translations (in English).
+        target_language (str): The target language (e.g., "German").
+        glossary (Dict[str, Dict[str, str]]): The glossary.
+        semaphore (asyncio.Semaphore): A semaphore to limit concurrent API calls.
+        rate_limiter (AsyncLimiter): A rate limiter to control the rate of API calls.
+        prompt_parts (Optional[Tuple[str, str]]): The system prompt and user prompt prefix from
+            _build_translation_prompt_parts, if the caller already built them for this file.
+    """
+    while True:
+        try:
+            chunk = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        try:
+            chunk_results: Dict[int, str] = {}
+            if len(chunk) > 1:
+                try:
+                    chunk_results = await translate_texts_multi_async(
+                        chunk,
+                        existing_translations,
+                        source_translations,
+                        target_language,
+                        glossary,
+                        semaphore,
+                        rate_limiter,
+                        prompt_parts
+                    )
+                except Exception:
+                    logger.exception("Multi-key translation failed, translating keys one by one.")
+            for index, text, key in chunk:
+                future = futures[index]
+                if future.done():
+                    continue
+                if index in chunk_results:
+                    future.set_result((index, chunk_results[index]))
+                    continue
+                try:
+                    result = await translate_text_async(
+                        text,
+                        key,
+                        existing_translations,
+                        source_translations,
+                        target_language,
+                        glossary,
+                        semaphore,
+                        rate_limiter,
+                        index,
+                        prompt_parts
+                    )
+                except Exception as exc:  # noqa: BLE001 - any failure must reach the awaiting future
+                    if not future.done():
+                        future.set_exception(exc)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            queue.task_done()
+
+def _copy_translation_result(target: asyncio.Future, index: int, source: asyncio.Future) -> None:
+    """
+    Resolve the future of a duplicate text with the translation of the text it duplicates.
+
+    Args:
+        target (asyncio.Future): The future of the duplicate text.
+        index (int): The index of the duplicate text.
+        source (asyncio.Future): The completed future of the translated text.
+    """
+    if target.done():
+        return
+    if source.cancelled():
+        target.cancel()
+    elif source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result((index, source.result()[1]))
 
-**Style and Tone Guidelines**:
-- **Professional and Reassuring**: The tone should be professional, clear, and reassuring. Avoid overly casual or informal language.
-- **No Mixed Languages**: Do not mix English terms with the target language in a single phrase (e.g., "Seed Words Confermati!"). The translation should be fully localized.
-- **Language-Specific Conventions**: Adhere to conventions of the target language.
+# Batch API polling backoff bounds, in seconds.
+_BATCH_POLL_INITIAL_DELAY = 5.0
+_BATCH_POLL_MAX_DELAY = 60.0
+# Give up on a batch (and cancel it) after this long, well before the 24h completion window.
+_BATCH_POLL_TIMEOUT = 6 * 3600.0
+# Consecutive failed status checks tolerated before the batch is abandoned.
+_BATCH_RETRIEVE_MAX_RETRIES = 3
+_BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
 
-{style_rules_text}
+async def _cancel_batch(batch_id: str) -> None:
+    """
+    Cancel a batch that is abandoned, so its requests are not processed (and billed) as well.
 
-The translation is for a desktop trading app called Bisq. Keep the translations brief and consistent with typical software terminology. On Bisq, you can buy and sell bitcoin for fiat (or other cryptocurrencies) privately and securely using Bisq's peer-to-peer network and open-source desktop software. "Bisq Easy" is a brand name and should not be translated.
-"""
+    Args:
+        batch_id (str): The ID of the batch to cancel.
+    """
+    try:
+        await client.batches.cancel(batch_id)
+        logger.info(f"Cancelled batch '{batch_id}'.")
+    except OpenAIError as cancel_exc:
+        logger.warning(f"Could not cancel batch '{batch_id}': {cancel_exc}")
 
-        brand_glossary_text = '\n'.join(f"- {term}" for term in dict.fromkeys(BRAND_GLOSSARY))
-        prompt = """
-**Brand/Technical Glossary (Do NOT translate these terms):**
-{brand_glossary_text}
+async def translate_texts_batch(
+        items: List[Tuple[int, str, str]],
+        existing_translations: Dict[str, str],
+        source_translations: Dict[str, str],
+        target_language: str,
+        glossary: Dict[str, Dict[str, str]]
+) -> Dict[int, str]:
+    """
+    Translate many texts through a single OpenAI Batch API job.
 
-**Translation Glossary:**
-{glossary_text}
+    All requests of a file are submitted at once and processed outside the real-time
+    rate limits at a lower price. Texts whose result is missing or failed are left out
+    of the returned mapping so the caller can fall back to translate_text_async.
 
-**Context (Existing Translations):**
-{context_examples_text}
+    Args:
+        items (List[Tuple[int, str, str]]): (index, text, key) triples to translate.
+        existing_translations (Dict[str, str]): Existing translations in the target language.
+        source_translations (Dict[str, str]): Source translations (in English).
+        target_language (str): The target language (e.g., "German").
+        glossary (Dict[str, Dict[str, str]]): The glossary.
 
-**Text to Translate:**
-Key: {key}
-Value: {processed_text}
+    Returns:
+        Dict[int, str]: Translated texts keyed by their index.
+    """
+    if DRY_RUN or client is None or not items:
+        return {}
 
-Provide the translation **of the Value only**, following the instructions above.
-"""
+    # The glossary and context part of the prompt is the same for every text of the file.
+    prompt_parts = _build_translation_prompt_parts(
+        existing_translations, source_translations, target_language, glossary
+    )
+    if prompt_parts is None:
+        return {}
 
-        max_retries = 5
-        base_delay = 1
+    request_lines: List[bytes] = []
+    pending: Dict[str, Tuple[int, str, Dict[str, str]]] = {}
+    for index, text, key in items:
+        built = _build_translation_messages(
+            text,
+            key,
+            existing_translations,
+            source_translations,
+            target_language,
+            glossary,
+            prompt_parts
+        )
+        if built is None:
+            continue
+        messages, placeholder_mapping = built
+        # Keys are unique within a file, so they identify each result directly.
+        custom_id = key
+        pending[custom_id] = (index, text, placeholder_mapping)
+        request_lines.append(orjson.dumps({
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": {"model": MODEL_NAME, "messages": messages, "temperature": 0.3}
+        }))
+
+    if not request_lines:
+        return {}
 
-        for attempt in range(1, max_retries + 1):  # type: ignore[arg-type]
-            try:
-                # Use chat completion API
-                response = await client.chat.completions.create(
-                    model=MODEL_NAME,
-                    messages=[
-                        ChatCompletionSystemMessageParam(role="system", content=system_prompt),
-                        ChatCompletionUserMessageParam(role="user", content=prompt.format(
-                            brand_glossary_text=brand_glossary_text,
-                            glossary_text=glossary_text,
-                            context_examples_text=context_examples_text,
-                            key=key,
-                            processed_text=processed_text
-                        ))
-                    ],
-                    temperature=0.3,
-                    timeout=60.0,
+    batch = None
+    try:
+        batch_input = b"\n".join(request_lines) + b"\n"
+        input_file = await client.files.create(file=("translation_batch.jsonl", batch_input), purpose="batch")
+        batch = await client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted batch '{batch.id}' with {len(request_lines)} translation requests.")
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _BATCH_POLL_TIMEOUT
+        delay = _BATCH_POLL_INITIAL_DELAY
+        retrieve_attempt = 0
+        retry_state = RetryState()
+        while batch.status not in _BATCH_TERMINAL_STATUSES:
+            if loop.time() >= deadline:
+                logger.warning(
+                    f"Batch '{batch.id}' did not finish within {_BATCH_POLL_TIMEOUT:.0f} seconds; "
+                    f"falling back to per-key requests."
                 )
+                await _cancel_batch(batch.id)
+                return {}
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _BATCH_POLL_MAX_DELAY)
+            try:
+                batch = await client.batches.retrieve(batch.id)
+                retrieve_attempt = 0
+            except (RateLimitError, APITimeoutError, APIConnectionError, APIStatusError, OpenAIError) as api_exc:
+                # A failed status check says nothing about the batch itself, so check again.
+                retrieve_attempt += 1
+                logger.warning(f"Could not check status of batch '{batch.id}': {api_exc}")
+                if not await _handle_retry(retrieve_attempt, _BATCH_RETRIEVE_MAX_RETRIES, _BATCH_POLL_INITIAL_DELAY,
+                                           f"batch {batch.id}", api_exc, retry_state):
+                    raise
+
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.warning(f"Batch '{batch.id}' ended with status '{batch.status}'; falling back to per-key requests.")
+            return {}
 
-                msg_content = response.choices[0].message.content
-                if not msg_content:
-                    logger.warning("Empty assistant content for key '%s'; keeping original text.", key)
-                    return index, text
-                translated_text = msg_content.strip()
-
-                # Restore placeholders in the translated text
-                translated_text = restore_placeholders(translated_text, placeholder_mapping)
+        output = await client.files.content(batch.output_file_id)
+        output_text = output.text
+    except (RateLimitError, APITimeoutError, APIConnectionError, APIStatusError, OpenAIError) as api_exc:
+        logger.error(f"Batch API error occurred: {api_exc.__class__.__name__} - {api_exc}")
+        if batch is not None and batch.status not in _BATCH_TERMINAL_STATUSES:
+            await _cancel_batch(batch.id)
+        return {}
+    except Exception:
+        logger.exception("An unexpected error occurred during batch translation.")
+        if batch is not None and batch.status not in _BATCH_TERMINAL_STATUSES:
+            await _cancel_batch(batch.id)
+        return {}
 
-                # Clean the translated text
-                translated_text = clean_translated_text(translated_text, text)
+    results: Dict[int, str] = {}
+    for line in output_text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = orjson.loads(line)
+            index, text, placeholder_mapping = pending[record["custom_id"]]
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            msg_content = response["body"]["choices"][0]["message"]["content"]
+        except (ValueError, KeyError, IndexError, TypeError):
+            logger.warning("Skipping unreadable batch result line.")
+            continue
+        if msg_content:
+            results[index] = _finalize_translation(msg_content, text, placeholder_mapping)
 
-                logger.debug(f"Translated key '{key}' successfully.")
-                return index, translated_text
+    logger.info(f"Batch '{batch.id}' returned {len(results)} of {len(request_lines)} translations.")
+    return results
 
-            except (RateLimitError, APITimeoutError, APIConnectionError, APIStatusError, OpenAIError) as api_exc:
-                logger.error(f"API error occurred: {api_exc.__class__.__name__} - {api_exc}")
-                should_retry = await _handle_retry(attempt, max_retries, base_delay, key, api_exc)
-                if should_retry:
-                    continue
-                else:
-                    return index, text
-            except Exception as general_exc:
-                logger.error(f"An unexpected error occurred: {general_exc}", exc_info=True)
-                return index, text
+def _render_pairs(keys: List[str], values: Mapping[str, str]) -> str:
+    """
+    Render keys and their values as 'key=value' lines for a review prompt.
 
-        # Fallback return statement to satisfy linters and ensure explicit return
-        logger.warning(
-            f"Translation loop for key '{key}' completed without an explicit return within the loop. "
-            f"This shouldn't happen with current logic. Returning original text."
-        )
-        return index, text
+    Args:
+        keys (List[str]): The keys to render, in order.
+        values (Mapping[str, str]): The values by key; missing keys render as empty.
 
-def _build_holistic_review_system_prompt(
-        target_language: str,
-        keys_to_review: List[str],
-        source_content: str,
-        translated_content: str,
-        style_rules_text: str  # Pass pre-computed rules
-) -> str:
-    """Builds the system prompt for the holistic review API call."""
-    keys_to_review_text = "\n".join([f"- {k}" for k in keys_to_review])
+    Returns:
+        str: The newline-joined 'key=value' lines.
+    """
+    return "\n".join(f"{key}={values.get(key, '')}" for key in keys)
 
-    return f"""
-You are a lead editor and quality assurance specialist for software localization. Your task is to review a list of newly translated keys within a `.properties` file for {target_language}. You are given the full source and translated files for context, but you MUST only review and return the keys specified.
+# Language- and content-independent start of the review prompt. Everything specific to a
+# review follows it, so all review requests share this prefix for provider-side prompt caching.
+_HOLISTIC_REVIEW_PROMPT_STATIC = """
+You are a lead editor and quality assurance specialist for software localization. Your task is to review a list of newly translated keys within a `.properties` file for the target language named below. You are given the full source and translated files for context, but you MUST only review and return the keys specified.
 
 **Critical Instructions**:
-1.  **Strictly Limited Scope**: You MUST only review and provide corrected translations for the following keys. Do NOT output any other keys in your final JSON.
-    ```
-    {keys_to_review_text}
-    ```
-2.  **CRITICAL - Placeholder Protection**: You will see placeholder tokens in the format `__PH_abc123__`. These represent dynamic values like {{0}}, {{1}}, HTML tags, etc.
+1.  **Strictly Limited Scope**: You MUST only review and provide corrected translations for the keys listed under "Keys to Review" below. Do NOT output any other keys in your final JSON.
+2.  **CRITICAL - Placeholder Protection**: You will see placeholder tokens in the format `__PH_S0__` (source file) and `__PH_T0__` (translated file). These represent dynamic values like {0}, {1}, HTML tags, etc.
     - DO NOT translate, modify, remove, or duplicate these tokens
     - DO NOT add new placeholder tokens
     - Maintain EXACT 1:1 correspondence with source placeholders
@@ -1156,33 +2020,62 @@ You are a lead editor and quality assurance specialist for software localization
 3.  **CRITICAL - Translate ALL Other Text**: You MUST ensure that ALL regular text (text that is NOT a placeholder token) is properly translated, even if it appears between, before, or after placeholder tokens. Do not leave any translatable text untranslated just because it is near placeholders.
 4.  **Apply All Quality Rules**: Meticulously apply the language-specific quality checklist to every key in your scope.
 5.  **Do Not Escape Single Quotes**: The system will handle all necessary escaping for Java `MessageFormat`. Return single quotes (') as literal characters in the JSON values.
-6.  **Output JSON Only**: Your final output **must** be a single, valid JSON object that adheres to the required schema. This object should contain ONLY the keys listed in the "Strictly Limited Scope" section above, with their final, corrected translations as the values.
+6.  **Output JSON Only**: Your final output **must** be a single, valid JSON object that adheres to the required schema. This object should contain ONLY the keys listed under "Keys to Review", with their final, corrected translations as the values.
 7.  **Do Not Add Explanations**: Do not output any text, markdown, or explanations before or after the JSON object.
 
-{style_rules_text}
-
 **JSON Output Example**:
 ```json
-{{
+{
   "key.one": "Corrected translation for key one.",
   "key.two": "Corrected translation for key two."
-}}
+}
 ```
+"""
 
-**Review Request**:
-Return a JSON object containing the fully corrected translations for the following files.
+@functools.cache
+def _holistic_review_prompt_header(target_language: str, style_rules_text: str) -> str:
+    """
+    Build the part of the review prompt that is shared by every chunk of a language.
 
-**Source (English) File**:
-```properties
-{source_content}
-```
+    Args:
+        target_language (str): The target language (e.g., "German").
+        style_rules_text (str): The pre-computed style rules for the language.
+
+    Returns:
+        str: The static instructions followed by the language and its style rules.
+    """
+    return f"""{_HOLISTIC_REVIEW_PROMPT_STATIC}
+**Target Language**: {target_language}
 
-**Translated ({target_language}) File to Review**:
-```properties
-{translated_content}
+{style_rules_text}
+
+**Keys to Review**:
 ```
 """
 
+def _build_holistic_review_system_prompt(
+        target_language: str,
+        keys_to_review: List[str],
+        source_content: str,
+        translated_content: str,
+        style_rules_text: str  # Pass pre-computed rules
+) -> str:
+    """Builds the system prompt for the holistic review API call."""
+    # Only the chunk-specific parts are rebuilt; the header is cached per language.
+    return "".join((
+        _holistic_review_prompt_header(target_language, style_rules_text),
+        "\n".join(f"- {k}" for k in keys_to_review),
+        (
+            "\n```\n\n**Review Request**:\n"
+            "Return a JSON object containing the fully corrected translations for the following files.\n\n"
+            "**Source (English) File**:\n```properties\n"
+        ),
+        source_content,
+        f"\n```\n\n**Translated ({target_language}) File to Review**:\n```properties\n",
+        translated_content,
+        "\n```\n",
+    ))
+
 async def holistic_review_async(
         source_content: str,
         translated_content: str,
@@ -1217,99 +2110,124 @@ async def holistic_review_async(
         return {}
 
     # Protect placeholders in both source and translated content before sending to AI
-    protected_source, source_placeholder_map = protect_placeholders_in_properties(source_content)
-    protected_translated, translated_placeholder_map = protect_placeholders_in_properties(translated_content)
+    # Distinct prefixes keep the two mappings apart: the reviewer may copy a token from either file.
+    protected_source, source_placeholder_map = protect_placeholders_in_properties(source_content, "S")
+    protected_translated, translated_placeholder_map = protect_placeholders_in_properties(translated_content, "T")
 
     logger.debug(f"Protected {len(source_placeholder_map)} placeholders in source content")
     logger.debug(f"Protected {len(translated_placeholder_map)} placeholders in translated content")
 
-    async with semaphore, rate_limiter:
-        review_system_prompt = _build_holistic_review_system_prompt(
-            target_language=target_language,
-            keys_to_review=keys_to_review,
-            source_content=protected_source,
-            translated_content=protected_translated,
-            style_rules_text=style_rules_text
-        )
-        max_retries = 3
-        base_delay = 5  # Longer delay for a potentially larger task
-        for attempt in range(1, max_retries + 1):
-            try:
-                response = await client.chat.completions.create(
-                    model=REVIEW_MODEL_NAME,
-                    messages=[
-                        ChatCompletionSystemMessageParam(role="system", content=review_system_prompt)
-                    ],
-                    temperature=0.1,
-                    response_format={"type": "json_object"},
-                    max_tokens=8192,  # Increased to handle larger review responses
-                    timeout=120.0,
-                )
+    review_system_prompt = _build_holistic_review_system_prompt(
+        target_language=target_language,
+        keys_to_review=keys_to_review,
+        source_content=protected_source,
+        translated_content=protected_translated,
+        style_rules_text=style_rules_text
+    )
+    # A cached review was validated before it was stored, so it is parsed like a fresh reply.
+    response_cache = _get_response_cache()
+    cache_key = None
+    cached_response = None
+    if response_cache is not None:
+        cache_key = make_cache_key("review", REVIEW_MODEL_NAME, review_system_prompt)
+        cached_response = response_cache.get(cache_key)
+
+    max_retries = 3
+    base_delay = 5  # Longer delay for a potentially larger task
+    retry_state = RetryState()
+    for attempt in range(1, max_retries + 1):
+        try:
+            # A cached reply is only tried once; should it fail validation, the retry calls the API.
+            from_cache = cached_response is not None
+            if from_cache:
+                logger.debug("Using cached holistic review response.")
+                response_text, cached_response = cached_response, None
+            else:
+                async with semaphore, rate_limiter:
+                    response = await client.chat.completions.create(
+                        model=REVIEW_MODEL_NAME,
+                        messages=[
+                            ChatCompletionSystemMessageParam(role="system", content=review_system_prompt)
+                        ],
+                        temperature=0.1,
+                        response_format={"type": "json_object"},
+                        max_tokens=8192,  # Increased to handle larger review responses
+                        timeout=120.0,
+                    )
                 msg_content = response.choices[0].message.content
                 if not msg_content or not msg_content.strip():
                     logger.error("Holistic review returned empty content.")
                     raise json.JSONDecodeError("empty response", "", 0)
                 response_text = msg_content.strip()
 
-                # The response should be a JSON string. Parse and validate it.
-                parsed_json = json.loads(response_text)
-                jsonschema.validate(instance=parsed_json, schema=LOCALIZATION_SCHEMA)
-
-                # Debug: Check what AI returned before restoration
-                sample_ai_keys = list(parsed_json.keys())[:2]
-                for sample_key in sample_ai_keys:
-                    ai_value = parsed_json.get(sample_key, "")
-                    has_tokens = "__PH_" in ai_value
-                    logger.debug(f"AI returned for '{sample_key}': '{ai_value}' (has_tokens={has_tokens})")
-
-                # Restore placeholders in the reviewed translations
-                # AI might use tokens from EITHER source or translated content, so restore with both
-                restored_json = {}
-                for key, value in parsed_json.items():
-                    # First restore with translated map, then with source map for any remaining tokens
-                    restored_value = restore_placeholders_in_properties(value, translated_placeholder_map)
-                    restored_value = restore_placeholders_in_properties(restored_value, source_placeholder_map)
-                    restored_json[key] = restored_value
-
-                # Debug: Check restoration results
-                for sample_key in sample_ai_keys:
-                    if sample_key in restored_json:
-                        restored_value = restored_json[sample_key]
-                        has_tokens = "__PH_" in restored_value
-                        has_placeholders = "{0}" in restored_value or "{1}" in restored_value
-                        logger.debug(f"After restoration '{sample_key}': '{restored_value}' "
-                                   f"(has_tokens={has_tokens}, has_placeholders={has_placeholders})")
-
-                logger.debug(f"Restored placeholders in {len(restored_json)} reviewed translations")
-                return restored_json
-
-            except json.JSONDecodeError:
-                logger.exception("Holistic review failed: AI did not return valid JSON.")
-                logger.debug(f"Invalid AI response (JSON Decode Error):\n---\n{response_text}\n---")
-                # Fall through to retry logic
-            except jsonschema.ValidationError:
-                logger.exception("Holistic review failed: AI response did not match the required JSON schema.")
-                logger.debug(f"Invalid AI response (Schema Error):\n---\n{response_text}\n---")
-                # Fall through to retry logic
-
-            except (RateLimitError, APITimeoutError, APIConnectionError, APIStatusError, OpenAIError) as api_exc:
-                logger.warning(f"API error during holistic review: {api_exc}")
-                should_retry = await _handle_retry(attempt, max_retries, base_delay, "holistic_review", api_exc)
-                if not should_retry:
-                    return None
-            except Exception as e:
-                logger.error(f"Unexpected error during holistic review: {e}", exc_info=True)
-                return None  # Do not retry on unexpected errors
-
-            # If we're here, it means a JSON or Schema error occurred. We should retry.
-            should_retry = await _handle_retry(attempt, max_retries, base_delay, "holistic_review_validation")
+            # The response should be a JSON string. Parse and validate it.
+            parsed_json = orjson.loads(response_text)
+            # The schema only requires a flat object of strings; check that inline and
+            # run the full validator only to report why a response does not match.
+            if not (isinstance(parsed_json, dict) and all(isinstance(v, str) for v in parsed_json.values())):
+                _validate_localization(parsed_json)
+            if cache_key is not None and not from_cache:
+                response_cache.set(cache_key, response_text)
+
+            # Debug: Check what AI returned before restoration
+            sample_ai_keys = list(parsed_json.keys())[:2]
+            for sample_key in sample_ai_keys:
+                ai_value = parsed_json.get(sample_key, "")
+                has_tokens = "__PH_" in ai_value
+                logger.debug(f"AI returned for '{sample_key}': '{ai_value}' (has_tokens={has_tokens})")
+
+            # Restore placeholders in the reviewed translations
+            # AI might use tokens from EITHER source or translated content, so restore with both
+            restored_json = {}
+            for key, value in parsed_json.items():
+                # First restore with translated map, then with source map for any remaining tokens
+                restored_value = restore_placeholders_in_properties(value, translated_placeholder_map)
+                restored_value = restore_placeholders_in_properties(restored_value, source_placeholder_map)
+                restored_json[key] = restored_value
+
+            # Debug: Check restoration results
+            for sample_key in sample_ai_keys:
+                if sample_key in restored_json:
+                    restored_value = restored_json[sample_key]
+                    has_tokens = "__PH_" in restored_value
+                    has_placeholders = "{0}" in restored_value or "{1}" in restored_value
+                    logger.debug(f"After restoration '{sample_key}': '{restored_value}' "
+                               f"(has_tokens={has_tokens}, has_placeholders={has_placeholders})")
+
+            logger.debug(f"Restored placeholders in {len(restored_json)} reviewed translations")
+            return restored_json
+
+        except json.JSONDecodeError:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so this covers both.
+            logger.exception("Holistic review failed: AI did not return valid JSON.")
+            logger.debug(f"Invalid AI response (JSON Decode Error):\n---\n{response_text}\n---")
+            # Fall through to retry logic
+        except _SCHEMA_VALIDATION_ERRORS:
+            logger.exception("Holistic review failed: AI response did not match the required JSON schema.")
+            logger.debug(f"Invalid AI response (Schema Error):\n---\n{response_text}\n---")
+            # Fall through to retry logic
+
+        except (RateLimitError, APITimeoutError, APIConnectionError, APIStatusError, OpenAIError) as api_exc:
+            logger.warning(f"API error during holistic review: {api_exc}")
+            should_retry = await _handle_retry(attempt, max_retries, base_delay, "holistic_review", api_exc, retry_state)
             if not should_retry:
                 return None
+        except Exception:
+            logger.exception("Unexpected error during holistic review.")
+            return None  # Do not retry on unexpected errors
+
+        # If we're here, it means a JSON or Schema error occurred. We should retry.
+        should_retry = await _handle_retry(attempt, max_retries, base_delay, "holistic_review_validation", state=retry_state)
+        if not should_retry:
+            return None
 
-        return None  # Fallback after all retries
+    return None  # Fallback after all retries
 
 def _escape_messageformat_if_needed(src_text: str, value: str) -> str:
-    if re.search(r'\{[^{}]+\}', src_text):
+    # Most sources have no braces at all; skip the regex for them.
+    if '{' not in src_text:
+        return value
+    if _MSGFMT_PLACEHOLDER_RE.search(src_text):
         value = value.replace("''", "'")
         value = value.replace("'", "''")
     return value
@@ -1418,7 +2336,40 @@ def get_source_filename(translation_file: str, supported_codes: List[str]) -> st
     # This handles source files like 'app.properties' or unsupported language codes
     return translation_file
 
-def move_files_to_archive(input_folder_path: str, archive_folder_path: str):
+def _iter_properties(root_folder: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yield every .properties file below a folder.
+
+    Uses os.scandir with an explicit stack, so file types come from the directory
+    listing instead of extra stat calls. Like os.walk, symlinked directories are not
+    descended into and unreadable directories are skipped.
+
+    Args:
+        root_folder (str): The folder to scan.
+
+    Yields:
+        Tuple[str, str]: The full path and the path relative to root_folder.
+    """
+    stack = [(root_folder, '')]
+    while stack:
+        folder, rel_prefix = stack.pop()
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    rel_path = os.path.join(rel_prefix, entry.name) if rel_prefix else entry.name
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if not entry.is_symlink():
+                            stack.append((entry.path, rel_path))
+                    elif entry.name.endswith('.properties'):
+                        yield entry.path, rel_path
+        except OSError:
+            continue
+
+async def move_files_to_archive(input_folder_path: str, archive_folder_path: str):
     """
     Move processed files to an archive folder, preserving subdirectories.
 
@@ -1427,24 +2378,28 @@ def move_files_to_archive(input_folder_path: str, archive_folder_path: str):
         archive_folder_path (str): The archive folder path.
     """
     os.makedirs(archive_folder_path, exist_ok=True)
-    for root, _, files in os.walk(input_folder_path):
-        for filename in files:
-            if filename.endswith('.properties') and re.search(r'_[a-z]{2,3}(?:[-_][A-Za-z]{2,4})?\.properties$', filename):
-                # Construct relative path to maintain directory structure
-                relative_path = os.path.relpath(os.path.join(root, filename), input_folder_path)
-                source_path = os.path.join(input_folder_path, relative_path)
-                dest_path = os.path.join(archive_folder_path, relative_path)
-
-                if DRY_RUN:
-                    logger.info(f"[Dry Run] Would move file '{source_path}' to '{dest_path}'.")
-                else:
-                    # Ensure the destination subdirectory exists before moving.
-                    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                    shutil.move(source_path, dest_path)
-                    logger.info(f"Moved file '{source_path}' to '{dest_path}'.")
+    # The relative paths maintain the directory structure
+    relative_paths = [
+        relative_path for _, relative_path in _iter_properties(input_folder_path)
+        if _LANG_SUFFIX_RE.search(os.path.basename(relative_path))
+    ]
+
+    def _move_one(relative_path: str) -> None:
+        source_path = os.path.join(input_folder_path, relative_path)
+        dest_path = os.path.join(archive_folder_path, relative_path)
+        if DRY_RUN:
+            logger.info(f"[Dry Run] Would move file '{source_path}' to '{dest_path}'.")
+        else:
+            shutil.move(source_path, dest_path)
+            logger.info(f"Moved file '{source_path}' to '{dest_path}'.")
+
+    if not DRY_RUN:
+        # Create each destination subdirectory once before moving.
+        _ensure_parent_dirs(archive_folder_path, relative_paths)
+    await _run_file_operations(_move_one, relative_paths)
     logger.info(f"All translation files in '{input_folder_path}' have been archived.")
 
-def copy_translated_files_back(
+async def copy_translated_files_back(
         translated_queue_folder: str,
         input_folder_path: str
 ):
@@ -1455,19 +2410,27 @@ def copy_translated_files_back(
         translated_queue_folder (str): The folder containing translated files.
         input_folder_path (str): The input folder path.
     """
-    for root, _dirs, files in os.walk(translated_queue_folder):
-        for name in files:
-            if name.endswith('.properties') and re.search(r'_[a-z]{2,3}(?:[-_][A-Za-z]{2,4})?\.properties$', name):
-                rel_path = os.path.relpath(os.path.join(root, name), translated_queue_folder)
-                translated_file_path = os.path.join(translated_queue_folder, rel_path)
-                dest_path = os.path.join(input_folder_path, rel_path)
-                if DRY_RUN:
-                    logger.info(
-                        f"[Dry Run] Would copy translated file '{translated_file_path}' back to '{dest_path}'.")
-                else:
-                    os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-                    shutil.copy2(translated_file_path, dest_path)
-                    logger.info(f"Copied translated file '{translated_file_path}' back to '{dest_path}'.")
+    relative_paths = [
+        rel_path for _, rel_path in _iter_properties(translated_queue_folder)
+        if _LANG_SUFFIX_RE.search(os.path.basename(rel_path))
+    ]
+
+    def _copy_one(rel_path: str) -> None:
+        translated_file_path = os.path.join(translated_queue_folder, rel_path)
+        dest_path = os.path.join(input_folder_path, rel_path)
+        if DRY_RUN:
+            logger.info(
+                f"[Dry Run] Would copy translated file '{translated_file_path}' back to '{dest_path}'.")
+        else:
+            _fast_copy(translated_file_path, dest_path)
+            logger.info(f"Copied translated file '{translated_file_path}' back to '{dest_path}'.")
+
+    if not DRY_RUN:
+        _ensure_parent_dirs(input_folder_path, relative_paths)
+    await _run_file_operations(_copy_one, relative_paths)
+
+# os.geteuid is not available on Windows.
+_EFFECTIVE_UID = os.geteuid() if hasattr(os, 'geteuid') else None
 
 def validate_paths(input_folder: str, translation_queue: str, translated_queue: str, repo_root: str):
     """
@@ -1483,12 +2446,21 @@ def validate_paths(input_folder: str, translation_queue: str, translated_queue:
                        (translation_queue, "Translation Queue Folder"),
                        (translated_queue, "Translated Queue Folder"),
                        (repo_root, "Repository Root")]:
-        if not os.path.exists(path):
+        try:
+            path_stat = os.stat(path)
+        except FileNotFoundError:
             logger.error(f"{name} '{path}' does not exist.")
             raise FileNotFoundError(f"{name} '{path}' does not exist.")
         required = os.R_OK | os.W_OK
+        owner_bits = stat.S_IRUSR | stat.S_IWUSR
         if name == "Repository Root":
             required = os.R_OK
+            owner_bits = stat.S_IRUSR
+        # For paths we own, the owner permission bits from the stat answer the question;
+        # only other owners need the full os.access check.
+        owned = _EFFECTIVE_UID is not None and path_stat.st_uid == _EFFECTIVE_UID
+        if owned and path_stat.st_mode & owner_bits == owner_bits:
+            continue
         if not os.access(path, required):
             logger.error("%s '%s' is not accessible (required perms: %s).", name, path, "R+W" if required & os.W_OK else "R")
             raise PermissionError(f"{name} '{path}' lacks required permissions.")
@@ -1526,13 +2498,14 @@ def get_changed_translation_files(
         if not filter_glob:
             return files
 
-        import fnmatch
+        # Translate the glob to a regex once instead of once per candidate file.
+        matcher = re.compile(fnmatch.translate(filter_glob)).match
         # If the glob contains a path separator, match against the full relative path.
         # Otherwise, match against the basename to preserve the original behavior.
         if '/' in filter_glob:
-            filtered_list = [f for f in files if fnmatch.fnmatch(f, filter_glob)]
+            filtered_list = [f for f in files if matcher(f)]
         else:
-            filtered_list = [f for f in files if fnmatch.fnmatch(os.path.basename(f), filter_glob)]
+            filtered_list = [f for f in files if matcher(os.path.basename(f))]
 
         logger.info(
             "Applied filter '%s', %d out of %d files will be translated.",
@@ -1545,17 +2518,12 @@ def get_changed_translation_files(
     def discover_translation_files() -> List[str]:
         """Discover all translation files (excluding source files and archive paths)."""
         discovered_files: List[str] = []
-        for root, _, files in os.walk(input_folder_path):
-            for filename in files:
-                if not filename.endswith('.properties'):
-                    continue
-                if not re.search(r'_[a-z]{2,3}(?:[-_][A-Za-z]{2,4})?\.properties$', filename):
-                    continue
-                absolute_path = os.path.join(root, filename)
-                relative_path = os.path.relpath(absolute_path, input_folder_path)
-                if is_archive_path(relative_path):
-                    continue
-                discovered_files.append(relative_path)
+        for _, relative_path in _iter_properties(input_folder_path):
+            if not _LANG_SUFFIX_RE.search(os.path.basename(relative_path)):
+                continue
+            if is_archive_path(relative_path):
+                continue
+            discovered_files.append(relative_path)
         return sorted(discovered_files)
 
     try:
@@ -1580,6 +2548,11 @@ def get_changed_translation_files(
             check=True
         )
 
+        # git reports '/'-separated paths relative to repo_root, so the path relative to
+        # the input folder is a plain prefix strip.
+        normalized_input_folder = rel_input_folder.replace(os.sep, '/').rstrip('/')
+        input_prefix = '' if normalized_input_folder == '.' else normalized_input_folder + '/'
+
         changed_translation_files: Set[str] = set()
         changed_source_files: Set[str] = set()
         for line in result.stdout.splitlines():
@@ -1596,13 +2569,15 @@ def get_changed_translation_files(
             if cleaned_status in {'M', 'A', 'AM', 'MM', 'RM', 'R', '??'}:
                 if filepath.endswith('.properties'):
                     # Extract the filename relative to input_folder
-                    rel_path = os.path.relpath(filepath, rel_input_folder)
+                    if not filepath.startswith(input_prefix):
+                        continue
+                    rel_path = filepath[len(input_prefix):]
                     if is_archive_path(rel_path):
                         continue
 
                     # Check if it's a translation file (has language suffix).
                     # Updated regex to support hyphenated locale codes like zh-Hans, zh-Hant.
-                    if re.search(r'_[a-z]{2,3}(?:[-_][A-Za-z]{2,4})?\.properties$', os.path.basename(filepath)):
+                    if _LANG_SUFFIX_RE.search(os.path.basename(filepath)):
                         changed_translation_files.add(rel_path)
                     else:
                         changed_source_files.add(rel_path.replace('\\', '/'))
@@ -1610,10 +2585,12 @@ def get_changed_translation_files(
         # Resilience to delayed Transifex propagation:
         # if source files changed, also enqueue all related locale files even if unchanged in git status.
         if changed_source_files:
+            # Pre-sort once; get_source_filename sorts on every call otherwise.
+            supported_codes = sorted(LANGUAGE_CODES.keys(), key=len, reverse=True)
             for translation_rel_path in discover_translation_files():
                 rel_dir = os.path.dirname(translation_rel_path)
                 translation_filename = os.path.basename(translation_rel_path)
-                source_filename = get_source_filename(translation_filename, list(LANGUAGE_CODES.keys()))
+                source_filename = get_source_filename(translation_filename, supported_codes)
                 source_rel_path = os.path.join(rel_dir, source_filename) if rel_dir else source_filename
                 if source_rel_path.replace('\\', '/') in changed_source_files:
                     changed_translation_files.add(translation_rel_path)
@@ -1626,7 +2603,101 @@ def get_changed_translation_files(
         logger.error(f"An unexpected error occurred while fetching changed files: {general_exc}")
         return []
 
-def copy_files_to_translation_queue(
+# copy_file_range reports these when the kernel or file system cannot copy in-kernel.
+_COPY_FILE_RANGE_FALLBACK_ERRNOS = {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
+
+def _fast_copy(source_path: str, dest_path: str, preserve_times: bool = True):
+    """
+    Copy a file's content, in the kernel where possible, and optionally its metadata.
+
+    Uses os.copy_file_range (which can reflink on btrfs/xfs) and falls back to a
+    buffered copy when it is unavailable or unsupported for the two files.
+
+    Args:
+        source_path (str): The file to copy.
+        dest_path (str): The destination file, created or truncated.
+        preserve_times (bool): Whether to copy the permission bits and the access and
+            modification times, as shutil.copy2 does.
+    """
+    with open(source_path, 'rb') as source, open(dest_path, 'wb') as dest:
+        source_stat = os.fstat(source.fileno())
+        copied_in_kernel = False
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while os.copy_file_range(source.fileno(), dest.fileno(), 1 << 30):
+                    pass
+                copied_in_kernel = True
+            except OSError as copy_exc:
+                if copy_exc.errno not in _COPY_FILE_RANGE_FALLBACK_ERRNOS:
+                    raise
+                source.seek(0)
+                dest.seek(0)
+                dest.truncate()
+        if not copied_in_kernel:
+            shutil.copyfileobj(source, dest)
+    if preserve_times:
+        os.chmod(dest_path, stat.S_IMODE(source_stat.st_mode))
+        os.utime(dest_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+
+def _ensure_parent_dirs(dest_root: str, relative_paths: List[str]):
+    """
+    Create the destination directories for a batch of files, each directory only once.
+
+    Args:
+        dest_root (str): The destination root folder.
+        relative_paths (List[str]): File paths relative to dest_root.
+    """
+    # Only files in subdirectories need more than dest_root; join each directory once.
+    needed_dirs = {os.path.dirname(path) for path in relative_paths}
+    needed_dirs.discard('')
+    os.makedirs(dest_root, exist_ok=True)
+    for directory in needed_dirs:
+        os.makedirs(os.path.join(dest_root, directory), exist_ok=True)
+
+async def _run_file_operations(operation: Callable[[str], None], filenames: List[str]):
+    """
+    Run a blocking per-file operation in worker threads so independent copies overlap.
+
+    Every operation runs to completion; the first failure is raised afterwards.
+
+    Args:
+        operation (Callable[[str], None]): Function applied to each file name.
+        filenames (List[str]): The file names to process.
+    """
+    results = await asyncio.gather(
+        *[asyncio.to_thread(operation, filename) for filename in filenames],
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+async def _async_rmtree(path: str):
+    """
+    Remove a directory tree, unlinking its files concurrently in worker threads.
+
+    Symlinks are removed, not followed, like shutil.rmtree does.
+
+    Args:
+        path (str): The directory to remove.
+    """
+    file_paths: List[str] = []
+    dir_paths = [path]
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dir_paths.append(entry.path)
+                    stack.append(entry.path)
+                else:
+                    file_paths.append(entry.path)
+    await _run_file_operations(os.unlink, file_paths)
+    # Directories were collected parents first, so removing them in reverse empties children first.
+    for dir_path in reversed(dir_paths):
+        os.rmdir(dir_path)
+
+async def copy_files_to_translation_queue(
         changed_files: List[str],
         input_folder_path: str,
         translation_queue_folder: str
@@ -1640,7 +2711,8 @@ def copy_files_to_translation_queue(
         translation_queue_folder (str): The absolute path to the translation queue folder.
     """
     os.makedirs(translation_queue_folder, exist_ok=True)
-    for translation_file in changed_files:
+
+    def _copy_one(translation_file: str) -> None:
         # Define full source and destination paths
         source_file_path = os.path.join(input_folder_path, translation_file)
         dest_path = os.path.join(translation_queue_folder, translation_file)
@@ -1648,19 +2720,69 @@ def copy_files_to_translation_queue(
         # Log the files being processed
         logger.info(f"Processing translation file: {translation_file}")
 
-        # Check if source file exists
-        if not os.path.exists(source_file_path):
-            logger.warning(f"Translation file '{translation_file}' not found in '{input_folder_path}'. Skipping.")
-            continue
-
         if DRY_RUN:
+            if not os.path.exists(source_file_path):
+                logger.warning(f"Translation file '{translation_file}' not found in '{input_folder_path}'. Skipping.")
+                return
             logger.info(f"[Dry Run] Would copy translation file '{source_file_path}' to '{dest_path}'.")
-        else:
-            # Ensure the destination directory exists
-            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-            # Copy translation file to translation_queue_folder
-            shutil.copy2(source_file_path, dest_path)
-            logger.info(f"Copied translation file '{source_file_path}' to '{dest_path}'.")
+            return
+
+        # Copy translation file to translation_queue_folder. The queue is transient,
+        # so only the data is copied; metadata is preserved where it matters (archive).
+        try:
+            _fast_copy(source_file_path, dest_path, preserve_times=False)
+        except FileNotFoundError:
+            logger.warning(f"Translation file '{translation_file}' not found in '{input_folder_path}'. Skipping.")
+            return
+        logger.info(f"Copied translation file '{source_file_path}' to '{dest_path}'.")
+
+    if not DRY_RUN:
+        _ensure_parent_dirs(translation_queue_folder, changed_files)
+    await _run_file_operations(_copy_one, changed_files)
+
+def _umask_file_mode() -> int:
+    """Return the mode a plain open() gives new files under the process umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+# Read once at import, before any worker threads write files.
+_NEW_FILE_MODE = _umask_file_mode()
+
+def _write_translated_file(file_path: str, parsed_lines: List[Dict]):
+    """
+    Reassemble parsed lines into a translated file, creating its directory if needed.
+
+    The content goes to a uniquely named temporary file next to the destination, is
+    flushed to disk and then replaces the destination, so readers never see a partially
+    written file, not even after a crash.
+
+    Args:
+        file_path (str): The destination file path.
+        parsed_lines (List[Dict]): The parsed lines to write.
+    """
+    directory = os.path.dirname(file_path)
+    os.makedirs(directory, exist_ok=True)
+    temp_path = None
+    try:
+        with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', buffering=1 << 20, dir=directory,
+                prefix=f".{os.path.basename(file_path)}.", suffix='.tmp', delete=False
+        ) as temp_file:
+            temp_path = temp_file.name
+            reassemble_file_to(parsed_lines, temp_file)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        # Temporary files are private; give the result the permissions a plain open() would.
+        os.chmod(temp_path, _NEW_FILE_MODE)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except FileNotFoundError:
+                pass
+        raise
 
 async def process_translation_queue(
         translation_queue_folder: str,
@@ -1682,20 +2804,21 @@ async def process_translation_queue(
         - A dictionary of skipped files, mapping filename to a list of error strings.
         - Total number of keys translated across all files.
     """
-    properties_files = []
-    for root, _, files in os.walk(translation_queue_folder):
-        for name in files:
-            if name.endswith('.properties'):
-                # Get the relative path from the queue folder to preserve subdirectories
-                relative_path = os.path.relpath(os.path.join(root, name), translation_queue_folder)
-                properties_files.append(relative_path)
+    # Relative paths from the queue folder preserve subdirectories
+    properties_files = [relative_path for _, relative_path in _iter_properties(translation_queue_folder)]
 
     # Load the glossary from the JSON file
     glossary = load_glossary(glossary_file_path)
     key_ledger = load_translation_key_ledger(TRANSLATION_KEY_LEDGER_FILE_PATH)
 
+    # Inspect the git changes of every queued file with one git call instead of one per file.
+    git_changed_keys_by_file = get_working_tree_changed_keys_for_files(
+        [os.path.join(INPUT_FOLDER, translation_file) for translation_file in properties_files],
+        REPO_ROOT
+    )
+
     # Set up a single semaphore for all API calls to control concurrency globally.
-    # A value of 1 ensures that only one API request is active at any time.
+    # It only caps in-flight requests; the rate limiter below enforces requests per minute.
     semaphore = asyncio.Semaphore(MAX_CONCURRENT_API_CALLS)
 
     # Initialize rate limiter (e.g., 60 requests per minute)
@@ -1708,27 +2831,40 @@ async def process_translation_queue(
     total_keys_translated = 0
     skipped_files: Dict[str, List[str]] = {}
 
-    for translation_file in properties_files:
+    # Language codes are constant for the whole run; build and pre-sort the list once
+    # instead of allocating it twice per file.
+    supported_codes = sorted(LANGUAGE_CODES.keys(), key=len, reverse=True)
+
+    ledger_updated = False
+
+    async def _process_one(translation_file: str) -> Optional[int]:
+        """Run the whole pipeline for one queued file; return its translated key count, or None if skipped."""
+        nonlocal ledger_updated
         # Extract the language code from the filename
-        language_code = extract_language_from_filename(translation_file, list(LANGUAGE_CODES.keys()))
+        language_code = extract_language_from_filename(translation_file, supported_codes)
         if not language_code:
             logger.warning(f"Skipping file {translation_file}: unable to extract language code.")
-            continue
+            return None
         # 4) Now we find the "friendly name" from the dictionary
         target_language = language_code_to_name(language_code)
         if not target_language:
             logger.warning(f"Skipping file {translation_file}: unsupported language code '{language_code}'.")
-            continue
+            return None
 
         # Define full paths
         translation_file_path = os.path.join(translation_queue_folder, translation_file)
         # Use get_source_filename() to correctly handle underscores in base filenames (e.g., mu_sig)
-        source_file_name = get_source_filename(translation_file, list(LANGUAGE_CODES.keys()))
+        source_file_name = get_source_filename(translation_file, supported_codes)
         source_file_path = os.path.join(INPUT_FOLDER, source_file_name)
 
-        if not os.path.exists(source_file_path):
+        # Load the source file first; a missing source is detected by the stat itself
+        # rather than a separate existence probe. All locales of a project file share
+        # one source, and the (path, mtime, size) cache is shared with pre-validation.
+        try:
+            source_translations = load_source_translations(source_file_path)
+        except FileNotFoundError:
             logger.warning(f"Source file '{source_file_name}' not found in '{INPUT_FOLDER}'. Skipping.")
-            continue
+            return None
 
         logger.info(f"Processing file '{translation_file}' for language '{target_language}'...")
 
@@ -1739,7 +2875,7 @@ async def process_translation_queue(
             for error in validation_errors:
                 logger.error(f"  - {error}")
             skipped_files[translation_file] = validation_errors
-            continue
+            return None
         # --- End Validator ---
 
         # --- Pre-flight Linter Check ---
@@ -1750,17 +2886,16 @@ async def process_translation_queue(
             for error in lint_errors:
                 logger.error(f"  - {error}")
             skipped_files[translation_file] = lint_errors
-            continue
+            return None
         # --- End Linter Check ---
 
-        # Load files
+        # Load the target file
         parsed_lines, target_translations = parse_properties_file(translation_file_path)
-        _, source_translations = parse_properties_file(source_file_path)
 
         # Extract texts to translate
         file_ledger_entries = key_ledger.get(translation_file, {})
         original_input_file_path = os.path.join(INPUT_FOLDER, translation_file)
-        git_changed_keys = get_working_tree_changed_keys(original_input_file_path, REPO_ROOT)
+        git_changed_keys = git_changed_keys_by_file.get(original_input_file_path, set())
         # Only re-translate git-dirty keys if their English source actually changed.
         # This prevents an infinite cycle where Transifex community translations
         # are overwritten by AI, then Transifex re-serves the community version.
@@ -1785,86 +2920,135 @@ async def process_translation_queue(
         if not texts_to_translate:
             # Refresh ledger baseline even when no translation was required.
             key_ledger[translation_file] = build_file_key_ledger(source_translations, target_translations)
-            save_translation_key_ledger(TRANSLATION_KEY_LEDGER_FILE_PATH, key_ledger)
+            append_translation_key_ledger_journal(
+                TRANSLATION_KEY_LEDGER_FILE_PATH, translation_file, key_ledger[translation_file]
+            )
+            ledger_updated = True
             logger.info(f"No texts to translate in file '{translation_file}'.")
-            continue
+            return None
+
+        # The glossary and context examples of the prompt only depend on the file, so they
+        # are built once here instead of once per key.
+        prompt_parts = None
+        if not DRY_RUN:
+            prompt_parts = _build_translation_prompt_parts(
+                target_translations, source_translations, target_language, glossary
+            )
+
+        # Large files can go through the Batch API; anything it does not return is
+        # translated per key below.
+        batch_results: Dict[int, str] = {}
+        if USE_BATCH_API and not DRY_RUN and len(keys_to_translate) >= BATCH_API_MIN_KEYS:
+            batch_results = await translate_texts_batch(
+                [(idx, text, key) for idx, (text, key) in enumerate(zip(texts_to_translate, keys_to_translate))],
+                target_translations,
+                source_translations,
+                target_language,
+                glossary
+            )
 
-        # Gather all translation tasks
-        tasks = [
-            translate_text_async(
-                text,
-                key,
+        # Schedule all translation tasks up front and add them to the shared progress bar.
+        progress_bar.total += len(keys_to_translate)
+        progress_bar.set_postfix_str(translation_file)
+        # Each key gets a future that a fixed pool of workers resolves, so only
+        # MAX_CONCURRENT_API_CALLS coroutines exist no matter how many keys a file has.
+        loop = asyncio.get_running_loop()
+        translation_tasks = [loop.create_future() for _ in keys_to_translate]
+        pending_items: List[Tuple[int, str, str]] = []
+        first_index_by_text: Dict[str, int] = {}
+        for idx, (text, key) in enumerate(zip(texts_to_translate, keys_to_translate)):
+            translation_tasks[idx].add_done_callback(lambda _future: progress_bar.update(1))
+            if idx in batch_results:
+                # Already translated by the batch job.
+                translation_tasks[idx].set_result((idx, batch_results[idx]))
+            elif text in first_index_by_text:
+                # Identical source texts ("OK", "Cancel", ...) are translated once; the holistic
+                # review still checks every key in its own context.
+                translation_tasks[first_index_by_text[text]].add_done_callback(
+                    functools.partial(_copy_translation_result, translation_tasks[idx], idx)
+                )
+            else:
+                first_index_by_text[text] = idx
+                pending_items.append((idx, text, key))
+        # Keys are sent in chunks of up to TRANSLATION_BATCH_SIZE per request.
+        work_queue: asyncio.Queue = asyncio.Queue()
+        for chunk in _chunk_translation_items(pending_items, TRANSLATION_BATCH_SIZE, _TRANSLATION_BATCH_MAX_CHARS):
+            work_queue.put_nowait(chunk)
+        translation_workers = [
+            asyncio.create_task(_translation_worker(
+                work_queue,
+                translation_tasks,
                 target_translations,
                 source_translations,
                 target_language,
                 glossary,
                 semaphore,
-                rate_limiter,  # Pass the rate limiter
-                idx
-            )
-            for idx, (text, key) in enumerate(zip(texts_to_translate, keys_to_translate))
+                rate_limiter,
+                prompt_parts
+            ))
+            for _ in range(min(MAX_CONCURRENT_API_CALLS, work_queue.qsize()))
         ]
 
-        # Run tasks concurrently with progress indication
-        results = []
-        # The tqdm output is directed to stderr by default, which is ideal.
-        # It prevents progress bars from being broken by stdout prints.
-        for coro in tqdm(
-                asyncio.as_completed(tasks),
-                desc=f"Translating {translation_file}",
-                unit="translation",
-                total=len(tasks)  # Provide the total number of tasks
-        ):
-            index, result = await coro
-            results.append((index, result))
-
-        # Sort results by index to ensure correct order
-        results.sort(key=lambda x: x[0])
-        translations = [result for _, result in results]
-
-        # Integrate initial translations to create a draft file for review
-        draft_lines = integrate_translations(
-            parsed_lines,
-            translations,
-            indices,
-            keys_to_translate,
-            source_translations
-        )
-        draft_content = reassemble_file(draft_lines)
-
         # --- Holistic Review Step ---
         # Instead of one large review, we chunk the keys to avoid token limits.
         logger.info(f"Performing holistic review for {len(keys_to_translate)} keys in '{translation_file}'...")
 
         # Create chunks of keys
-        key_chunks = [
-            keys_to_translate[i:i + HOLISTIC_REVIEW_CHUNK_SIZE]
-            for i in range(0, len(keys_to_translate), HOLISTIC_REVIEW_CHUNK_SIZE)
-        ]
-
-        # We need a dictionary of the draft translations to build targeted context for each chunk.
-        # This is easier than parsing the string repeatedly.
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.properties', encoding='utf-8') as temp_f:
-            temp_f.write(draft_content)
-            temp_draft_path = temp_f.name
-        _, draft_translations = parse_properties_file(temp_draft_path)
-        os.remove(temp_draft_path)
+        chunk_starts = range(0, len(keys_to_translate), HOLISTIC_REVIEW_CHUNK_SIZE)
+        key_chunks = [keys_to_translate[i:i + HOLISTIC_REVIEW_CHUNK_SIZE] for i in chunk_starts]
 
-        final_corrected_translations = {}
         style_rules_text_for_review = PRECOMPUTED_STYLE_RULES_TEXT.get(language_code, "")
 
-        review_results = await asyncio.gather(
-            *[holistic_review_async(
-                source_content="\n".join([f"{key}={source_translations.get(key, '')}" for key in key_chunk]),
-                translated_content="\n".join([f"{key}={draft_translations.get(key, '')}" for key in key_chunk]),
+        async def _translate_and_review_chunk(start: int, key_chunk: List[str]) -> Optional[Dict[str, str]]:
+            # A chunk's review only depends on its own keys, so it starts as soon as
+            # those translations finish instead of waiting for the whole file.
+            chunk_results = await asyncio.gather(*translation_tasks[start:start + len(key_chunk)])
+            draft_values = {
+                key: _escape_messageformat_if_needed(source_translations.get(key, ''), translation)
+                for key, (_, translation) in zip(key_chunk, chunk_results)
+            }
+            return await holistic_review_async(
+                source_content=_render_pairs(key_chunk, source_translations),
+                translated_content=_render_pairs(key_chunk, draft_values),
                 target_language=target_language,
                 keys_to_review=key_chunk,
                 semaphore=semaphore,
                 rate_limiter=rate_limiter,
                 style_rules_text=style_rules_text_for_review
-            ) for key_chunk in key_chunks]
+            )
+
+        try:
+            review_results = await asyncio.gather(
+                *[_translate_and_review_chunk(start, key_chunk) for start, key_chunk in zip(chunk_starts, key_chunks)]
+            )
+        finally:
+            # Don't leave translations running if a chunk failed.
+            for worker in translation_workers:
+                worker.cancel()
+            for task in translation_tasks:
+                task.cancel()
+
+        # Tasks were created in key order, so results are already aligned with keys_to_translate.
+        translations = [task.result()[1] for task in translation_tasks]
+
+        # Integrate initial translations to create a draft file
+        draft_lines = integrate_translations(
+            parsed_lines,
+            translations,
+            indices,
+            keys_to_translate,
+            source_translations
         )
 
+        # We need a dictionary of the draft translations to fall back on for chunks whose review failed.
+        # The draft lines already hold every value, so no reassemble/parse round trip is needed.
+        draft_translations = {
+            line['key']: line['value'] for line in draft_lines
+            if line.get('type') == 'entry' and 'key' in line
+        }
+
+        final_corrected_translations = {}
+
         try:
             for i, (corrected_chunk, key_chunk) in enumerate(zip(review_results, key_chunks)):
                 if corrected_chunk is not None:
@@ -1884,18 +3068,20 @@ async def process_translation_queue(
         # Always apply the results from the review stage, which includes fallbacks to draft for failed chunks.
         logger.info("Applying corrected translations (including any draft fallbacks).")
 
-        # Debug: Check if restored translations have real placeholders or protection tokens
-        sample_keys = list(final_corrected_translations.keys())[:3]
-        for sample_key in sample_keys:
-            sample_value = final_corrected_translations.get(sample_key, "")
-            has_protection_tokens = "__PH_" in sample_value
-            has_real_placeholders = "{0}" in sample_value or "{1}" in sample_value or "{2}" in sample_value
-            logger.debug(f"Sample restored translation for '{sample_key}': '{sample_value}' "
-                        f"(has_tokens={has_protection_tokens}, has_placeholders={has_real_placeholders})")
-
-        logger.debug("--- ALL CORRECTED JSON FROM REVIEW (first 3 keys) ---")
-        for key in sample_keys:
-            logger.debug(f"  {key}={final_corrected_translations.get(key, '')}")
+        # Debug: Check if restored translations have real placeholders or protection tokens.
+        # Guarded so the sampling and message formatting are skipped entirely unless DEBUG is on.
+        if logger.isEnabledFor(logging.DEBUG):
+            sample_keys = list(islice(final_corrected_translations, 3))
+            for sample_key in sample_keys:
+                sample_value = final_corrected_translations.get(sample_key, "")
+                has_protection_tokens = "__PH_" in sample_value
+                has_real_placeholders = "{0}" in sample_value or "{1}" in sample_value or "{2}" in sample_value
+                logger.debug(f"Sample restored translation for '{sample_key}': '{sample_value}' "
+                            f"(has_tokens={has_protection_tokens}, has_placeholders={has_real_placeholders})")
+
+            logger.debug("--- ALL CORRECTED JSON FROM REVIEW (first 3 keys) ---")
+            for key in sample_keys:
+                logger.debug(f"  {key}={final_corrected_translations.get(key, '')}")
 
         # Track changes made by holistic review for INFO-level logging
         review_changes = 0
@@ -1923,17 +3109,20 @@ async def process_translation_queue(
                     final_translations[key] = line['value']
 
         # Debug: Check what's in final_translations before validation
-        validation_sample_keys = list(final_translations.keys())[:3]
-        logger.debug("--- FINAL TRANSLATIONS BEFORE VALIDATION (first 3 keys) ---")
-        for sample_key in validation_sample_keys:
-            sample_value = final_translations.get(sample_key, "")
-            has_protection_tokens = "__PH_" in sample_value
-            has_real_placeholders = "{0}" in sample_value or "{1}" in sample_value or "{2}" in sample_value
-            logger.debug(f"  {sample_key}={sample_value} "
-                        f"(has_tokens={has_protection_tokens}, has_placeholders={has_real_placeholders})")
-
-        # Validate each key individually and selectively revert failures
-        valid_translations, failed_keys = run_per_key_validation(
+        if logger.isEnabledFor(logging.DEBUG):
+            validation_sample_keys = list(islice(final_translations, 3))
+            logger.debug("--- FINAL TRANSLATIONS BEFORE VALIDATION (first 3 keys) ---")
+            for sample_key in validation_sample_keys:
+                sample_value = final_translations.get(sample_key, "")
+                has_protection_tokens = "__PH_" in sample_value
+                has_real_placeholders = "{0}" in sample_value or "{1}" in sample_value or "{2}" in sample_value
+                logger.debug(f"  {sample_key}={sample_value} "
+                            f"(has_tokens={has_protection_tokens}, has_placeholders={has_real_placeholders})")
+
+        # Validate each key individually and selectively revert failures. This is CPU work,
+        # so it runs in a thread to keep other files' API calls flowing.
+        valid_translations, failed_keys = await asyncio.to_thread(
+            run_per_key_validation,
             final_translations,
             source_translations,
             translation_file
@@ -1946,9 +3135,8 @@ async def process_translation_queue(
                 if key and key in valid_translations:
                     line['value'] = valid_translations[key]
 
-        # Reassemble the final file content with validated translations
+        # The final file content is reassembled from these lines while it is written.
         updated_lines = draft_lines
-        new_file_content = reassemble_file(updated_lines)
         # --- End Per-Key Validation ---
 
         translated_file_path = os.path.join(translated_queue_folder, translation_file)
@@ -1956,27 +3144,57 @@ async def process_translation_queue(
         if DRY_RUN:
             logger.info(f"[Dry Run] Would write translated content to '{translated_file_path}'.")
         else:
-            # Ensure the destination directory exists
-            os.makedirs(os.path.dirname(translated_file_path), exist_ok=True)
-            with open(translated_file_path, 'w', encoding='utf-8') as file:
-                file.write(new_file_content)
+            await asyncio.to_thread(_write_translated_file, translated_file_path, updated_lines)
             logger.info(f"Translated file saved to '{translated_file_path}'.\n")
 
-        # Update and persist per-file key ledger after successful file processing.
+        # Update and journal per-file key ledger after successful file processing.
         key_ledger[translation_file] = build_file_key_ledger(
             source_translations,
             valid_translations,
             failed_keys=set(failed_keys)
         )
-        save_translation_key_ledger(TRANSLATION_KEY_LEDGER_FILE_PATH, key_ledger)
+        append_translation_key_ledger_journal(
+            TRANSLATION_KEY_LEDGER_FILE_PATH, translation_file, key_ledger[translation_file]
+        )
+        ledger_updated = True
+        return len(keys_to_translate)
+
+    # One progress bar covers all files; each file adds its keys to the total when it starts
+    # translating. The tqdm output is directed to stderr by default, which keeps the bar
+    # from being broken by stdout prints.
+    progress_bar = tqdm(total=0, desc="Translating", unit="translation")
+    try:
+        # Files run concurrently; the shared semaphore and rate limiter bound the API load,
+        # so one file's parsing and validation overlaps another's in-flight requests.
+        results = await asyncio.gather(
+            *[_process_one(translation_file) for translation_file in properties_files],
+            return_exceptions=True
+        )
+    finally:
+        progress_bar.close()
+        # Each file is journaled as it completes; coalesce into the main ledger once per run.
+        if ledger_updated:
+            save_translation_key_ledger(TRANSLATION_KEY_LEDGER_FILE_PATH, key_ledger)
+        if _response_cache is not None:
+            logger.info(
+                f"Response cache: {_response_cache.hits} hit(s), {_response_cache.misses} miss(es)."
+            )
 
-        processed_files_count += 1
-        processed_filenames.append(translation_file)
-        total_keys_translated += len(keys_to_translate)
+    # Tally in queue order so the reported file list is deterministic.
+    for translation_file, result in zip(properties_files, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            logger.error(f"Unexpected error while processing '{translation_file}': {result}", exc_info=result)
+            skipped_files[translation_file] = [f"Unexpected error: {result}"]
+        elif result is not None:
+            processed_files_count += 1
+            processed_filenames.append(translation_file)
+            total_keys_translated += result
 
     return processed_files_count, processed_filenames, skipped_files, total_keys_translated
 
-def archive_original_files(
+async def archive_original_files(
         changed_files: List[str],
         input_folder_path: str,
         archive_folder_path: str
@@ -1985,20 +3203,54 @@ def archive_original_files(
     Copies the original changed files to the archive folder.
     """
     os.makedirs(archive_folder_path, exist_ok=True)
-    for filename in changed_files:
-        source_path = os.path.join(input_folder_path, filename)
-        dest_path = os.path.join(archive_folder_path, filename)
+    # Every path shares these roots; build them once instead of joining per file.
+    input_prefix = os.path.join(input_folder_path, '')
+    archive_prefix = os.path.join(archive_folder_path, '')
 
-        if not os.path.exists(source_path):
-            logger.warning(f"Original file '{filename}' not found for archiving. Skipping.")
-            continue
+    def _copy_one(filename: str) -> None:
+        source_path = input_prefix + filename
+        dest_path = archive_prefix + filename
 
         if DRY_RUN:
+            if not os.path.exists(source_path):
+                logger.warning(f"Original file '{filename}' not found for archiving. Skipping.")
+                return
             logger.info(f"[Dry Run] Would archive '{source_path}' to '{dest_path}'.")
-        else:
-            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-            shutil.copy2(source_path, dest_path)
-            logger.info(f"Archived original file '{source_path}' to '{dest_path}'.")
+            return
+
+        # A missing original is detected by the copy itself rather than a separate stat.
+        try:
+            _fast_copy(source_path, dest_path)
+        except FileNotFoundError:
+            logger.warning(f"Original file '{filename}' not found for archiving. Skipping.")
+            return
+        logger.info(f"Archived original file '{source_path}' to '{dest_path}'.")
+
+    if not DRY_RUN:
+        _ensure_parent_dirs(archive_folder_path, changed_files)
+    await _run_file_operations(_copy_one, changed_files)
+
+# Static start of the skipped-files report, encoded once.
+_SKIPPED_FILES_REPORT_HEADER = (
+    "## ⚠️ Translation Pipeline Warnings\n\n"
+    "The following files were skipped during the AI translation process due to validation or linter errors. These issues must be addressed manually.\n\n"
+).encode()
+
+def render_skipped_files_report(skipped_files: Dict[str, List[str]]) -> bytes:
+    """
+    Render the Markdown report listing skipped files and their errors.
+
+    Args:
+        skipped_files (Dict[str, List[str]]): Skipped file names mapped to their errors.
+
+    Returns:
+        bytes: The full report, UTF-8 encoded.
+    """
+    body = "".join(
+        f"### 📄 `{filename}`\n" + "".join(f"- {error}\n" for error in errors) + "\n"
+        for filename, errors in skipped_files.items()
+    )
+    return _SKIPPED_FILES_REPORT_HEADER + body.encode('utf-8')
 
 def generate_translation_summary(
     summary_path: str,
@@ -2114,13 +3366,14 @@ async def main():
         return
     logger.info(f"Detected {len(changed_files)} translation file(s) to process.")
 
-    # Step 2: Archive the original files before any processing.
+    # Step 2 and 3: Archive the original files and copy them to the translation queue.
+    # Both only read the originals and write to separate folders, so they run together.
     archive_folder_path = os.path.join(INPUT_FOLDER, 'archive')
-    archive_original_files(changed_files, INPUT_FOLDER, archive_folder_path)
+    await asyncio.gather(
+        archive_original_files(changed_files, INPUT_FOLDER, archive_folder_path),
+        copy_files_to_translation_queue(changed_files, INPUT_FOLDER, TRANSLATION_QUEUE_FOLDER)
+    )
     logger.info(f"Successfully archived original files to '{archive_folder_path}'.")
-
-    # Step 3: Copy changed files to the translation queue for processing.
-    copy_files_to_translation_queue(changed_files, INPUT_FOLDER, TRANSLATION_QUEUE_FOLDER)
     logger.info(f"Copied changed files to '{TRANSLATION_QUEUE_FOLDER}' for processing.")
 
     # Step 4: Process the files in the translation queue.
@@ -2136,27 +3389,21 @@ async def main():
         logger.info("No files were successfully translated.")
 
     # Step 5: Write skipped files report
-    report_path = os.path.join(PROJECT_ROOT_DIR, 'logs', 'skipped_files_report.log')
+    # LOGS_DIR is created once at startup.
+    report_path = SKIPPED_FILES_REPORT_PATH
     if skipped_files:
         logger.info(f"Some files were skipped. Writing report to {report_path}")
-        # Ensure the directory exists before trying to write the file.
-        report_dir = os.path.dirname(report_path)
-        os.makedirs(report_dir, exist_ok=True)
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write("## ⚠️ Translation Pipeline Warnings\n\n")
-            f.write(
-                "The following files were skipped during the AI translation process due to validation or linter errors. These issues must be addressed manually.\n\n")
-            for filename, errors in skipped_files.items():
-                f.write(f"### 📄 `{filename}`\n")
-                for error in errors:
-                    f.write(f"- {error}\n")
-                f.write("\n")
+        # Build the whole report first and write it with a single call.
+        with open(report_path, 'wb') as f:
+            f.write(render_skipped_files_report(skipped_files))
     else:
-        # Ensure no old report file is left
-        if os.path.exists(report_path):
-            os.remove(report_path)
+        # Ensure no old report file is left; a missing one is detected by the unlink itself.
+        try:
+            os.unlink(report_path)
+        except FileNotFoundError:
+            pass
 
-    summary_path = os.path.join(PROJECT_ROOT_DIR, 'logs', 'translation_summary.json')
+    summary_path = TRANSLATION_SUMMARY_PATH
     generate_translation_summary(
         summary_path,
         processed_files=processed_filenames,
@@ -2166,7 +3413,7 @@ async def main():
     logger.info(f"Wrote translation summary to {summary_path}")
 
     # Step 7: Copy translated files back to the input folder, overwriting the originals.
-    copy_translated_files_back(TRANSLATED_QUEUE_FOLDER, INPUT_FOLDER)
+    await copy_translated_files_back(TRANSLATED_QUEUE_FOLDER, INPUT_FOLDER)
     if processed_files_count > 0:
         logger.info("Copied translated files back to the input folder.")
 
@@ -2175,8 +3422,10 @@ async def main():
         logger.info("Skipping cleanup of translation queue folders (dry-run or preserve-for-debug enabled).")
     else:
         try:
-            shutil.rmtree(TRANSLATION_QUEUE_FOLDER)
-            shutil.rmtree(TRANSLATED_QUEUE_FOLDER)
+            await asyncio.gather(
+                _async_rmtree(TRANSLATION_QUEUE_FOLDER),
+                _async_rmtree(TRANSLATED_QUEUE_FOLDER)
+            )
             logger.info("Cleaned up translation queue folders.")
         except Exception:
             logger.exception("Error cleaning up translation queue folders")
@@ -2185,6 +3434,7 @@ if __name__ == "__main__":
     # Ensure queue folders exist, potentially using paths derived from config or defaults
     os.makedirs(TRANSLATION_QUEUE_FOLDER, exist_ok=True)
     os.makedirs(TRANSLATED_QUEUE_FOLDER, exist_ok=True)
+    os.makedirs(LOGS_DIR, exist_ok=True)
     try:
         asyncio.run(main())
     except Exception:
@@ -3,6 +3,8 @@ import re
 from collections import Counter
 from src.properties_parser import parse_properties_file, reassemble_file
 
+_MOJIBAKE_RE = re.compile(r'Ã[\x80-\xff]')
+
 def check_key_coverage(base_keys: Set[str], target_keys: Set[str]) -> Tuple[Set[str], Set[str]]:
     """
     Compares the keys in a target locale file against a base English file.
@@ -123,6 +125,26 @@ def synchronize_keys(target_file_path: str, source_file_path: str) -> Tuple[Set[
     Returns:
         A tuple of (missing_keys, extra_keys) that were applied to the target.
     """
+    missing_keys, extra_keys, _ = synchronize_keys_and_load(target_file_path, source_file_path)
+    return missing_keys, extra_keys
+
+def synchronize_keys_and_load(
+        target_file_path: str,
+        source_file_path: str
+) -> Tuple[Set[str], Set[str], Dict[str, str]]:
+    """
+    Synchronizes the keys of a target file like synchronize_keys and returns its translations.
+
+    The returned mapping reflects the target file after synchronization, so callers do not
+    need to parse the file again.
+
+    Args:
+        target_file_path: The path to the target locale file to be modified.
+        source_file_path: The path to the source (e.g., English) file.
+
+    Returns:
+        A tuple of (missing_keys, extra_keys, target_translations).
+    """
     # Parse both files to get their structure and key-value pairs
     target_parsed_lines, target_translations = parse_properties_file(target_file_path)
     source_parsed_lines, source_translations = parse_properties_file(source_file_path)
@@ -131,7 +153,7 @@ def synchronize_keys(target_file_path: str, source_file_path: str) -> Tuple[Set[
     missing_keys, extra_keys = check_key_coverage(set(source_translations.keys()), set(target_translations.keys()))
 
     if not missing_keys and not extra_keys:
-        return missing_keys, extra_keys  # No changes needed
+        return missing_keys, extra_keys, target_translations  # No changes needed
 
     # Filter out lines with extra keys from the target file
     final_parsed_lines = [
@@ -177,7 +199,11 @@ def synchronize_keys(target_file_path: str, source_file_path: str) -> Tuple[Set[
     with open(target_file_path, 'w', encoding='utf-8') as f:
         f.write(new_content)
 
-    return missing_keys, extra_keys
+    for key in extra_keys:
+        del target_translations[key]
+    for key in missing_keys:
+        target_translations[key] = source_translations[key]
+    return missing_keys, extra_keys, target_translations
 
 def check_encoding_and_mojibake(file_path: str) -> List[str]:
     """
@@ -202,16 +228,29 @@ def check_encoding_and_mojibake(file_path: str) -> List[str]:
         errors.append(f"Could not read file '{file_path}'. Reason: {e}")
         return errors
 
-    # 2. Check for common mojibake patterns
+    return check_encoding_and_mojibake_content(content, file_path)
+
+def check_encoding_and_mojibake_content(content: str, name: str = "<content>") -> List[str]:
+    """
+    Checks already decoded content for common mojibake patterns.
+
+    Args:
+        content: The decoded text to check.
+        name: The name used to refer to the content in error messages.
+
+    Returns:
+        A list of string error messages. An empty list means the content is valid.
+    """
+    errors = []
+
     # This regex looks for the character 'Ã' followed by another character
     # in the range 0x80-0xFF, which is a strong indicator of UTF-8 text being
     # incorrectly decoded as a single-byte encoding like latin-1 or cp1252.
-    mojibake_pattern = re.compile(r'Ã[\x80-\xff]')
-    if mojibake_pattern.search(content):
-        errors.append(f"Potential mojibake detected in '{file_path}'. Found patterns like 'Ã¼', 'Ã¤', etc.")
+    if _MOJIBAKE_RE.search(content):
+        errors.append(f"Potential mojibake detected in '{name}'. Found patterns like 'Ã¼', 'Ã¤', etc.")
 
-    # 3. Check for the Unicode replacement character
+    # Check for the Unicode replacement character
     if '\uFFFD' in content:
-        errors.append(f"File '{file_path}' contains the official Unicode replacement character (\uFFFD), indicating a previous encoding/decoding error.")
+        errors.append(f"File '{name}' contains the official Unicode replacement character (\uFFFD), indicating a previous encoding/decoding error.")
         
     return errors
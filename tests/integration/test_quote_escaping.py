@@ -1,7 +1,7 @@
 import os
 import tempfile
 import unittest
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 # Set a dummy API key before importing the main script to prevent SystemExit.
 os.environ['OPENAI_API_KEY'] = 'DUMMY_KEY_FOR_TESTING'
@@ -27,10 +27,15 @@ class TestQuoteEscaping(unittest.IsolatedAsyncioTestCase):
     @patch('src.translate_localization_files.run_pre_translation_validation')
     @patch('src.translate_localization_files.load_glossary')
     @patch('src.translate_localization_files.parse_properties_file')
-    @patch('src.translate_localization_files.get_working_tree_changed_keys')
+    @patch('src.translate_localization_files.get_working_tree_changed_keys_for_files')
     @patch('src.translate_localization_files.client.chat.completions.create', new_callable=AsyncMock)
     async def test_single_quotes_are_escaped(self, mock_create, mock_git_changed_keys, mock_parse_properties, mock_load_glossary, mock_pre_validator, mock_holistic_review, mock_post_validator):
-        from src.translate_localization_files import process_translation_queue, LANGUAGE_CODES, NAME_TO_CODE, REPO_ROOT
+        from src.translate_localization_files import (
+            LANGUAGE_CODES,
+            NAME_TO_CODE,
+            REPO_ROOT,
+            process_translation_queue,
+        )
 
         # Configure the mocks
         # The pre-validator returns (errors, newly_added_keys).
@@ -39,25 +44,19 @@ class TestQuoteEscaping(unittest.IsolatedAsyncioTestCase):
         mock_post_validator.return_value = True # Post-validation is now mocked
         mock_holistic_review.return_value = None
         mock_load_glossary.return_value = {}  # Mock the glossary to be empty
-        mock_git_changed_keys.return_value = set()
+        mock_git_changed_keys.return_value = {}
 
         # 1. Mock the file system interactions for both source and target files
-        # The first call to parse_properties_file is for the target file.
-        # The second call is for the source file.
-        # The third call is to parse the temporary draft file for holistic review.
+        # The first call to parse_properties_file is for the source file.
+        # The second call is for the target file.
         mock_parse_properties.side_effect = [
-            (
-                [{'type': 'entry', 'key': 'test.key', 'value': 'This has a {0} placeholder.', 'original_value': '...'}],
-                {"test.key": "This has a {0} placeholder."}
-            ),
             (
                 [], # Parsed lines for source are not used in this test
                 {"test.key": "This has a {0} placeholder."}
             ),
             (
-                # This simulates parsing the draft content after the AI's first pass.
-                [{'type': 'entry', 'key': 'test.key', 'value': "Dies ist ein ''{0}'' Beispiel.", 'original_value': "..."}],
-                {"test.key": "Dies ist ein ''{0}'' Beispiel."}
+                [{'type': 'entry', 'key': 'test.key', 'value': 'This has a {0} placeholder.', 'original_value': '...'}],
+                {"test.key": "This has a {0} placeholder."}
             )
         ]
 
@@ -91,13 +90,14 @@ class TestQuoteEscaping(unittest.IsolatedAsyncioTestCase):
         mock_holistic_review.assert_awaited()
         # The AI should be called for the initial translation
         mock_create.assert_awaited()
-        # parse_properties_file should be called three times:
-        # 1. For the target file
-        # 2. For the source file
-        # 3. To parse the temporary draft file for holistic review
-        self.assertEqual(mock_parse_properties.call_count, 3)
+        # parse_properties_file should be called twice:
+        # 1. For the source file
+        # 2. For the target file
+        # The draft values for holistic review come straight from the integrated lines.
+        self.assertEqual(mock_parse_properties.call_count, 2)
+        # Git changes of all queued files are inspected with a single call.
         mock_git_changed_keys.assert_called_once_with(
-            os.path.join(self.test_dir, 'app_de.properties'),
+            [os.path.join(self.test_dir, 'app_de.properties')],
             REPO_ROOT
         )
 
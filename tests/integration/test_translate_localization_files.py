@@ -6,12 +6,23 @@ external dependencies and file system operations, and also includes unit-like te
 for specific helper functions within the script.
 """
 import os
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
+
 import src.translate_localization_files
 
 # All fixtures are now defined in conftest.py and are auto-discovered by pytest.
 
+# Async tests use these so that file setup does not block inside the coroutine.
+def _write_text(path, content):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+def _read_text(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
 @pytest.mark.asyncio
 @patch('src.translate_localization_files.get_changed_translation_files')
 @patch('src.translate_localization_files.copy_files_to_translation_queue')
@@ -97,3 +108,93 @@ async def test_handles_already_escaped_quotes_correctly(integration_test_environ
         expected_content = "key.name=URL ist ''{0}''"
         assert final_content == expected_content
         assert "''''" not in final_content
+
+@pytest.mark.asyncio
+async def test_source_file_parsed_once_for_multiple_locales(integration_test_environment):
+    env = integration_test_environment
+    source_file_path = os.path.join(env['input_folder'], 'app.properties')
+    _write_text(source_file_path, "key.one=value one\n")
+    for locale in ('de', 'es'):
+        _write_text(os.path.join(env['translation_queue_folder'], f'app_{locale}.properties'), "key.one=value one\n")
+
+    async def mock_create(*args, **kwargs):
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="translated"))]
+        return mock_response
+
+    real_parse = src.translate_localization_files.parse_properties_file
+    with patch('src.translate_localization_files.parse_properties_file', side_effect=real_parse) as parse_spy, \
+         patch('src.translate_localization_files.holistic_review_async', new=AsyncMock(return_value={})), \
+         patch('src.translate_localization_files.client.chat.completions.create', new=mock_create):
+        await src.translate_localization_files.process_translation_queue(
+            translation_queue_folder=env['translation_queue_folder'],
+            translated_queue_folder=env['translated_queue_folder'],
+            glossary_file_path=env['mock_glossary_path_resolved']
+        )
+
+    parsed_paths = [call.args[0] for call in parse_spy.call_args_list]
+    # Pre-translation validation and translation share one cached parse of the source.
+    assert parsed_paths.count(source_file_path) == 1
+
+@pytest.mark.asyncio
+async def test_file_error_does_not_stop_other_files(integration_test_environment):
+    env = integration_test_environment
+    _write_text(os.path.join(env['input_folder'], 'app.properties'), "key.one=value one\n")
+    for locale in ('de', 'es'):
+        _write_text(os.path.join(env['translation_queue_folder'], f'app_{locale}.properties'), "")
+
+    async def mock_create(*args, **kwargs):
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="translated"))]
+        return mock_response
+
+    real_lint = src.translate_localization_files.lint_properties_file
+
+    def failing_lint(path):
+        if path.endswith('app_es.properties'):
+            raise RuntimeError("boom")
+        return real_lint(path)
+
+    with patch('src.translate_localization_files.lint_properties_file', side_effect=failing_lint), \
+         patch('src.translate_localization_files.holistic_review_async', new=AsyncMock(return_value={})), \
+         patch('src.translate_localization_files.client.chat.completions.create', new=mock_create):
+        processed_count, processed_files, skipped_files, _ = \
+            await src.translate_localization_files.process_translation_queue(
+                translation_queue_folder=env['translation_queue_folder'],
+                translated_queue_folder=env['translated_queue_folder'],
+                glossary_file_path=env['mock_glossary_path_resolved']
+            )
+
+    assert processed_count == 1
+    assert processed_files == ['app_de.properties']
+    assert skipped_files == {'app_es.properties': ["Unexpected error: boom"]}
+    assert os.path.exists(os.path.join(env['translated_queue_folder'], 'app_de.properties'))
+
+@pytest.mark.asyncio
+async def test_identical_source_texts_are_translated_once(integration_test_environment):
+    env = integration_test_environment
+    _write_text(os.path.join(env['input_folder'], 'app.properties'), "dialog.ok=OK\nbutton.ok=OK\nbutton.cancel=Cancel\n")
+    _write_text(os.path.join(env['translation_queue_folder'], 'app_de.properties'), "")
+
+    async def mock_create(*args, **kwargs):
+        user_prompt = kwargs['messages'][1]['content']
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(
+            content="Abbrechen" if "Value: Cancel" in user_prompt else "Okay"
+        ))]
+        return mock_response
+
+    mock_create_spy = AsyncMock(side_effect=mock_create)
+    with patch('src.translate_localization_files.holistic_review_async', new=AsyncMock(return_value={})), \
+         patch('src.translate_localization_files.client.chat.completions.create', new=mock_create_spy):
+        await src.translate_localization_files.process_translation_queue(
+            translation_queue_folder=env['translation_queue_folder'],
+            translated_queue_folder=env['translated_queue_folder'],
+            glossary_file_path=env['mock_glossary_path_resolved']
+        )
+
+    assert mock_create_spy.await_count == 2
+    final_content = _read_text(os.path.join(env['translated_queue_folder'], 'app_de.properties'))
+    assert "dialog.ok=Okay" in final_content
+    assert "button.ok=Okay" in final_content
+    assert "button.cancel=Abbrechen" in final_content
@@ -1,6 +1,6 @@
 """Unit tests for the app_config module."""
 import os
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 import yaml
@@ -25,6 +25,9 @@ class TestAppConfig:
             process_all_files=False,
             holistic_review_chunk_size=75,
             max_concurrent_api_calls=1,
+            translation_batch_size=1,
+            use_batch_api=False,
+            batch_api_min_keys=50,
             language_codes={"de": "German"},
             name_to_code={"german": "de"},
             retranslate_identical_source_strings=False,
@@ -34,6 +37,7 @@ class TestAppConfig:
             translation_queue_folder="/tmp/queue",
             translated_queue_folder="/tmp/translated",
             translation_key_ledger_file_path="/tmp/ledger.json",
+            response_cache_file_path=None,
             preserve_queues_for_debug=False,
             openai_client=None
         )
@@ -56,6 +60,7 @@ class TestLoadAppConfig:
             "dry_run": True,
             "retranslate_identical_source_strings": True,
             "translation_key_ledger_file_path": "/tmp/test-ledger.json",
+            "response_cache_file_path": "/tmp/test-cache.sqlite3",
             "supported_locales": [
                 {"code": "de", "name": "German"},
                 {"code": "es", "name": "Spanish"}
@@ -80,6 +85,7 @@ class TestLoadAppConfig:
         assert config.dry_run is True
         assert config.retranslate_identical_source_strings is True
         assert config.translation_key_ledger_file_path == "/tmp/test-ledger.json"
+        assert config.response_cache_file_path == "/tmp/test-cache.sqlite3"
         assert config.language_codes == {"de": "German", "es": "Spanish"}
         assert config.name_to_code == {"german": "de", "spanish": "es"}
 
@@ -99,12 +105,16 @@ class TestLoadAppConfig:
         assert config.model_name == "gpt-4"
         assert config.dry_run is True
         assert config.holistic_review_chunk_size == 30  # Updated from 75 to 30
-        assert config.max_concurrent_api_calls == 1
+        assert config.max_concurrent_api_calls == 16
+        assert config.translation_batch_size == 1
+        assert config.use_batch_api is False
+        assert config.batch_api_min_keys == 50
         assert config.process_all_files is False
         assert config.retranslate_identical_source_strings is False
         assert config.translation_key_ledger_file_path == os.path.join(
             config.project_root, "logs", "translation_key_ledger.json"
         )
+        assert config.response_cache_file_path is None
 
     def test_load_config_with_process_all_files_enabled(self):
         """Test process_all_files can be enabled via config."""
@@ -133,13 +143,32 @@ class TestLoadAppConfig:
                         mock_logger.return_value = MagicMock()
                         with patch.dict(os.environ, {
                             "REVIEW_MODEL_NAME": "gpt-4o",
-                            "HOLISTIC_REVIEW_CHUNK_SIZE": "100"
+                            "HOLISTIC_REVIEW_CHUNK_SIZE": "100",
+                            "MAX_CONCURRENT_API_CALLS": "4",
+                            "USE_BATCH_API": "true"
                         }):
                             config = load_app_config()
 
         assert config.model_name == "gpt-4"  # From config file
         assert config.review_model_name == "gpt-4o"  # From environment
         assert config.holistic_review_chunk_size == 100  # From environment
+        assert config.max_concurrent_api_calls == 4  # From environment
+        assert config.use_batch_api is True  # From environment
+
+    @pytest.mark.parametrize("env_value", ["lots", "0", "-2"])
+    def test_invalid_max_concurrent_api_calls_falls_back_to_config(self, env_value):
+        """A non-positive or non-integer override is logged and the configured value is used."""
+        mock_config = {"dry_run": True, "max_concurrent_api_calls": 8}
+
+        with patch("builtins.open", mock_open(read_data=yaml.dump(mock_config))), \
+                patch("os.path.exists", return_value=True), \
+                patch("os.access", return_value=True), \
+                patch("src.app_config.setup_logger", return_value=MagicMock()) as mock_logger, \
+                patch.dict(os.environ, {"MAX_CONCURRENT_API_CALLS": env_value}):
+            config = load_app_config()
+
+        assert config.max_concurrent_api_calls == 8
+        mock_logger.return_value.error.assert_called_once()
 
     def test_load_config_with_dotenv_file(self):
         """Test that .env file is loaded properly."""
@@ -161,21 +190,26 @@ class TestLoadAppConfig:
 
     def test_openai_client_creation_with_api_key(self):
         """Test that OpenAI client is created when API key is present."""
-        mock_config = {"dry_run": False}
+        mock_config = {"dry_run": False, "max_concurrent_api_calls": 8}
 
         with patch("builtins.open", mock_open(read_data=yaml.dump(mock_config))):
             with patch("os.path.exists", return_value=True):
                 with patch("os.access", return_value=True):
                     with patch("src.logging_config.setup_logger") as mock_logger:
                         mock_logger.return_value = MagicMock()
-                        with patch("src.app_config.AsyncOpenAI") as mock_openai:
+                        with patch("src.app_config.AsyncOpenAI") as mock_openai, \
+                                patch("src.app_config.DefaultAsyncHttpxClient") as mock_http_client:
                             mock_client = MagicMock()
                             mock_openai.return_value = mock_client
                             with patch.dict(os.environ, {"OPENAI_API_KEY": "sk-test-key"}):
                                 config = load_app_config()
 
-        mock_openai.assert_called_once_with(api_key="sk-test-key")
+        mock_openai.assert_called_once_with(api_key="sk-test-key", http_client=mock_http_client.return_value)
         assert config.openai_client == mock_client
+        # The connection pool is sized from the configured API concurrency.
+        limits = mock_http_client.call_args.kwargs["limits"]
+        assert limits.max_keepalive_connections == 8
+        assert limits.max_connections == 16
 
     def test_openai_client_none_in_dry_run(self):
         """Test that OpenAI client is None in dry run mode."""
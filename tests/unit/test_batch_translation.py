@@ -0,0 +1,170 @@
+"""
+Unit tests for translating texts through the OpenAI Batch API.
+"""
+import json
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from openai import OpenAIError
+
+# Set a dummy API key before importing the main script to prevent SystemExit.
+os.environ['OPENAI_API_KEY'] = 'DUMMY_KEY_FOR_TESTING'
+
+from src.translate_localization_files import build_context, translate_texts_batch
+
+
+def _batch_result_line(custom_id: str, content: str, status_code: int = 200) -> str:
+    return json.dumps({
+        "custom_id": custom_id,
+        "response": {
+            "status_code": status_code,
+            "body": {"choices": [{"message": {"content": content}}]}
+        }
+    })
+
+
+def _mock_batch_client(statuses, output_text):
+    mock_client = MagicMock()
+    mock_client.files.create = AsyncMock(return_value=MagicMock(id="file-in"))
+    batches = [MagicMock(id="batch-1", status=status, output_file_id="file-out") for status in statuses]
+    mock_client.batches.create = AsyncMock(return_value=batches[0])
+    mock_client.batches.retrieve = AsyncMock(side_effect=batches[1:])
+    mock_client.batches.cancel = AsyncMock()
+    mock_client.files.content = AsyncMock(return_value=MagicMock(text=output_text))
+    return mock_client
+
+
+@pytest.mark.asyncio
+async def test_translate_texts_batch_maps_results_by_key():
+    output_text = "\n".join([
+        _batch_result_line("key.two", "Zwei __PH_0__"),
+        _batch_result_line("key.one", "Eins"),
+    ])
+    mock_client = _mock_batch_client(["validating", "in_progress", "completed"], output_text)
+
+    with patch('src.translate_localization_files.client', mock_client), \
+         patch('src.translate_localization_files.build_context', wraps=build_context) as mock_build_context, \
+         patch('src.translate_localization_files.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+        results = await translate_texts_batch(
+            [(0, "One", "key.one"), (1, "Two {0}", "key.two")],
+            {},
+            {"key.one": "One", "key.two": "Two {0}"},
+            "German",
+            {}
+        )
+
+    assert results == {0: "Eins", 1: "Zwei {0}"}
+    # Glossary and context examples are built once for the whole file, not per key.
+    mock_build_context.assert_called_once()
+    # Polling backs off exponentially between status checks.
+    assert [call.args[0] for call in mock_sleep.await_args_list] == [5.0, 10.0]
+
+    upload = mock_client.files.create.await_args.kwargs
+    assert upload["purpose"] == "batch"
+    request_lines = upload["file"][1].decode('utf-8').splitlines()
+    assert [json.loads(line)["custom_id"] for line in request_lines] == ["key.one", "key.two"]
+    mock_client.batches.create.assert_awaited_once_with(
+        input_file_id="file-in",
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+
+
+@pytest.mark.asyncio
+async def test_translate_texts_batch_skips_failed_requests():
+    output_text = "\n".join([
+        _batch_result_line("key.one", "Eins"),
+        _batch_result_line("key.two", "ignored", status_code=500),
+    ])
+    mock_client = _mock_batch_client(["completed"], output_text)
+
+    with patch('src.translate_localization_files.client', mock_client):
+        results = await translate_texts_batch(
+            [(0, "One", "key.one"), (1, "Two", "key.two")],
+            {},
+            {"key.one": "One", "key.two": "Two"},
+            "German",
+            {}
+        )
+
+    assert results == {0: "Eins"}
+
+
+@pytest.mark.asyncio
+async def test_translate_texts_batch_returns_empty_when_batch_fails():
+    mock_client = _mock_batch_client(["failed"], "")
+
+    with patch('src.translate_localization_files.client', mock_client):
+        results = await translate_texts_batch(
+            [(0, "One", "key.one")],
+            {},
+            {"key.one": "One"},
+            "German",
+            {}
+        )
+
+    assert results == {}
+    mock_client.files.content.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_translate_texts_batch_retries_failed_status_checks():
+    mock_client = _mock_batch_client(["in_progress"], _batch_result_line("key.one", "Eins"))
+    mock_client.batches.retrieve = AsyncMock(side_effect=[
+        OpenAIError("connection reset"),
+        MagicMock(id="batch-1", status="completed", output_file_id="file-out"),
+    ])
+
+    with patch('src.translate_localization_files.client', mock_client), \
+         patch('src.translate_localization_files.asyncio.sleep', new=AsyncMock()):
+        results = await translate_texts_batch(
+            [(0, "One", "key.one")],
+            {},
+            {"key.one": "One"},
+            "German",
+            {}
+        )
+
+    assert results == {0: "Eins"}
+    assert mock_client.batches.retrieve.await_count == 2
+    mock_client.batches.cancel.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_translate_texts_batch_cancels_batch_when_status_checks_keep_failing():
+    mock_client = _mock_batch_client(["in_progress"], "")
+    mock_client.batches.retrieve = AsyncMock(side_effect=OpenAIError("service unavailable"))
+
+    with patch('src.translate_localization_files.client', mock_client), \
+         patch('src.translate_localization_files.asyncio.sleep', new=AsyncMock()):
+        results = await translate_texts_batch(
+            [(0, "One", "key.one")],
+            {},
+            {"key.one": "One"},
+            "German",
+            {}
+        )
+
+    assert results == {}
+    assert mock_client.batches.retrieve.await_count == 3
+    mock_client.batches.cancel.assert_awaited_once_with("batch-1")
+
+
+@pytest.mark.asyncio
+async def test_translate_texts_batch_cancels_batch_after_poll_deadline():
+    mock_client = _mock_batch_client(["in_progress", "in_progress"], "")
+
+    with patch('src.translate_localization_files.client', mock_client), \
+         patch('src.translate_localization_files._BATCH_POLL_TIMEOUT', 0.0):
+        results = await translate_texts_batch(
+            [(0, "One", "key.one")],
+            {},
+            {"key.one": "One"},
+            "German",
+            {}
+        )
+
+    assert results == {}
+    mock_client.batches.retrieve.assert_not_awaited()
+    mock_client.batches.cancel.assert_awaited_once_with("batch-1")
@@ -1,8 +1,10 @@
+import asyncio
+import errno
 import os
-import unittest
-from unittest.mock import patch, MagicMock
 import tempfile
 import textwrap
+import unittest
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 # Set a dummy API key before importing the main script.
 # This prevents the OpenAI client from failing in a test environment
@@ -11,17 +13,42 @@ os.environ['OPENAI_API_KEY'] = 'DUMMY_KEY_FOR_TESTING'
 
 # It's good practice to be able to import the functions to be tested.
 # This might require adjusting the Python path if the test runner doesn't handle it.
+from src.properties_parser import (
+    parse_properties_file,
+    reassemble_file,
+    reassemble_file_to,
+)
 from src.translate_localization_files import (
+    _HOLISTIC_REVIEW_PROMPT_STATIC,
+    _NEW_FILE_MODE,
+    _TRANSLATION_SYSTEM_PROMPT_STATIC,
+    _async_rmtree,
+    _build_holistic_review_system_prompt,
+    _fast_copy,
+    _holistic_review_prompt_header,
+    _iter_properties,
+    _render_glossary,
+    _render_pairs,
+    _translation_system_prompt,
+    _translation_worker,
+    _write_translated_file,
+    archive_original_files,
     build_context,
-    normalize_value,
     compute_ledger_hash,
+    copy_files_to_translation_queue,
+    copy_translated_files_back,
+    extract_language_from_filename,
     extract_texts_to_translate,
     filter_git_changed_keys_by_source,
     get_working_tree_changed_keys,
-    extract_language_from_filename,
-    run_post_translation_validation
+    get_working_tree_changed_keys_for_files,
+    load_glossary,
+    load_source_translations,
+    move_files_to_archive,
+    normalize_value,
+    run_post_translation_validation,
+    validate_paths,
 )
-from src.properties_parser import parse_properties_file, reassemble_file
 
 
 class TestCoreLogic(unittest.TestCase):
@@ -102,6 +129,40 @@ class TestCoreLogic(unittest.TestCase):
         )
         self.assertEqual(final_content, expected_content)
 
+    def test_load_source_translations_caches_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_path = os.path.join(temp_dir, 'app.properties')
+            with open(source_path, 'w', encoding='utf-8') as f:
+                f.write("key.one=Value one\n")
+
+            with patch('src.translate_localization_files.parse_properties_file', wraps=parse_properties_file) as parse_spy:
+                first = load_source_translations(source_path)
+                second = load_source_translations(source_path)
+                self.assertEqual(parse_spy.call_count, 1)
+                self.assertEqual(dict(second), {"key.one": "Value one"})
+                with self.assertRaises(TypeError):
+                    first["key.two"] = "shared cache must stay read-only"
+
+                with open(source_path, 'w', encoding='utf-8') as f:
+                    f.write("key.one=Value one\nkey.two=Value two\n")
+                updated = load_source_translations(source_path)
+                self.assertEqual(parse_spy.call_count, 2)
+                self.assertEqual(updated["key.two"], "Value two")
+
+    def test_reassemble_file_to_matches_reassemble_file(self):
+        content = "# Comment\nkey.one=Value one\nkey.two=Line one\\\n    line two\n\nkey.three=A\\nB\n"
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, encoding='utf-8', suffix='.properties') as temp_f:
+            temp_f.write(content)
+            temp_path = temp_f.name
+        try:
+            parsed_lines, _ = parse_properties_file(temp_path)
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                reassemble_file_to(parsed_lines, f)
+            with open(temp_path, 'r', encoding='utf-8') as f:
+                self.assertEqual(f.read(), reassemble_file(parsed_lines))
+        finally:
+            os.remove(temp_path)
+
     def test_translation_overwrites_original_value_with_newlines(self):
         """
         Ensure that an entry whose original_value contained an escaped newline
@@ -147,7 +208,12 @@ class TestCoreLogic(unittest.TestCase):
         def mock_count_tokens(text: str, model_name: str) -> int:
             return len(text)
 
-        with patch('src.translate_localization_files.count_tokens', side_effect=mock_count_tokens):
+        # One token per character keeps the arithmetic below easy to follow.
+        fake_encoding = MagicMock()
+        fake_encoding.encode_ordinary.side_effect = list
+        _render_glossary.cache_clear()
+
+        with patch('src.translate_localization_files._get_encoding', return_value=fake_encoding):
             existing_translations = {"key1": "translation1", "key2": "translation2", "key3": "translation3"}
             source_translations = {"key1": "source1", "key2": "source2", "key3": "source3"}
             language_glossary = {"term": "gloss"}
@@ -165,6 +231,70 @@ class TestCoreLogic(unittest.TestCase):
             self.assertIn("key1", context_text)
             self.assertNotIn("key2", context_text)
 
+    def test_build_context_renders_glossary_once_per_language(self):
+        """The glossary text and its token count are reused across translation requests."""
+        _render_glossary.cache_clear()
+        language_glossary = {"term": "gloss"}
+
+        with patch('src.translate_localization_files.count_tokens', return_value=5) as mock_count:
+            first = build_context({"key1": "Wert"}, {"key1": "Value"}, language_glossary, 2000, "test-model")
+            second = build_context({"key2": "Andere"}, {"key2": "Other"}, dict(language_glossary), 2000, "test-model")
+
+        self.assertEqual(first, ('key1 = "Wert"', '"term" should be translated as "gloss"'))
+        self.assertEqual(second[1], first[1])
+        glossary_call = call('"term" should be translated as "gloss"', "test-model")
+        self.assertEqual(mock_count.call_args_list.count(glossary_call), 1)
+
+    def test_build_context_stops_counting_tokens_at_the_budget(self):
+        existing_translations = {f"key{i}": f"Wert {i}" for i in range(100)}
+        source_translations = {f"key{i}": f"Value {i}" for i in range(100)}
+        _render_glossary.cache_clear()
+
+        # 400 tokens for the glossary and 1000 reserved leave room for two 400-token examples.
+        with patch('src.translate_localization_files.count_tokens', return_value=400) as mock_count:
+            context_text, _ = build_context(existing_translations, source_translations, {}, 2200, "test-model")
+
+        self.assertEqual(context_text, 'key0 = "Wert 0"\nkey1 = "Wert 1"')
+        # The glossary, the two examples that fit and the first one that does not.
+        self.assertEqual(mock_count.call_count, 4)
+
+    def test_prompts_start_with_a_shared_static_prefix(self):
+        """Language- and key-specific text must follow the static instructions."""
+        for language in ("German", "Spanish"):
+            translation_prompt = _translation_system_prompt(language, f"{language} rules")
+            self.assertTrue(translation_prompt.startswith(_TRANSLATION_SYSTEM_PROMPT_STATIC))
+            self.assertNotIn(language, _TRANSLATION_SYSTEM_PROMPT_STATIC)
+
+            review_prompt = _build_holistic_review_system_prompt(
+                language, ["menu.open"], "menu.open=Open", "menu.open=Offen", f"{language} rules"
+            )
+            self.assertTrue(review_prompt.startswith(_HOLISTIC_REVIEW_PROMPT_STATIC))
+            self.assertNotIn("menu.open", _HOLISTIC_REVIEW_PROMPT_STATIC)
+
+    def test_review_prompt_header_is_built_once_per_language(self):
+        _holistic_review_prompt_header.cache_clear()
+        for key in ("menu.open", "menu.close"):
+            _build_holistic_review_system_prompt("German", [key], f"{key}=x", f"{key}=y", "German rules")
+
+        self.assertEqual(_holistic_review_prompt_header.cache_info().misses, 1)
+        self.assertEqual(_holistic_review_prompt_header.cache_info().hits, 1)
+
+    def test_render_pairs_keeps_key_order_and_blanks_missing_values(self):
+        rendered = _render_pairs(["b", "a", "missing"], {"a": "1", "b": "2"})
+
+        self.assertEqual(rendered, "b=2\na=1\nmissing=")
+
+    def test_load_glossary_reads_utf8_and_rejects_invalid_json(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            glossary_path = os.path.join(temp_dir, 'glossary.json')
+            with open(glossary_path, 'w', encoding='utf-8') as f:
+                f.write('{"de": {"trade": "Handel", "fee": "Gebühr"}}')
+            self.assertEqual(load_glossary(glossary_path), {"de": {"trade": "Handel", "fee": "Gebühr"}})
+
+            with open(glossary_path, 'w', encoding='utf-8') as f:
+                f.write('{"de": ')
+            self.assertEqual(load_glossary(glossary_path), {})
+
     def test_normalize_value_logic(self):
         """Tests the `normalize_value` helper function."""
         self.assertEqual(normalize_value("hello\nworld"), "hello<newline>world")
@@ -172,6 +302,12 @@ class TestCoreLogic(unittest.TestCase):
         self.assertEqual(normalize_value("hello\\nworld"), "hello<newline>world")
         self.assertEqual(normalize_value(None), "")
 
+    def test_normalize_value_is_memoized(self):
+        normalize_value.cache_clear()
+        normalize_value("memo  value")
+        normalize_value("memo  value")
+        self.assertEqual(normalize_value.cache_info().hits, 1)
+
     def test_extract_texts_to_translate_logic(self):
         """Tests the logic of `extract_texts_to_translate`."""
         parsed_lines = [
@@ -348,6 +484,23 @@ class TestCoreLogic(unittest.TestCase):
         self.assertIn("Skipping key 'key_existing' (source==target)", joined_logs)
         self.assertIn("retranslate_identical_source_strings", joined_logs)
 
+    def test_extract_texts_to_translate_skips_hashing_without_ledger_baseline(self):
+        """Keys without a ledger entry should not be hashed."""
+        parsed_lines = [
+            {'type': 'entry', 'key': 'key_existing', 'value': 'Ziel', 'line_number': 0},
+        ]
+
+        with patch('src.translate_localization_files.compute_ledger_hash') as mock_hash:
+            texts, _, _ = extract_texts_to_translate(
+                parsed_lines,
+                {'key_existing': 'Source'},
+                {'key_existing': 'Ziel'},
+                file_ledger_entries={}
+            )
+
+        self.assertEqual(texts, [])
+        mock_hash.assert_not_called()
+
     def test_get_working_tree_changed_keys_parses_added_entries(self):
         """git diff added key/value lines should be parsed as newly synchronized keys."""
         git_diff_output = (
@@ -376,6 +529,40 @@ class TestCoreLogic(unittest.TestCase):
             keys
         )
 
+    def test_get_working_tree_changed_keys_for_files_uses_one_git_call(self):
+        """A multi-file diff is split by its '+++' headers into per-file key sets."""
+        git_diff_output = (
+            "diff --git a/mobile_de.properties b/mobile_de.properties\n"
+            "--- a/mobile_de.properties\n"
+            "+++ b/mobile_de.properties\n"
+            "@@ -1 +1 @@\n"
+            "+key.de=Wert\n"
+            "diff --git a/mobile_fr.properties b/mobile_fr.properties\n"
+            "--- a/mobile_fr.properties\n"
+            "+++ b/mobile_fr.properties\n"
+            "@@ -2 +2 @@\n"
+            "+key.fr=Valeur"
+        )
+        mocked_result = MagicMock(returncode=0, stdout=git_diff_output, stderr="")
+        paths = [
+            "/repo/mobile_de.properties",
+            "/repo/mobile_fr.properties",
+            "/repo/mobile_es.properties",
+        ]
+        with patch("src.translate_localization_files.subprocess.run", return_value=mocked_result) as mock_run:
+            keys_by_file = get_working_tree_changed_keys_for_files(paths, "/repo")
+
+        mock_run.assert_called_once()
+        self.assertEqual(
+            mock_run.call_args.args[0][-3:],
+            ["mobile_de.properties", "mobile_fr.properties", "mobile_es.properties"]
+        )
+        self.assertEqual(keys_by_file, {
+            "/repo/mobile_de.properties": {"key.de"},
+            "/repo/mobile_fr.properties": {"key.fr"},
+            "/repo/mobile_es.properties": set(),
+        })
+
     def test_get_working_tree_changed_keys_returns_empty_on_command_failure(self):
         """git diff inspection failures should fail open and return no changed keys."""
         with patch("src.translate_localization_files.subprocess.run", side_effect=OSError("git missing")):
@@ -609,11 +796,11 @@ class TestFileDetectionLogic(unittest.TestCase):
         from src.translate_localization_files import get_changed_translation_files
 
         # Simulate git status output
-        git_output = textwrap.dedent("""
-             M i18n/resources/mobile_de.properties
-             M i18n/resources/desktop_de.properties
-             M i18n/resources/mobile_es.properties
-        """).strip()
+        git_output = (
+            " M i18n/resources/mobile_de.properties\n"
+            " M i18n/resources/desktop_de.properties\n"
+            " M i18n/resources/mobile_es.properties"
+        )
         mock_subprocess_run.return_value = MagicMock(stdout=git_output, stderr="", check_returncode=MagicMock())
 
         repo_root = "/fake/repo"
@@ -638,11 +825,11 @@ class TestFileDetectionLogic(unittest.TestCase):
         from src.translate_localization_files import get_changed_translation_files
 
         # Simulate git status output
-        git_output = textwrap.dedent("""
-             M i18n/resources/mobile_de.properties
-             M i18n/resources/desktop_de.properties
-             M i18n/resources/mobile_es.properties
-        """).strip()
+        git_output = (
+            " M i18n/resources/mobile_de.properties\n"
+            " M i18n/resources/desktop_de.properties\n"
+            " M i18n/resources/mobile_es.properties"
+        )
         mock_subprocess_run.return_value = MagicMock(stdout=git_output, stderr="", check_returncode=MagicMock())
 
         repo_root = "/fake/repo"
@@ -675,7 +862,7 @@ class TestFileDetectionLogic(unittest.TestCase):
             ?? i18n/resources/academy_zh-Hant.properties
             ?? i18n/resources/application_zh-Hans.properties
             ?? i18n/resources/application_zh-Hant.properties
-        """).strip()
+        """).strip("\n")
         mock_subprocess_run.return_value = MagicMock(stdout=git_output, stderr="", check_returncode=MagicMock())
 
         repo_root = "/fake/repo"
@@ -758,15 +945,57 @@ class TestFileDetectionLogic(unittest.TestCase):
         mock_subprocess_run.assert_not_called()
         self.assertEqual(files, ["mobile_de.properties", "mobile_es.properties"])
 
+    @patch('subprocess.run')
+    def test_get_changed_files_glob_with_separator_matches_relative_path(self, mock_subprocess_run):
+        """A glob containing '/' is matched against the full relative path, not the basename."""
+        from src.translate_localization_files import get_changed_translation_files
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            input_folder = os.path.join(temp_dir, "i18n", "resources")
+            nested_folder = os.path.join(input_folder, "nested")
+            os.makedirs(nested_folder, exist_ok=True)
+
+            for file_path in [
+                os.path.join(input_folder, "mobile_de.properties"),
+                os.path.join(nested_folder, "mobile_es.properties"),
+            ]:
+                with open(file_path, "w", encoding="utf-8") as temp_file:
+                    temp_file.write("k=v\n")
+
+            with patch.dict('os.environ', {'TRANSLATION_FILTER_GLOB': 'nested/*.properties'}):
+                files = get_changed_translation_files(input_folder, temp_dir, process_all_files=True)
+
+        mock_subprocess_run.assert_not_called()
+        self.assertEqual(files, ["nested/mobile_es.properties"])
+
+    @patch('subprocess.run')
+    def test_get_changed_files_strips_input_folder_prefix(self, mock_subprocess_run):
+        """Paths are made relative to the input folder; paths outside it are ignored."""
+        from src.translate_localization_files import get_changed_translation_files
+
+        git_output = (
+            " M i18n/resources/nested/mobile_de.properties\n"
+            " M i18n/resources_other/mobile_es.properties"
+        )
+        mock_subprocess_run.return_value = MagicMock(stdout=git_output, stderr="", check_returncode=MagicMock())
+
+        changed_files = get_changed_translation_files("/fake/repo/i18n/resources", "/fake/repo")
+        self.assertEqual(changed_files, [os.path.join("nested", "mobile_de.properties")])
+
+        # When the input folder is the repository root, paths are used as reported.
+        mock_subprocess_run.return_value = MagicMock(stdout="?? mobile_fr.properties", stderr="", check_returncode=MagicMock())
+        changed_files = get_changed_translation_files("/fake/repo", "/fake/repo")
+        self.assertEqual(changed_files, ["mobile_fr.properties"])
+
     @patch('subprocess.run')
     def test_get_changed_files_excludes_archive_paths(self, mock_subprocess_run):
         """Tests file detection excludes archive directories in both discovery modes."""
         from src.translate_localization_files import get_changed_translation_files
 
-        git_output = textwrap.dedent("""
-             M i18n/resources/archive/mobile_de.properties
-             M i18n/resources/mobile_es.properties
-        """).strip()
+        git_output = (
+            " M i18n/resources/archive/mobile_de.properties\n"
+            " M i18n/resources/mobile_es.properties"
+        )
         mock_subprocess_run.return_value = MagicMock(stdout=git_output, stderr="", check_returncode=MagicMock())
 
         repo_root = "/fake/repo"
@@ -885,5 +1114,170 @@ class TestFilterGitChangedKeys(unittest.TestCase):
         self.assertIn("key.orphan", result)
 
 
+class TestFileCopyHelpers(unittest.TestCase):
+    """Tests for the helpers that stage and archive translation files."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.input_folder = os.path.join(self.temp_dir.name, 'input')
+        self.dest_folder = os.path.join(self.temp_dir.name, 'dest')
+        os.makedirs(os.path.join(self.input_folder, 'sub'))
+        self.files = ['app_de.properties', 'app_fr.properties', os.path.join('sub', 'module_es.properties')]
+        for name in self.files:
+            with open(os.path.join(self.input_folder, name), 'w', encoding='utf-8') as f:
+                f.write(f"key={name}\n")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _assert_copied(self, names):
+        for name in names:
+            with open(os.path.join(self.dest_folder, name), 'r', encoding='utf-8') as f:
+                self.assertEqual(f.read(), f"key={name}\n")
+
+    def test_copy_files_to_translation_queue_copies_all_and_skips_missing(self):
+        asyncio.run(copy_files_to_translation_queue(
+            self.files + ['missing_it.properties'], self.input_folder, self.dest_folder
+        ))
+
+        self._assert_copied(self.files)
+        self.assertFalse(os.path.exists(os.path.join(self.dest_folder, 'missing_it.properties')))
+
+    def test_archive_original_files_copies_all_and_skips_missing(self):
+        asyncio.run(archive_original_files(self.files + ['missing_it.properties'], self.input_folder, self.dest_folder))
+
+        self._assert_copied(self.files)
+        self.assertFalse(os.path.exists(os.path.join(self.dest_folder, 'missing_it.properties')))
+
+    def test_move_files_to_archive_moves_all_language_files(self):
+        asyncio.run(move_files_to_archive(self.input_folder, self.dest_folder))
+
+        self._assert_copied(self.files)
+        for name in self.files:
+            self.assertFalse(os.path.exists(os.path.join(self.input_folder, name)))
+
+    def test_copy_translated_files_back_copies_into_subdirectories(self):
+        asyncio.run(copy_translated_files_back(self.input_folder, self.dest_folder))
+
+        self._assert_copied(self.files)
+
+    def test_write_translated_file_replaces_destination_atomically(self):
+        dest_path = os.path.join(self.dest_folder, 'sub', 'app_de.properties')
+        parsed_lines = [{'type': 'entry', 'key': 'key', 'value': 'Wert', 'original_value': 'Wert'}]
+
+        with patch('src.translate_localization_files.os.fsync', wraps=os.fsync) as mock_fsync:
+            _write_translated_file(dest_path, parsed_lines)
+
+        mock_fsync.assert_called_once()
+        with open(dest_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), "key=Wert\n")
+        self.assertEqual(os.listdir(os.path.dirname(dest_path)), ['app_de.properties'])
+        self.assertEqual(os.stat(dest_path).st_mode & 0o777, _NEW_FILE_MODE)
+
+        with patch('src.translate_localization_files.reassemble_file_to', side_effect=OSError("disk full")), \
+             self.assertRaises(OSError):
+            _write_translated_file(dest_path, parsed_lines)
+        with open(dest_path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), "key=Wert\n")
+        self.assertEqual(os.listdir(os.path.dirname(dest_path)), ['app_de.properties'])
+
+    def test_validate_paths_uses_owner_bits_and_reports_missing_paths(self):
+        with patch('src.translate_localization_files.os.access') as mock_access:
+            validate_paths(self.input_folder, self.input_folder, self.temp_dir.name, self.temp_dir.name)
+        mock_access.assert_not_called()
+
+        with self.assertRaises(FileNotFoundError):
+            validate_paths(self.input_folder, self.dest_folder, self.temp_dir.name, self.temp_dir.name)
+
+    def test_fast_copy_preserves_content_and_mtime_with_and_without_copy_file_range(self):
+        source_path = os.path.join(self.input_folder, 'app_de.properties')
+        os.chmod(source_path, 0o640)
+        os.utime(source_path, ns=(1_000_000_000, 2_000_000_000))
+        os.makedirs(self.dest_folder)
+        dest_path = os.path.join(self.dest_folder, 'app_de.properties')
+
+        _fast_copy(source_path, dest_path)
+        self._assert_copied(['app_de.properties'])
+        self.assertEqual(os.stat(dest_path).st_mtime_ns, 2_000_000_000)
+        self.assertEqual(os.stat(dest_path).st_mode & 0o777, 0o640)
+
+        unsupported = OSError(errno.EXDEV, "cross-device")
+        with patch('src.translate_localization_files.os.copy_file_range', side_effect=unsupported, create=True):
+            _fast_copy(source_path, dest_path, preserve_times=False)
+        self._assert_copied(['app_de.properties'])
+
+    def test_async_rmtree_removes_nested_files_and_directories(self):
+        os.symlink(self.temp_dir.name, os.path.join(self.input_folder, 'sub', 'link'))
+
+        asyncio.run(_async_rmtree(self.input_folder))
+
+        self.assertFalse(os.path.exists(self.input_folder))
+        self.assertTrue(os.path.isdir(self.temp_dir.name))
+
+    def test_iter_properties_yields_nested_properties_files_only(self):
+        with open(os.path.join(self.input_folder, 'sub', 'notes.txt'), 'w', encoding='utf-8') as f:
+            f.write("ignored\n")
+
+        found = sorted(_iter_properties(self.input_folder))
+
+        self.assertEqual(found, sorted((os.path.join(self.input_folder, name), name) for name in self.files))
+
+
+class TestTranslationWorkers(unittest.TestCase):
+    """Tests for the fixed pool of translation workers."""
+
+    def test_workers_resolve_every_queued_future(self):
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_translate(text, key, *args):
+            nonlocal in_flight, max_in_flight
+            index = args[6]
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return index, text.upper()
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            futures = [loop.create_future() for _ in range(5)]
+            queue = asyncio.Queue()
+            for idx in range(5):
+                queue.put_nowait([(idx, f"text{idx}", f"key{idx}")])
+            with patch('src.translate_localization_files.translate_text_async', side_effect=fake_translate):
+                await asyncio.gather(*[
+                    _translation_worker(queue, futures, {}, {}, "German", {}, MagicMock(), MagicMock())
+                    for _ in range(2)
+                ])
+            return [future.result() for future in futures]
+
+        results = asyncio.run(run())
+
+        self.assertEqual(results, [(idx, f"TEXT{idx}") for idx in range(5)])
+        self.assertEqual(max_in_flight, 2)
+
+    def test_worker_falls_back_to_single_keys_for_untranslated_chunk_entries(self):
+        async def fake_translate(text, key, *args):
+            return args[6], f"single {text}"
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            futures = [loop.create_future() for _ in range(3)]
+            queue = asyncio.Queue()
+            queue.put_nowait([(idx, f"text{idx}", f"key{idx}") for idx in range(3)])
+            with patch('src.translate_localization_files.translate_texts_multi_async',
+                       new=AsyncMock(return_value={0: "multi text0", 2: "multi text2"})) as mock_multi, \
+                 patch('src.translate_localization_files.translate_text_async', side_effect=fake_translate) as mock_single:
+                await _translation_worker(queue, futures, {}, {}, "German", {}, MagicMock(), MagicMock())
+            return [future.result() for future in futures], mock_multi, mock_single
+
+        results, mock_multi, mock_single = asyncio.run(run())
+
+        self.assertEqual(results, [(0, "multi text0"), (1, "single text1"), (2, "multi text2")])
+        mock_multi.assert_awaited_once()
+        self.assertEqual(mock_single.call_count, 1)
+
+
 if __name__ == '__main__':
     unittest.main()
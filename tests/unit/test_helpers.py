@@ -1,11 +1,20 @@
+import asyncio
 import unittest
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from openai import OpenAIError
 
 from src.translate_localization_files import (
+    _SCHEMA_VALIDATION_ERRORS,
+    RetryState,
+    _escape_messageformat_if_needed,
+    _get_encoding,
+    _handle_retry,
+    _validate_localization,
+    clean_translated_text,
+    count_tokens,
     extract_placeholders,
     restore_placeholders,
-    clean_translated_text,
-    count_tokens
 )
 
 
@@ -19,6 +28,13 @@ class TestHelperFunctions(unittest.TestCase):
         restored = restore_placeholders(processed, mapping)
         self.assertEqual(restored, original)
 
+    def test_extract_placeholders_uses_sequential_tokens(self):
+        text = " ".join(f"{{{i}}}" for i in range(12))
+        processed, mapping = extract_placeholders(text)
+        self.assertEqual(list(mapping), [f"__PH_{i}__" for i in range(12)])
+        # __PH_1__ must not clobber part of __PH_10__ / __PH_11__ on restore.
+        self.assertEqual(restore_placeholders(processed, mapping), text)
+
     def test_clean_translated_text_quotes_and_brackets(self):
         self.assertEqual(
             clean_translated_text('"Hallo"', 'Hallo'),
@@ -33,17 +49,67 @@ class TestHelperFunctions(unittest.TestCase):
             clean_translated_text('"Hallo"', '"Hallo"'),
             '"Hallo"'
         )
+        # Quotes are stripped before brackets, so both wrappers can be removed
+        self.assertEqual(
+            clean_translated_text('"[Hallo]"', 'Hallo'),
+            'Hallo'
+        )
+
+    def setUp(self):
+        # The encoding is cached per model; start every test from a clean cache.
+        _get_encoding.cache_clear()
+        self.addCleanup(_get_encoding.cache_clear)
 
     def test_count_tokens_fallback(self):
         # Force encoding_for_model to raise to trigger fallback
-        with patch('src.translate_localization_files.tiktoken.encoding_for_model', side_effect=Exception()):
+        with patch('tiktoken.encoding_for_model', side_effect=Exception()):
             # Also patch get_encoding to provide predictable encode
             fake_enc = MagicMock()
-            fake_enc.encode.side_effect = lambda s: list(s.split())
-            with patch('src.translate_localization_files.tiktoken.get_encoding', return_value=fake_enc):
+            fake_enc.encode_ordinary.side_effect = lambda s: list(s.split())
+            with patch('tiktoken.get_encoding', return_value=fake_enc):
                 count = count_tokens('one two three')
         self.assertEqual(count, 3)
 
+    def test_count_tokens_resolves_encoding_once_per_model(self):
+        fake_enc = MagicMock()
+        fake_enc.encode_ordinary.side_effect = lambda s: list(s.split())
+        with patch('tiktoken.encoding_for_model', return_value=fake_enc) as mock_for_model:
+            count_tokens('one two', 'model-a')
+            count_tokens('one two three', 'model-a')
+            count_tokens('one', 'model-b')
+        self.assertEqual(mock_for_model.call_count, 2)
+
+    def test_handle_retry_uses_retry_after_header_as_lower_bound(self):
+        api_exc = OpenAIError("rate limited")
+        api_exc.response = MagicMock(headers={"Retry-After": "1500ms"})
+        with patch('src.translate_localization_files.asyncio.sleep', new=AsyncMock()) as mock_sleep, \
+             patch('src.translate_localization_files.random.uniform', return_value=1.0):
+            self.assertTrue(asyncio.run(_handle_retry(1, 3, 1, "key", api_exc)))
+        mock_sleep.assert_awaited_once_with(1.5)
+
+    def test_handle_retry_uses_capped_decorrelated_jitter(self):
+        state = RetryState()
+        with patch('src.translate_localization_files.asyncio.sleep', new=AsyncMock()) as mock_sleep, \
+             patch('src.translate_localization_files.random.uniform', side_effect=lambda low, high: high) as mock_uniform:
+            for attempt in range(1, 5):
+                self.assertTrue(asyncio.run(_handle_retry(attempt, 5, 2, "key", OpenAIError("boom"), state)))
+            self.assertFalse(asyncio.run(_handle_retry(5, 5, 2, "key", state=state)))
+        # Each draw is bounded by three times the previous delay and capped at 30 seconds.
+        self.assertEqual([call.args[0] for call in mock_sleep.await_args_list], [6, 18, 30.0, 30.0])
+        self.assertEqual(mock_uniform.call_args_list[1].args, (2, 18))
+
+    def test_compiled_localization_validator(self):
+        _validate_localization({"key.one": "Eins", "key.two": ""})
+        with self.assertRaises(_SCHEMA_VALIDATION_ERRORS):
+            _validate_localization({"key.one": 1})
+        with self.assertRaises(_SCHEMA_VALIDATION_ERRORS):
+            _validate_localization(["not", "an", "object"])
+
+    def test_escape_messageformat_only_for_sources_with_placeholders(self):
+        self.assertEqual(_escape_messageformat_if_needed("Hello {0}", "Hallo '{0}'"), "Hallo ''{0}''")
+        self.assertEqual(_escape_messageformat_if_needed("It's {0}", "C''est {0}"), "C''est {0}")
+        self.assertEqual(_escape_messageformat_if_needed("It's fine", "C'est bon"), "C'est bon")
+        self.assertEqual(_escape_messageformat_if_needed("Empty {}", "Vide '{}'"), "Vide '{}'")
 
 if __name__ == '__main__':
     unittest.main()
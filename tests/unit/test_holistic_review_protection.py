@@ -5,9 +5,20 @@ Tests the ability to protect placeholders during holistic review phase
 to prevent the AI from modifying, removing, or adding placeholders.
 """
 
+import asyncio
+import os
+import re
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Set a dummy API key before importing the main script to prevent SystemExit.
+os.environ['OPENAI_API_KEY'] = 'DUMMY_KEY_FOR_TESTING'
+
 from src.translate_localization_files import (
+    holistic_review_async,
     protect_placeholders_in_properties,
-    restore_placeholders_in_properties
+    restore_placeholders_in_properties,
 )
 
 
@@ -160,3 +171,68 @@ key2=World {1}"""
         assert "# Comment" in protected
         assert "\n\n" in protected  # Blank line preserved
         assert "__PH_" in protected
+
+    def test_restore_many_placeholders_without_prefix_clashes(self):
+        """Restoring __PH_1__ must not clobber the start of __PH_10__."""
+        original = "\n".join(f"key{i}=Value {{{i}}}" for i in range(12))
+
+        protected, placeholder_map = protect_placeholders_in_properties(original)
+        restored = restore_placeholders_in_properties(protected, placeholder_map)
+
+        assert restored == original
+
+
+def _review_response(content: str) -> MagicMock:
+    return MagicMock(choices=[MagicMock(message=MagicMock(content=content))])
+
+
+@pytest.mark.asyncio
+async def test_holistic_review_retries_when_response_values_are_not_strings():
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock(side_effect=[
+        _review_response('{"key.one": 1}'),
+        _review_response('{"key.one": "Eins {0}"}'),
+    ])
+
+    with patch('src.translate_localization_files.client', mock_client), \
+         patch('src.translate_localization_files.DRY_RUN', False), \
+         patch('src.translate_localization_files._handle_retry', new=AsyncMock(return_value=True)) as mock_retry:
+        result = await holistic_review_async(
+            source_content="key.one=One {0}",
+            translated_content="key.one=Eins {0}",
+            target_language="German",
+            keys_to_review=["key.one"],
+            semaphore=asyncio.Semaphore(1),
+            rate_limiter=MagicMock(__aenter__=AsyncMock(), __aexit__=AsyncMock(return_value=False)),
+            style_rules_text=""
+        )
+
+    assert result == {"key.one": "Eins {0}"}
+    assert mock_client.chat.completions.create.await_count == 2
+    mock_retry.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_holistic_review_keeps_source_and_translation_tokens_apart():
+    """A token copied from the source must not resolve through the translation's mapping."""
+    def reply_with_source_token(**kwargs):
+        source_token = re.search(r'k1=Hello (__PH_\w+?__)', kwargs["messages"][0]["content"]).group(1)
+        return _review_response(f'{{"k1": "Hallo {source_token}"}}')
+
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock(side_effect=reply_with_source_token)
+
+    with patch('src.translate_localization_files.client', mock_client), \
+         patch('src.translate_localization_files.DRY_RUN', False), \
+         patch('src.translate_localization_files._response_cache', None):
+        result = await holistic_review_async(
+            source_content="k1=Hello {0}\nk2=<b>{1}</b>",
+            translated_content="k1=Hallo\nk2=<b>{1}</b>",
+            target_language="German",
+            keys_to_review=["k1"],
+            semaphore=asyncio.Semaphore(1),
+            rate_limiter=MagicMock(__aenter__=AsyncMock(), __aexit__=AsyncMock(return_value=False)),
+            style_rules_text=""
+        )
+
+    assert result == {"k1": "Hallo {0}"}
@@ -0,0 +1,101 @@
+"""
+Unit tests for translating several keys with one chat completion.
+"""
+import asyncio
+import os
+import tempfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Set a dummy API key before importing the main script to prevent SystemExit.
+os.environ['OPENAI_API_KEY'] = 'DUMMY_KEY_FOR_TESTING'
+
+from src.response_cache import ResponseCache
+from src.translate_localization_files import (
+    _chunk_translation_items,
+    _parse_multi_translation_reply,
+    translate_texts_multi_async,
+)
+
+
+def _chat_response(content: str) -> MagicMock:
+    return MagicMock(choices=[MagicMock(message=MagicMock(content=content))])
+
+
+def test_chunk_translation_items_limits_keys_and_characters():
+    items = [(0, "a" * 10, "k0"), (1, "b" * 10, "k1"), (2, "c" * 10, "k2"), (3, "d" * 50, "k3"), (4, "e", "k4")]
+
+    chunks = _chunk_translation_items(items, max_keys=2, max_chars=30)
+
+    assert [[index for index, _, _ in chunk] for chunk in chunks] == [[0, 1], [2], [3], [4]]
+
+
+def test_parse_multi_translation_reply_requires_every_number_in_order():
+    assert _parse_multi_translation_reply("1\tEins\n%%\n2\tZwei\n", 2) == ["Eins", "Zwei"]
+    assert _parse_multi_translation_reply("1\tEins\n%%\n2\tZwei", 3) is None
+    assert _parse_multi_translation_reply("2\tZwei\n%%\n1\tEins", 2) is None
+    assert _parse_multi_translation_reply("Eins\n%%\nZwei", 2) is None
+
+
+@pytest.mark.asyncio
+async def test_translate_texts_multi_async_sends_one_request_and_restores_placeholders():
+    mock_create = AsyncMock(return_value=_chat_response("1\tEins\n%%\n2\tZwei __PH_0__"))
+
+    with patch('src.translate_localization_files.client.chat.completions.create', new=mock_create), \
+         patch('src.translate_localization_files._response_cache', None):
+        results = await translate_texts_multi_async(
+            [(0, "One", "key.one"), (3, "Two {0}", "key.two")],
+            {},
+            {"key.one": "One", "key.two": "Two {0}"},
+            "German",
+            {},
+            asyncio.Semaphore(1),
+            MagicMock(__aenter__=AsyncMock(), __aexit__=AsyncMock(return_value=False))
+        )
+
+    assert results == {0: "Eins", 3: "Zwei {0}"}
+    mock_create.assert_awaited_once()
+    user_prompt = mock_create.await_args.kwargs["messages"][1]["content"]
+    assert "1\t(Key: key.one) One\n%%\n2\t(Key: key.two) Two __PH_0__" in user_prompt
+
+
+@pytest.mark.asyncio
+async def test_translate_texts_multi_async_returns_nothing_on_count_mismatch():
+    mock_create = AsyncMock(return_value=_chat_response("1\tEins"))
+
+    with patch('src.translate_localization_files.client.chat.completions.create', new=mock_create), \
+         patch('src.translate_localization_files._response_cache', None):
+        results = await translate_texts_multi_async(
+            [(0, "One", "key.one"), (1, "Two", "key.two")],
+            {},
+            {"key.one": "One", "key.two": "Two"},
+            "German",
+            {},
+            asyncio.Semaphore(1),
+            MagicMock(__aenter__=AsyncMock(), __aexit__=AsyncMock(return_value=False))
+        )
+
+    assert results == {}
+
+
+@pytest.mark.asyncio
+async def test_translate_texts_multi_async_does_not_cache_rejected_replies():
+    mock_create = AsyncMock(side_effect=[_chat_response("1\tEins"), _chat_response("1\tEins\n%%\n2\tZwei")])
+    items = [(0, "One", "key.one"), (1, "Two", "key.two")]
+    args = ({}, {"key.one": "One", "key.two": "Two"}, "German", {}, asyncio.Semaphore(1),
+            MagicMock(__aenter__=AsyncMock(), __aexit__=AsyncMock(return_value=False)))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ResponseCache(os.path.join(temp_dir, "cache.sqlite3"))
+        with patch('src.translate_localization_files.client.chat.completions.create', new=mock_create), \
+             patch('src.translate_localization_files._response_cache', cache):
+            first = await translate_texts_multi_async(items, *args)
+            second = await translate_texts_multi_async(items, *args)
+            third = await translate_texts_multi_async(items, *args)
+        cache.close()
+
+    assert first == {}
+    assert second == third == {0: "Eins", 1: "Zwei"}
+    # The rejected reply was not cached; the accepted one was.
+    assert mock_create.await_count == 2
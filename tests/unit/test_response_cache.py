@@ -0,0 +1,114 @@
+"""
+Unit tests for the persistent model response cache.
+"""
+import asyncio
+import os
+import tempfile
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Set a dummy API key before importing the main script to prevent SystemExit.
+os.environ['OPENAI_API_KEY'] = 'DUMMY_KEY_FOR_TESTING'
+
+from src.response_cache import ResponseCache, make_cache_key
+from src.translate_localization_files import translate_text_async
+
+
+def test_make_cache_key_depends_on_part_boundaries():
+    assert make_cache_key("ab", "c") == make_cache_key("ab", "c")
+    assert make_cache_key("ab", "c") != make_cache_key("a", "bc")
+
+
+def test_response_cache_roundtrip_and_expiry():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache_path = os.path.join(temp_dir, "nested", "cache.sqlite3")
+        cache = ResponseCache(cache_path)
+        cache.set("key", "Wert")
+        cache.set("key", "Neuer Wert")
+        assert cache.get("key") == "Neuer Wert"
+        assert cache.get("missing") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+        cache.close()
+
+        reopened = ResponseCache(cache_path, ttl_seconds=60)
+        with patch('src.response_cache.time.time', return_value=10 ** 12):
+            assert reopened.get("key") is None
+        reopened.close()
+
+
+def test_response_cache_fails_open_when_unavailable():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ResponseCache(temp_dir)  # A directory cannot be opened as a database.
+        cache.set("key", "value")
+        assert cache.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_translate_text_async_reuses_cached_reply():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ResponseCache(os.path.join(temp_dir, "cache.sqlite3"))
+        mock_create = AsyncMock(return_value=MagicMock(
+            choices=[MagicMock(message=MagicMock(content="Hallo __PH_0__"))]
+        ))
+
+        with patch('src.translate_localization_files._response_cache', cache), \
+             patch('src.translate_localization_files.client.chat.completions.create', new=mock_create):
+            args = ({}, {"greeting": "Hello {0}"}, "German", {}, asyncio.Semaphore(1), MagicMock())
+            first = await translate_text_async("Hello {0}", "greeting", *args, 0)
+            second = await translate_text_async("Hello {0}", "greeting", *args, 1)
+
+        cache.close()
+
+    assert first == (0, "Hallo {0}")
+    assert second == (1, "Hallo {0}")
+    mock_create.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_translate_text_async_cache_ignores_context_but_not_glossary():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ResponseCache(os.path.join(temp_dir, "cache.sqlite3"))
+        mock_create = AsyncMock(return_value=MagicMock(
+            choices=[MagicMock(message=MagicMock(content="Handel"))]
+        ))
+        source = {"trade": "Trade", "offer": "Offer"}
+
+        with patch('src.translate_localization_files._response_cache', cache), \
+             patch('src.translate_localization_files.client.chat.completions.create', new=mock_create):
+            common = (source, "German")
+            await translate_text_async("Trade", "trade", {}, *common, {}, asyncio.Semaphore(1), MagicMock(), 0)
+            # Translations written back by a previous run change the context examples only.
+            await translate_text_async(
+                "Trade", "trade", {"offer": "Angebot"}, *common, {}, asyncio.Semaphore(1), MagicMock(), 1
+            )
+            assert mock_create.await_count == 1
+
+            await translate_text_async(
+                "Trade", "trade", {}, *common, {"de": {"Trade": "Handel"}}, asyncio.Semaphore(1), MagicMock(), 2
+            )
+
+        cache.close()
+
+    assert mock_create.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_translate_text_async_cache_misses_when_brand_glossary_changes():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = ResponseCache(os.path.join(temp_dir, "cache.sqlite3"))
+        mock_create = AsyncMock(return_value=MagicMock(
+            choices=[MagicMock(message=MagicMock(content="Bisq Easy"))]
+        ))
+        args = ({}, {"app.name": "Bisq Easy"}, "German", {}, asyncio.Semaphore(1), MagicMock())
+
+        with patch('src.translate_localization_files._response_cache', cache), \
+             patch('src.translate_localization_files.client.chat.completions.create', new=mock_create):
+            await translate_text_async("Bisq Easy", "app.name", *args, 0)
+            brand_prefix = "\n**Brand/Technical Glossary (Do NOT translate these terms):**\n- Bisq Easy\n"
+            with patch('src.translate_localization_files._TRANSLATION_PROMPT_PREFIX', brand_prefix):
+                await translate_text_async("Bisq Easy", "app.name", *args, 1)
+
+        cache.close()
+
+    assert mock_create.await_count == 2
@@ -4,10 +4,11 @@ import tempfile
 from pathlib import Path
 
 from src.translate_localization_files import (
+    append_translation_key_ledger_journal,
     build_file_key_ledger,
     compute_ledger_hash,
     load_translation_key_ledger,
-    save_translation_key_ledger
+    save_translation_key_ledger,
 )
 
 
@@ -104,3 +105,26 @@ def test_build_file_key_ledger_marks_failed_keys():
     )
 
     assert built["key.one"]["status"] == "failed"
+
+
+def test_translation_key_ledger_replays_journal_and_save_clears_it():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        ledger_path = Path(temp_dir) / "ledger.json"
+        journal_path = Path(f"{ledger_path}.journal")
+        base_entry = {"key.one": {"source_hash": compute_ledger_hash("Old"), "target_hash": compute_ledger_hash("Alt")}}
+        new_entry = {"key.one": {"source_hash": compute_ledger_hash("New"), "target_hash": compute_ledger_hash("Neu")}}
+        fr_entry = {"key.one": {"source_hash": compute_ledger_hash("New"), "target_hash": compute_ledger_hash("Nouveau")}}
+
+        save_translation_key_ledger(str(ledger_path), {"mobile_de.properties": base_entry})
+        append_translation_key_ledger_journal(str(ledger_path), "mobile_de.properties", new_entry)
+        append_translation_key_ledger_journal(str(ledger_path), "mobile_fr.properties", fr_entry)
+        # Simulate a crash that truncated the last journal line.
+        with open(journal_path, "a", encoding="utf-8") as journal_file:
+            journal_file.write('{"file": "mobile_es.prop')
+
+        loaded = load_translation_key_ledger(str(ledger_path))
+        assert loaded == {"mobile_de.properties": new_entry, "mobile_fr.properties": fr_entry}
+
+        save_translation_key_ledger(str(ledger_path), loaded)
+        assert not journal_path.exists()
+        assert load_translation_key_ledger(str(ledger_path)) == loaded
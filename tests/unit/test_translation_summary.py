@@ -5,7 +5,10 @@ import unittest
 
 os.environ['OPENAI_API_KEY'] = 'DUMMY_KEY_FOR_TESTING'
 
-from src.translate_localization_files import generate_translation_summary
+from src.translate_localization_files import (
+    generate_translation_summary,
+    render_skipped_files_report,
+)
 
 # Codes used across all tests — mirrors a realistic subset of production config
 SUPPORTED_CODES = ["de", "es", "fr", "pt_BR", "af_ZA"]
@@ -122,5 +125,22 @@ class TestTranslationSummary(unittest.TestCase):
         self.assertIn("5 updated", summary["title"])
 
 
+
+class TestSkippedFilesReport(unittest.TestCase):
+    """Tests for render_skipped_files_report(), the Markdown report of skipped files."""
+
+    def test_report_lists_each_file_with_its_errors(self):
+        report = render_skipped_files_report({
+            "app_de.properties": ["Line 3: bad escape", "Missing key"],
+            "app_es.properties": ["Lint error"],
+        }).decode('utf-8')
+
+        self.assertTrue(report.startswith("## ⚠️ Translation Pipeline Warnings\n\n"))
+        self.assertTrue(report.endswith(
+            "### 📄 `app_de.properties`\n- Line 3: bad escape\n- Missing key\n\n"
+            "### 📄 `app_es.properties`\n- Lint error\n\n"
+        ))
+
+
 if __name__ == '__main__':
     unittest.main()
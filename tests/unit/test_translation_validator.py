@@ -1,13 +1,17 @@
-import unittest
 import os
 import tempfile
+import unittest
+
+from src.properties_parser import parse_properties_content, parse_properties_file
 from src.translation_validator import (
+    check_encoding_and_mojibake,
+    check_encoding_and_mojibake_content,
     check_key_coverage,
     check_placeholder_parity,
-    check_encoding_and_mojibake,
-    synchronize_keys
+    synchronize_keys,
+    synchronize_keys_and_load,
 )
-from src.properties_parser import parse_properties_file
+
 
 class TestTranslationValidator(unittest.TestCase):
     def test_check_key_coverage(self):
@@ -117,6 +121,29 @@ class TestTranslationValidator(unittest.TestCase):
         finally:
             os.remove(temp_path)
 
+    def test_mojibake_detection_on_content(self):
+        errors = check_encoding_and_mojibake_content("key.one=verfÃ¼gbar\nkey.two=\uFFFD", "de.properties")
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(all("de.properties" in e for e in errors))
+        self.assertEqual(check_encoding_and_mojibake_content("key.one=verfügbar\n"), [])
+
+    def test_parse_properties_content_matches_file_parsing(self):
+        content = "# Comment\r\nkey.one=Hello \\\r\n    World\r\nkey.two = Zwei\n"
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.properties', encoding='utf-8', newline='') as f:
+            f.write(content)
+            temp_path = f.name
+
+        try:
+            self.assertEqual(parse_properties_content(content), parse_properties_file(temp_path))
+        finally:
+            os.remove(temp_path)
+
+    def test_parsed_keys_are_interned(self):
+        _, source = parse_properties_content("generated." + "key=One\n")
+        _, target = parse_properties_content("generated." + "key=Eins\n")
+
+        self.assertIs(next(iter(source)), next(iter(target)))
+
     def test_key_synchronization(self):
         # Create temporary source and target files
         source_content = "key.one=One\nkey.two=Two\n# comment\nkey.three=Three"
@@ -155,6 +182,29 @@ class TestTranslationValidator(unittest.TestCase):
             os.remove(source_path)
             os.remove(target_path)
 
+    def test_synchronize_keys_and_load_matches_reparsed_target(self):
+        source_content = "key.one=One\nkey.two=Two with \\u00e4 {0}\nkey.three=Three"
+        target_content = "key.one=Eins\nkey.three=Drei\nkey.four=Vier"
+
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, encoding='utf-8') as f_source:
+            f_source.write(source_content)
+            source_path = f_source.name
+
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, encoding='utf-8') as f_target:
+            f_target.write(target_content)
+            target_path = f_target.name
+
+        try:
+            missing_keys, extra_keys, target_translations = synchronize_keys_and_load(target_path, source_path)
+            _, reparsed_translations = parse_properties_file(target_path)
+
+            self.assertEqual(target_translations, reparsed_translations)
+            self.assertEqual(missing_keys, {"key.two"})
+            self.assertEqual(extra_keys, {"key.four"})
+        finally:
+            os.remove(source_path)
+            os.remove(target_path)
+
     def test_key_synchronization_preserves_comment_relative_position(self):
         source_content = "key.one=One\nkey.two=Two\n# section marker\nkey.three=Three\n"
         target_content = "key.one=Uno\n# section marker\nkey.three=Tres\n"
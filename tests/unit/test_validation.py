@@ -1,10 +1,11 @@
-import unittest
 import os
 import tempfile
 import textwrap
+import unittest
 
 # To be created
-from src.translate_localization_files import lint_properties_file
+from src.translate_localization_files import _find_separator, lint_properties_file
+
 
 class TestValidationLogic(unittest.TestCase):
 
@@ -112,6 +113,72 @@ class TestValidationLogic(unittest.TestCase):
         self.assertIn("line 1", errors[0])
         self.assertIn("line 3", errors[1])
 
+    def test_linting_reports_line_numbers_for_crlf_and_form_feeds(self):
+        """Line numbers follow universal newlines only, not every Unicode line break."""
+        content = (
+            b'KEY_A=Alpha\x0cwith form feed\r\n'
+            b'KEY_B=Bravo\r\n'
+            b'KEY..C=Charlie\r\n'
+        )
+
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False, suffix='.properties') as f:
+            f.write(content)
+            temp_path = f.name
+
+        try:
+            errors = lint_properties_file(temp_path)
+        finally:
+            os.remove(temp_path)
+
+        self.assertEqual(len(errors), 1)
+        self.assertIn("line 3", errors[0])
+
+    def test_linting_checks_unicode_escapes_are_hex(self):
+        """Only \\u followed by four hex digits is a valid Unicode escape."""
+        content = 'key.valid=Gr\\u00fc\\u00DFe\nkey.invalid=Bad \\u00g1 escape\n'
+
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.properties', encoding='utf-8') as f:
+            f.write(content)
+            temp_path = f.name
+
+        try:
+            errors = lint_properties_file(temp_path)
+        finally:
+            os.remove(temp_path)
+
+        self.assertEqual(len(errors), 1)
+        self.assertIn("key.invalid", errors[0])
+
+    def test_find_separator_skips_escaped_separators(self):
+        """The first unescaped '=' or ':' splits key and value."""
+        self.assertEqual(_find_separator('key=value'), 3)
+        self.assertEqual(_find_separator('key:value=x'), 3)
+        self.assertEqual(_find_separator('a\\=b=value'), 4)
+        self.assertEqual(_find_separator('a\\:b:c'), 4)
+        self.assertEqual(_find_separator('a\\=b'), -1)
+        self.assertEqual(_find_separator('a\\=b\\:c:d'), 7)
+        self.assertEqual(_find_separator('no separator'), -1)
+
+    def test_linting_ignores_line_continuation_backslash(self):
+        """A trailing continuation backslash is not reported as an invalid escape."""
+        content = (
+            'key.continued=First part \\\n'
+            '    second part\n'
+            'key.bad=broken \\q\\\n'
+        )
+
+        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.properties', encoding='utf-8') as f:
+            f.write(content)
+            temp_path = f.name
+
+        try:
+            errors = lint_properties_file(temp_path)
+        finally:
+            os.remove(temp_path)
+
+        self.assertEqual(len(errors), 1)
+        self.assertIn("key.bad", errors[0])
+
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()